@@ -0,0 +1,45 @@
+"""
+Optionale JIT-Kompilierung mit Numba
+
+Ist numba installiert, werden die numerischen Rechenkerne (Batch-Berechnungen)
+kompiliert. Andernfalls laufen dieselben Funktionen unveraendert als reines
+Python, sodass die Anwendung ohne numba voll funktionsfaehig bleibt.
+
+Alle Rechenkerne verwenden cache=True, damit die kompilierten Fassungen auf
+der Platte abgelegt und beim naechsten Prozessstart nur noch geladen werden.
+"""
+
+try:
+    from numba import njit, prange, vectorize
+    NUMBA_VERFUEGBAR = True
+except ImportError:
+    import numpy as np
+
+    NUMBA_VERFUEGBAR = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Ersatz-Dekorator ohne numba: gibt die Funktion unveraendert zurueck"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+    def vectorize(*args, **kwargs):
+        """Ersatz-Dekorator ohne numba: elementweise Anwendung per np.vectorize"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return np.vectorize(args[0])
+
+        def decorator(func):
+            return np.vectorize(func)
+
+        return decorator
+
+
+# Englischer Alias fuer externe Skripte
+HAS_NUMBA = NUMBA_VERFUEGBAR
+
+__all__ = ["njit", "prange", "vectorize", "NUMBA_VERFUEGBAR", "HAS_NUMBA"]
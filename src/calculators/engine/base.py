@@ -7,7 +7,7 @@ Grundlegende Datenstrukturen fuer alle Berechnungen.
 
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Mapping, Optional, Any
 from enum import Enum
 import json
 
@@ -21,24 +21,45 @@ class BerechnungsTyp(Enum):
     RVG = "rvg"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RulesetInfo:
-    """Informationen zum verwendeten Regelwerk"""
+    """Informationen zum verwendeten Regelwerk (unveraenderlich, wird geteilt)"""
     olg_bezirk: str
     version: str
     gueltig_ab: date
-    parameter: Dict[str, Any]
+    parameter: Mapping[str, Any]
 
     def to_dict(self) -> Dict:
         return {
             "olg_bezirk": self.olg_bezirk,
             "version": self.version,
             "gueltig_ab": self.gueltig_ab.isoformat(),
-            "parameter": self.parameter
+            "parameter": dict(self.parameter)
         }
 
 
-@dataclass
+class LazyFormat:
+    """Verzoegerte %-Formatierung: der Text wird erst bei str() erzeugt"""
+    __slots__ = ("fmt", "args")
+
+    def __init__(self, fmt: str, *args: Any):
+        self.fmt = fmt
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.fmt % self.args
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __eq__(self, other: object) -> bool:
+        return str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+@dataclass(slots=True)
 class CalculationStep:
     """Ein einzelner Berechnungsschritt"""
     schritt_nr: int
@@ -46,7 +67,7 @@ class CalculationStep:
     formel: str
     eingabewerte: Dict[str, Any]
     ergebnis: Any
-    erlaeuterung: Optional[str] = None
+    erlaeuterung: Optional[Any] = None  # str oder LazyFormat
 
     def to_dict(self) -> Dict:
         return {
@@ -55,11 +76,11 @@ class CalculationStep:
             "formel": self.formel,
             "eingabewerte": self.eingabewerte,
             "ergebnis": self.ergebnis,
-            "erlaeuterung": self.erlaeuterung
+            "erlaeuterung": None if self.erlaeuterung is None else str(self.erlaeuterung)
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculationWarning:
     """Warnung bei einer Berechnung"""
     code: str
@@ -74,7 +95,7 @@ class CalculationWarning:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculationResult:
     """Ergebnis einer Berechnung mit vollstaendiger Dokumentation"""
     berechnungstyp: BerechnungsTyp
@@ -112,7 +133,7 @@ class CalculationResult:
         return any(w.severity == "error" for w in self.warnungen)
 
 
-@dataclass
+@dataclass(slots=True)
 class Kind:
     """Daten eines Kindes fuer Unterhaltsberechnung"""
     vorname: str
@@ -158,7 +179,7 @@ class Kind:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Einkommen:
     """Einkommensdaten fuer Unterhaltsberechnung"""
     brutto_monat: float
@@ -176,9 +197,14 @@ class Einkommen:
     einmalzahlungen_jahres_anteil: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Vermoegen:
-    """Vermoegensposition fuer Zugewinnberechnung"""
+    """
+    Vermoegensposition fuer Zugewinnberechnung
+
+    Unveraenderlich, damit der bei der Erzeugung berechnete Nettowert
+    (net = wert - verbindlichkeit) nicht veralten kann.
+    """
     bezeichnung: str
     kategorie: str  # 'immobilie', 'fahrzeug', 'konto', 'wertpapier', 'unternehmen', 'sonstig'
     wert: float
@@ -186,3 +212,7 @@ class Vermoegen:
     stichtag: date
     ist_privilegiert: bool = False  # Erbschaft/Schenkung
     verbindlichkeit: float = 0.0
+    net: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "net", self.wert - self.verbindlichkeit)
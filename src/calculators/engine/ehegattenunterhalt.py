@@ -10,6 +10,9 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Dict, List, Optional, Any
 
+import numpy as np
+
+from .._jit import njit, prange
 from .base import (
     BerechnungsTyp, CalculationResult, CalculationStep,
     CalculationWarning, RulesetInfo, Einkommen
@@ -17,7 +20,7 @@ from .base import (
 from .ruleset import RulesetManager
 
 
-@dataclass
+@dataclass(slots=True)
 class EhegattenunterhaltEingabe:
     """Eingabewerte fuer Ehegattenunterhalt-Berechnung"""
     berechtigter_einkommen: Einkommen
@@ -32,6 +35,45 @@ class EhegattenunterhaltEingabe:
     stichtag: Optional[date] = None
 
 
+@njit(parallel=True, cache=True)
+def _batch_ehegatten(
+    pf, br, ku, p_arb, b_arb, bonus,
+    bba_prozent, bba_min, bba_max, sb_erw, sb_nicht,
+    bedarf_out, unterhalt_out, zahlbetrag_out
+):
+    """Rechenkern fuer berechne_batch: ein Szenario je Index, unabhaengig voneinander"""
+    for i in prange(pf.shape[0]):
+        # Bereinigte Einkommen (berufsbedingte Aufwendungen: Pauschale mit Unter-/Obergrenze)
+        bb_p = min(max(pf[i] * bba_prozent, bba_min), bba_max)
+        bb_b = min(max(br[i] * bba_prozent, bba_min), bba_max) if br[i] > 0 else 0.0
+        bereinigt_b = br[i] - bb_b
+        nach_ku = pf[i] - bb_p - ku[i]
+
+        # Differenzmethode mit Erwerbstaetigenbonus
+        if p_arb[i] and not b_arb[i]:
+            bedarf = (nach_ku - nach_ku * bonus) / 2
+        elif b_arb[i] and not p_arb[i]:
+            bedarf = (nach_ku + bereinigt_b - bereinigt_b * bonus) / 2
+        elif p_arb[i] and b_arb[i]:
+            bonus_b = bereinigt_b * bonus
+            bedarf = (nach_ku - nach_ku * bonus + bereinigt_b - bonus_b) / 2 + bonus_b
+        else:
+            bedarf = (nach_ku + bereinigt_b) / 2
+
+        unterhalt = max(0.0, bedarf - bereinigt_b)
+
+        # Leistungsfaehigkeit
+        verfuegbar = nach_ku - (sb_erw if p_arb[i] else sb_nicht)
+        if verfuegbar < unterhalt and unterhalt > 0:
+            zahlbetrag = max(0.0, verfuegbar)
+        else:
+            zahlbetrag = unterhalt
+
+        bedarf_out[i] = bedarf
+        unterhalt_out[i] = unterhalt
+        zahlbetrag_out[i] = zahlbetrag
+
+
 class EhegattenunterhaltCalculator:
     """Rechner fuer Trennungs- und nachehelichen Unterhalt"""
 
@@ -243,6 +285,58 @@ class EhegattenunterhaltCalculator:
             warnungen=warnungen
         )
 
+    def berechne_batch(
+        self,
+        pflichtiger_netto,
+        berechtigter_netto,
+        kindesunterhalt_abzug=0.0,
+        pflichtiger_erwerbstaetig=True,
+        berechtigter_erwerbstaetig=False
+    ) -> Dict[str, np.ndarray]:
+        """
+        Berechnet viele Szenarien auf einmal (z.B. Szenario-Matrizen, Einkommensreihen).
+
+        Alle Argumente koennen Skalare oder gleich lange Arrays sein. Es werden
+        nur die Kennzahlen berechnet, ohne Zwischenschritte oder Warnungen.
+        Mit installiertem numba laeuft der Rechenkern parallel auf allen Kernen.
+
+        Returns:
+            Dict mit Arrays fuer bedarf_berechtigter, unterhaltsbetrag, zahlbetrag
+        """
+        pf, br, ku, p_arb, b_arb = np.broadcast_arrays(
+            np.asarray(pflichtiger_netto, dtype=np.float64),
+            np.asarray(berechtigter_netto, dtype=np.float64),
+            np.asarray(kindesunterhalt_abzug, dtype=np.float64),
+            np.asarray(pflichtiger_erwerbstaetig, dtype=np.bool_),
+            np.asarray(berechtigter_erwerbstaetig, dtype=np.bool_),
+        )
+        pf, br, ku, p_arb, b_arb = (
+            np.ascontiguousarray(a.ravel()) for a in (pf, br, ku, p_arb, b_arb)
+        )
+
+        bba = self.ruleset.parameter.get("berufsbedingte_aufwendungen", {})
+        n = pf.shape[0]
+        bedarf = np.empty(n, dtype=np.float64)
+        unterhalt = np.empty(n, dtype=np.float64)
+        zahlbetrag = np.empty(n, dtype=np.float64)
+
+        _batch_ehegatten(
+            pf, br, ku, p_arb, b_arb,
+            float(RulesetManager.get_erwerbstaetigenbonus(self.olg_bezirk)),
+            float(bba.get("pauschal_prozent", 0.05)),
+            float(bba.get("minimum", 50)),
+            float(bba.get("maximum", 150)),
+            float(RulesetManager.get_selbstbehalt(self.olg_bezirk, "ehegatte", True)),
+            float(RulesetManager.get_selbstbehalt(self.olg_bezirk, "ehegatte", False)),
+            bedarf, unterhalt, zahlbetrag
+        )
+
+        return {
+            "bedarf_berechtigter": np.round(bedarf, 2),
+            "unterhaltsbetrag": np.round(unterhalt, 2),
+            "zahlbetrag": np.round(zahlbetrag, 2),
+        }
+
 
 def calculate_spousal_support(
     pflichtiger_netto: float,
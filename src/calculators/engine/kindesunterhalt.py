@@ -13,12 +13,12 @@ from decimal import Decimal, ROUND_HALF_UP
 
 from .base import (
     BerechnungsTyp, CalculationResult, CalculationStep,
-    CalculationWarning, RulesetInfo, Kind, Einkommen
+    CalculationWarning, RulesetInfo, Kind, Einkommen, LazyFormat
 )
 from .ruleset import RulesetManager
 
 
-@dataclass
+@dataclass(slots=True)
 class KindesunterhaltEingabe:
     """Eingabewerte fuer Kindesunterhalt-Berechnung"""
     pflichtiger_einkommen: Einkommen
@@ -28,7 +28,7 @@ class KindesunterhaltEingabe:
     stichtag: Optional[date] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class KindesunterhaltErgebnis:
     """Ergebnis der Kindesunterhalt-Berechnung pro Kind"""
     kind_vorname: str
@@ -204,7 +204,9 @@ class KindesunterhaltCalculator:
                     "eigenes_einkommen": kind.eigenes_einkommen
                 },
                 ergebnis=zahlbetrag,
-                erlaeuterung=f"{kind.vorname} ({kind.alter} J.): Zahlbetrag {zahlbetrag} EUR"
+                erlaeuterung=LazyFormat(
+                    "%s (%d J.): Zahlbetrag %d EUR", kind.vorname, kind.alter, zahlbetrag
+                )
             ))
 
             kinder_ergebnisse.append(KindesunterhaltErgebnis(
@@ -5,9 +5,14 @@ FamilyKom Calculation Engine - Ruleset Manager
 Verwaltung der OLG-Regelwerke und Duesseldorfer Tabelle.
 """
 
+import bisect
+import functools
+import re
+import types
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+
 from .base import RulesetInfo
 
 
@@ -21,6 +26,44 @@ class DuesseldorferTabelleEintrag:
     bedarfskontrollbetrag: int
 
 
+# Gemeinsamer, unveraenderlicher Platzhalter fuer fehlende Parameter-Abschnitte
+_LEERER_ABSCHNITT: Mapping[str, Any] = types.MappingProxyType({})
+
+# Orte in Schleswig-Holstein und ein einziges Suchmuster fuer Gerichtsnamen
+_SH_ORTE = frozenset({
+    "kiel", "luebeck", "flensburg", "neumuenster", "rendsburg",
+    "eckernfoerde", "husum", "heide", "schleswig", "pinneberg",
+    "elmshorn", "itzehoe", "norderstedt", "ahrensburg"
+})
+_SH_GERICHT_RE = re.compile("|".join(map(re.escape, sorted(_SH_ORTE))), re.IGNORECASE)
+
+
+def _baue_selbstbehalt_tabelle(sb: Dict[str, int]) -> Dict[Tuple[str, bool], int]:
+    """Flacht die Selbstbehalt-Parameter zu (gegenueber, erwerbstaetig) -> Betrag ab"""
+    volljaehrig = sb.get("volljaehrig", 1750)
+    eltern = sb.get("eltern", 2650)
+    return {
+        ("minderjaehrig", True): sb.get("minderjaehrig_erwerbstaetig", 1450),
+        ("minderjaehrig", False): sb.get("minderjaehrig_nicht_erwerbstaetig", 1200),
+        ("volljaehrig", True): volljaehrig,
+        ("volljaehrig", False): volljaehrig,
+        ("ehegatte", True): sb.get("ehegatte_erwerbstaetig", 1600),
+        ("ehegatte", False): sb.get("ehegatte_nicht_erwerbstaetig", 1475),
+        ("eltern", True): eltern,
+        ("eltern", False): eltern,
+    }
+
+
+def _baue_ruleset_info(daten: Dict[str, Any]) -> RulesetInfo:
+    """Erzeugt die unveraenderliche RulesetInfo zu einem OLG-Regelwerk"""
+    return RulesetInfo(
+        olg_bezirk=daten["olg_bezirk"],
+        version=daten["version"],
+        gueltig_ab=daten["gueltig_ab"],
+        parameter=types.MappingProxyType(daten["parameter"])
+    )
+
+
 class RulesetManager:
     """Verwaltet OLG-Regelwerke und Duesseldorfer Tabelle"""
 
@@ -70,6 +113,19 @@ class RulesetManager:
         },
     }
 
+    # Einkommensgruppen als sortierte Obergrenzen fuer bisect
+    _DT_GRUPPEN = tuple(sorted(DUESSELDORFER_TABELLE_2025["einkommensgruppen"]))
+    _DT_OBERGRENZEN = tuple(
+        bis for _, (_, bis) in sorted(DUESSELDORFER_TABELLE_2025["einkommensgruppen"].items())
+    )
+
+    # Tabellenbetraege flach nach (Einkommensgruppe, Altersstufe); Quelle bleibt das Dict
+    _BETRAEGE_FLAT: Dict[Tuple[int, int], int] = {
+        (gruppe, stufe): betrag
+        for gruppe, stufen in DUESSELDORFER_TABELLE_2025["betraege"].items()
+        for stufe, betrag in stufen.items()
+    }
+
     # OLG Schleswig-Holstein Leitlinien 2025
     OLG_SCHLESWIG_2025 = {
         "olg_name": "Schleswig-Holsteinisches Oberlandesgericht",
@@ -151,6 +207,23 @@ class RulesetManager:
         # Weitere OLGs koennen hier ergaenzt werden
     }
 
+    # Selbstbehalte je OLG-Bezirk als flache Nachschlagetabelle
+    _SELBSTBEHALT_TABELLEN = {
+        bezirk: _baue_selbstbehalt_tabelle(daten["parameter"].get("selbstbehalt", {}))
+        for bezirk, daten in OLG_REGELWERKE.items()
+    }
+
+    # Zuordnung Schleswig-Holstein: PLZ-Bereiche 22000-25999
+    # OLG-Bezirk je zweistelligem PLZ-Praefix (00-99), None = nicht zugeordnet
+    _PLZ_TO_OLG: Tuple[Optional[str], ...] = tuple(
+        "Schleswig" if 22 <= i <= 25 else None for i in range(100)
+    )
+
+    # Geteilte, unveraenderliche RulesetInfo-Instanzen je OLG-Bezirk (einmalig beim Import)
+    _RULESET_INFO_CACHE: Dict[str, RulesetInfo] = {
+        bezirk: _baue_ruleset_info(daten) for bezirk, daten in OLG_REGELWERKE.items()
+    }
+
     @classmethod
     def get_duesseldorfer_tabelle(cls, stichtag: Optional[date] = None) -> Dict:
         """Gibt die Duesseldorfer Tabelle fuer einen Stichtag zurueck"""
@@ -160,17 +233,12 @@ class RulesetManager:
     @classmethod
     def get_einkommensgruppe(cls, nettoeinkommen: float, stichtag: Optional[date] = None) -> int:
         """Ermittelt die Einkommensgruppe nach Duesseldorfer Tabelle"""
-        dt = cls.get_duesseldorfer_tabelle(stichtag)
-
-        for gruppe, (von, bis) in dt["einkommensgruppen"].items():
-            if von <= nettoeinkommen <= bis:
-                return gruppe
-
-        # Ueber hoechster Gruppe
-        if nettoeinkommen > 11200:
-            return 15  # Hoechste Gruppe, darueberhinaus einzelfallabhaengig
+        idx = bisect.bisect_left(cls._DT_OBERGRENZEN, nettoeinkommen)
+        if idx < len(cls._DT_GRUPPEN):
+            return cls._DT_GRUPPEN[idx]
 
-        return 1  # Unter niedrigster Gruppe
+        # Ueber hoechster Gruppe: hoechste Gruppe, darueberhinaus einzelfallabhaengig
+        return cls._DT_GRUPPEN[-1]
 
     @classmethod
     def get_tabellenbetrag(
@@ -180,8 +248,7 @@ class RulesetManager:
         stichtag: Optional[date] = None
     ) -> int:
         """Gibt den Tabellenbetrag fuer Einkommensgruppe und Altersstufe zurueck"""
-        dt = cls.get_duesseldorfer_tabelle(stichtag)
-        return dt["betraege"].get(einkommensgruppe, {}).get(altersstufe, 0)
+        return cls._BETRAEGE_FLAT.get((einkommensgruppe, altersstufe), 0)
 
     @classmethod
     def get_kindergeld(cls, stichtag: Optional[date] = None) -> int:
@@ -192,18 +259,11 @@ class RulesetManager:
     @classmethod
     def get_ruleset(cls, olg_bezirk: str) -> RulesetInfo:
         """Gibt das Regelwerk fuer einen OLG-Bezirk zurueck"""
-        ruleset_data = cls.OLG_REGELWERKE.get(olg_bezirk)
-
-        if not ruleset_data:
+        ruleset = cls._RULESET_INFO_CACHE.get(olg_bezirk)
+        if ruleset is None:
             # Fallback auf Schleswig
-            ruleset_data = cls.OLG_SCHLESWIG_2025
-
-        return RulesetInfo(
-            olg_bezirk=ruleset_data["olg_bezirk"],
-            version=ruleset_data["version"],
-            gueltig_ab=ruleset_data["gueltig_ab"],
-            parameter=ruleset_data["parameter"]
-        )
+            ruleset = cls._RULESET_INFO_CACHE["Schleswig"]
+        return ruleset
 
     @classmethod
     def get_selbstbehalt(
@@ -213,25 +273,8 @@ class RulesetManager:
         erwerbstaetig: bool = True
     ) -> int:
         """Ermittelt den Selbstbehalt nach OLG-Leitlinien"""
-        ruleset = cls.get_ruleset(olg_bezirk)
-        sb = ruleset.parameter.get("selbstbehalt", {})
-
-        if gegenueber == "minderjaehrig":
-            if erwerbstaetig:
-                return sb.get("minderjaehrig_erwerbstaetig", 1450)
-            else:
-                return sb.get("minderjaehrig_nicht_erwerbstaetig", 1200)
-        elif gegenueber == "volljaehrig":
-            return sb.get("volljaehrig", 1750)
-        elif gegenueber == "ehegatte":
-            if erwerbstaetig:
-                return sb.get("ehegatte_erwerbstaetig", 1600)
-            else:
-                return sb.get("ehegatte_nicht_erwerbstaetig", 1475)
-        elif gegenueber == "eltern":
-            return sb.get("eltern", 2650)
-
-        return 1450  # Fallback
+        tabelle = cls._SELBSTBEHALT_TABELLEN[cls.get_ruleset(olg_bezirk).olg_bezirk]
+        return tabelle.get((gegenueber, bool(erwerbstaetig)), 1450)  # Fallback 1450
 
     @classmethod
     def get_berufsbedingte_aufwendungen(
@@ -241,29 +284,46 @@ class RulesetManager:
         tatsaechliche_kosten: Optional[float] = None
     ) -> float:
         """Berechnet die berufsbedingten Aufwendungen"""
-        ruleset = cls.get_ruleset(olg_bezirk)
-        params = ruleset.parameter.get("berufsbedingte_aufwendungen", {})
+        return cls._berufsbedingte_aufwendungen(
+            nettoeinkommen, olg_bezirk, tatsaechliche_kosten
+        )
 
-        # Pauschale
-        prozent = params.get("pauschal_prozent", 0.05)
-        minimum = params.get("minimum", 50)
-        maximum = params.get("maximum", 150)
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _berufsbedingte_aufwendungen(
+        cls,
+        nettoeinkommen: float,
+        olg_bezirk: str,
+        tatsaechliche_kosten: Optional[float]
+    ) -> float:
+        """Gecachte Berechnung der berufsbedingten Aufwendungen (exakter Schluessel)"""
+        prozent, minimum, maximum = cls._bba_params(olg_bezirk)
 
-        pauschale = nettoeinkommen * prozent
-        pauschale = max(minimum, min(maximum, pauschale))
+        # Pauschale, geklemmt auf Minimum/Maximum; tatsaechliche Kosten wenn hoeher
+        pauschale = min(max(nettoeinkommen * prozent, minimum), maximum)
+        return max(pauschale, tatsaechliche_kosten or 0.0)
 
-        # Tatsaechliche Kosten wenn hoeher und nachgewiesen
-        if tatsaechliche_kosten and tatsaechliche_kosten > pauschale:
-            return tatsaechliche_kosten
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _param(cls, olg_bezirk: str, abschnitt: str) -> Mapping[str, Any]:
+        """Gibt einen Parameter-Abschnitt des Regelwerks zurueck (leer, falls nicht vorhanden)"""
+        return cls.get_ruleset(olg_bezirk).parameter.get(abschnitt, _LEERER_ABSCHNITT)
 
-        return pauschale
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _bba_params(cls, olg_bezirk: str) -> Tuple[float, float, float]:
+        """Pauschal-Prozent, Minimum und Maximum der berufsbedingten Aufwendungen"""
+        params = cls._param(olg_bezirk, "berufsbedingte_aufwendungen")
+        return (
+            params.get("pauschal_prozent", 0.05),
+            params.get("minimum", 50),
+            params.get("maximum", 150),
+        )
 
     @classmethod
     def get_erwerbstaetigenbonus(cls, olg_bezirk: str) -> float:
         """Gibt die Erwerbstaetigenbonus-Quote zurueck"""
-        ruleset = cls.get_ruleset(olg_bezirk)
-        bonus_params = ruleset.parameter.get("erwerbstaetigenbonus", {})
-        return bonus_params.get("quote", 1/7)
+        return cls._param(olg_bezirk, "erwerbstaetigenbonus").get("quote", 1/7)
 
     @classmethod
     def bestimme_olg_bezirk(cls, plz: str = None, ort: str = None, gericht: str = None) -> str:
@@ -272,29 +332,19 @@ class RulesetManager:
         Vereinfachte Implementierung fuer Schleswig-Holstein.
         """
         # PLZ-Bereiche Schleswig-Holstein: 22000-25999
-        if plz:
-            plz_int = int(plz[:2]) if plz else 0
-            if 22 <= plz_int <= 25:
-                return "Schleswig"
+        praefix = plz[:2] if plz else ""
+        if len(praefix) == 2 and praefix.isascii() and praefix.isdigit():
+            bezirk = cls._PLZ_TO_OLG[int(praefix)]
+            if bezirk:
+                return bezirk
 
         # Orte in Schleswig-Holstein
-        sh_orte = [
-            "kiel", "luebeck", "flensburg", "neumuenster", "rendsburg",
-            "eckernfoerde", "husum", "heide", "schleswig", "pinneberg",
-            "elmshorn", "itzehoe", "norderstedt", "ahrensburg"
-        ]
-
-        if ort and ort.lower() in sh_orte:
+        if ort and ort.casefold() in _SH_ORTE:
             return "Schleswig"
 
         # Gerichte mit "Schleswig" oder SH-Staedten
-        if gericht:
-            gericht_lower = gericht.lower()
-            if "schleswig" in gericht_lower:
-                return "Schleswig"
-            for sh_ort in sh_orte:
-                if sh_ort in gericht_lower:
-                    return "Schleswig"
+        if gericht and _SH_GERICHT_RE.search(gericht):
+            return "Schleswig"
 
         # Fallback
         return "Schleswig"
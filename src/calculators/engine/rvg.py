@@ -5,13 +5,19 @@ FamilyKom Calculation Engine - RVG Gebuehren
 Berechnung der Rechtsanwaltsgebuehren nach RVG/FamGKG.
 """
 
+import bisect
+import functools
+import math
+import types
 from dataclasses import dataclass
 from datetime import date
 from typing import Dict, List, Optional, Any
 
+import numpy as np
+
+from .._jit import njit
 from .base import (
-    BerechnungsTyp, CalculationResult, CalculationStep,
-    CalculationWarning, RulesetInfo
+    BerechnungsTyp, CalculationResult, CalculationStep, RulesetInfo
 )
 
 
@@ -28,6 +34,58 @@ RVG_TABELLE = {
     470000: 3488, 500000: 3629,
 }
 
+# Einmalig vorberechnete Schwellenwerte und Gebuehren; die Tabelle ist
+# aufsteigend notiert, die Einfuegereihenfolge des Dicts genuegt daher
+_RVG_THRESHOLDS = tuple(RVG_TABELLE)
+assert all(a < b for a, b in zip(_RVG_THRESHOLDS, _RVG_THRESHOLDS[1:])), \
+    "RVG_TABELLE muss aufsteigend nach Gegenstandswert sortiert sein"
+_RVG_FEES = tuple(RVG_TABELLE[k] for k in _RVG_THRESHOLDS)
+
+
+
+# Bundeseinheitliches Regelwerk, von allen Ergebnissen geteilt
+_RVG_RULESET = RulesetInfo(
+    olg_bezirk="Bundesrecht",
+    version="RVG 2021",
+    gueltig_ab=date(2021, 1, 1),
+    parameter=types.MappingProxyType({"tabelle": "Anlage 2 zu § 13 RVG"})
+)
+
+
+
+@functools.cache
+def _rvg_tabellen_arrays():
+    """Zusammenhaengende Arrays fuer den Batch-Rechenkern, erst bei Bedarf erzeugt"""
+    return (
+        np.array(_RVG_THRESHOLDS, dtype=np.int64),
+        np.array(_RVG_FEES, dtype=np.int64),
+    )
+
+
+@njit(cache=True, nogil=True)
+def _wertgebuehr_kernel(werte, schwellen, gebuehren):
+    """Rechenkern fuer get_wertgebuehr_batch: binaere Suche je Gegenstandswert"""
+    n = werte.shape[0]
+    m = schwellen.shape[0]
+    out = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        x = werte[i]
+        ziel = math.ceil(x)
+        lo = 0
+        hi = m
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if schwellen[mid] < ziel:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < m:
+            out[i] = gebuehren[lo]
+        else:
+            # Ueber hoechstem Tabellenwert: Berechnung nach § 13 Abs. 2 RVG
+            out[i] = gebuehren[m - 1] + int((x - schwellen[m - 1]) // 50000) * 165
+    return out
+
 
 @dataclass
 class RVGEingabe:
@@ -46,15 +104,22 @@ class RVGCalculator:
     UMSATZSTEUER_SATZ = 0.19
     AUSLAGEN_PAUSCHALE = 20.0  # Nr. 7002 VV RVG
 
-    @classmethod
-    def get_wertgebuehr(cls, gegenstandswert: float) -> float:
+    @staticmethod
+    def get_wertgebuehr(gegenstandswert: float) -> float:
         """Ermittelt die Wertgebuehr nach RVG-Tabelle"""
-        # Sortierte Liste der Schwellenwerte
-        schwellen = sorted(RVG_TABELLE.keys())
+        # Auf Cent quantisiert, damit Gleitkomma-Rauschen denselben Cache-Eintrag trifft
+        return RVGCalculator._wertgebuehr_cent(round(gegenstandswert * 100))
 
-        for schwelle in schwellen:
-            if gegenstandswert <= schwelle:
-                return RVG_TABELLE[schwelle]
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _wertgebuehr_cent(cent: int) -> float:
+        """Gecachte Wertgebuehr fuer einen Gegenstandswert in Cent"""
+        gegenstandswert = cent / 100
+
+        # Schwellenwerte sind ganzzahlig: Aufrunden aendert die Stufe nicht
+        idx = bisect.bisect_left(_RVG_THRESHOLDS, int(math.ceil(gegenstandswert)))
+        if idx < len(_RVG_THRESHOLDS):
+            return _RVG_FEES[idx]
 
         # Ueber hoechstem Tabellenwert: Berechnung nach § 13 Abs. 2 RVG
         letzte_gebuehr = RVG_TABELLE[500000]
@@ -62,133 +127,172 @@ class RVGCalculator:
         zusatz = (ueberschuss // 50000) * 165
         return letzte_gebuehr + zusatz
 
+    @staticmethod
+    def get_wertgebuehr_batch(werte) -> np.ndarray:
+        """
+        Ermittelt die Wertgebuehren fuer viele Gegenstandswerte (z.B. Abrechnungslisten).
+
+        Liefert dieselben Werte wie get_wertgebuehr je Element. Mit installiertem
+        numba wird der Rechenkern kompiliert.
+        """
+        werte = np.asarray(werte, dtype=np.float64).ravel()
+        # Wie get_wertgebuehr auf Cent quantisieren
+        werte = np.ascontiguousarray(np.round(werte * 100) / 100)
+        schwellen, gebuehren = _rvg_tabellen_arrays()
+        return _wertgebuehr_kernel(werte, schwellen, gebuehren)
+
+    @classmethod
+    @functools.lru_cache(maxsize=64, typed=True)
+    def _pipeline(
+        cls,
+        faktor: float,
+        mehrere_auftraggeber: int,
+        auslagen_pauschale: bool,
+        umsatzsteuer: bool
+    ):
+        """
+        Auf eine Parameterkombination spezialisierte Berechnung.
+
+        Alles, was nicht vom Gegenstandswert abhaengt (Verzweigungen, Pauschale,
+        USt-Satz, Texte), wird einmal je Kombination vorbereitet. Die Closure
+        liefert (ergebnis_dict, schritte) fuer einen Gegenstandswert.
+        """
+        get_wertgebuehr = cls.get_wertgebuehr
+        weitere_auftraggeber = mehrere_auftraggeber - 1 if mehrere_auftraggeber > 1 else 0
+        auslagen = cls.AUSLAGEN_PAUSCHALE if auslagen_pauschale else 0
+        ust_satz = cls.UMSATZSTEUER_SATZ
+        faktor_text = f"{faktor}-fache Gebuehr"
+
+        def berechne(gegenstandswert: float):
+            # Statischer Ablauf mit genau sieben Schritten
+            schritte: List[Optional[CalculationStep]] = [None] * 7
+
+            # ===== Schritt 1: Wertgebuehr ermitteln =====
+            wertgebuehr = get_wertgebuehr(gegenstandswert)
+
+            schritte[0] = CalculationStep(
+                schritt_nr=1,
+                bezeichnung="Wertgebuehr nach RVG-Tabelle",
+                formel="Tabellenwert fuer Gegenstandswert",
+                eingabewerte={"gegenstandswert": gegenstandswert},
+                ergebnis=wertgebuehr,
+                erlaeuterung=f"Gebuehr fuer {gegenstandswert:.2f} EUR"
+            )
+
+            # ===== Schritt 2: Gebuehr mit Faktor =====
+            gebuehr = wertgebuehr * faktor
+
+            schritte[1] = CalculationStep(
+                schritt_nr=2,
+                bezeichnung="Gebuehr mit Faktor",
+                formel="Wertgebuehr x Faktor",
+                eingabewerte={
+                    "wertgebuehr": wertgebuehr,
+                    "faktor": faktor
+                },
+                ergebnis=gebuehr,
+                erlaeuterung=faktor_text
+            )
+
+            # ===== Schritt 3: Erhoehung bei mehreren Auftraggebern =====
+            if weitere_auftraggeber:
+                erhoehung = gebuehr * 0.3 * weitere_auftraggeber
+                erhoehung = min(erhoehung, gebuehr * 2)  # max 2-fache
+                gebuehr += erhoehung
+                erlaeuterung = f"Erhoehung um {erhoehung:.2f} EUR"
+            else:
+                erhoehung = 0
+                erlaeuterung = "Keine Erhoehung"
+
+            schritte[2] = CalculationStep(
+                schritt_nr=3,
+                bezeichnung="Erhoehung mehrere Auftraggeber",
+                formel="+ 0,3 pro weiterem Auftraggeber (max. 2-fach)",
+                eingabewerte={"auftraggeber": mehrere_auftraggeber},
+                ergebnis=erhoehung,
+                erlaeuterung=erlaeuterung
+            )
+
+            # ===== Schritt 4: Auslagenpauschale =====
+            schritte[3] = CalculationStep(
+                schritt_nr=4,
+                bezeichnung="Auslagenpauschale (Nr. 7002 VV RVG)",
+                formel="Pauschale 20,00 EUR",
+                eingabewerte={"pauschale_aktiv": auslagen_pauschale},
+                ergebnis=auslagen,
+                erlaeuterung="Post-/Telekommunikationspauschale"
+            )
+
+            # ===== Schritt 5: Zwischensumme =====
+            zwischensumme = gebuehr + auslagen
+
+            schritte[4] = CalculationStep(
+                schritt_nr=5,
+                bezeichnung="Zwischensumme netto",
+                formel="Gebuehr + Auslagen",
+                eingabewerte={
+                    "gebuehr": gebuehr,
+                    "auslagen": auslagen
+                },
+                ergebnis=zwischensumme,
+                erlaeuterung=None
+            )
+
+            # ===== Schritt 6: Umsatzsteuer =====
+            if umsatzsteuer:
+                ust = zwischensumme * ust_satz
+            else:
+                ust = 0
+
+            schritte[5] = CalculationStep(
+                schritt_nr=6,
+                bezeichnung="Umsatzsteuer (19%)",
+                formel="Zwischensumme x 0,19",
+                eingabewerte={"ust_pflichtig": umsatzsteuer},
+                ergebnis=ust,
+                erlaeuterung=None
+            )
+
+            # ===== Schritt 7: Gesamtbetrag =====
+            gesamt = zwischensumme + ust
+
+            schritte[6] = CalculationStep(
+                schritt_nr=7,
+                bezeichnung="Gesamtbetrag brutto",
+                formel="Zwischensumme + Umsatzsteuer",
+                eingabewerte={
+                    "zwischensumme": zwischensumme,
+                    "umsatzsteuer": ust
+                },
+                ergebnis=round(gesamt, 2),
+                erlaeuterung=None
+            )
+
+            # Die Kette bleibt ungerundet; auf Cent erst bei der Ausgabe
+            ergebnis_dict = {
+                "gegenstandswert": gegenstandswert,
+                "wertgebuehr": wertgebuehr,
+                "faktor": faktor,
+                "gebuehr_netto": round(gebuehr, 2),
+                "auslagen": auslagen,
+                "zwischensumme": round(zwischensumme, 2),
+                "umsatzsteuer": round(ust, 2),
+                "gesamt_brutto": round(gesamt, 2)
+            }
+
+            return ergebnis_dict, schritte
+
+        return berechne
+
     def berechne(self, eingabe: RVGEingabe) -> CalculationResult:
         """Fuehrt die RVG-Gebuehrenberechnung durch"""
-        schritte: List[CalculationStep] = []
-        warnungen: List[CalculationWarning] = []
-        schritt_nr = 0
-
-        # ===== Schritt 1: Wertgebuehr ermitteln =====
-        schritt_nr += 1
-        wertgebuehr = self.get_wertgebuehr(eingabe.gegenstandswert)
-
-        schritte.append(CalculationStep(
-            schritt_nr=schritt_nr,
-            bezeichnung="Wertgebuehr nach RVG-Tabelle",
-            formel="Tabellenwert fuer Gegenstandswert",
-            eingabewerte={"gegenstandswert": eingabe.gegenstandswert},
-            ergebnis=wertgebuehr,
-            erlaeuterung=f"Gebuehr fuer {eingabe.gegenstandswert:.2f} EUR"
-        ))
-
-        # ===== Schritt 2: Gebuehr mit Faktor =====
-        schritt_nr += 1
-        gebuehr = wertgebuehr * eingabe.faktor
-
-        schritte.append(CalculationStep(
-            schritt_nr=schritt_nr,
-            bezeichnung="Gebuehr mit Faktor",
-            formel="Wertgebuehr x Faktor",
-            eingabewerte={
-                "wertgebuehr": wertgebuehr,
-                "faktor": eingabe.faktor
-            },
-            ergebnis=round(gebuehr, 2),
-            erlaeuterung=f"{eingabe.faktor}-fache Gebuehr"
-        ))
-
-        # ===== Schritt 3: Erhoehung bei mehreren Auftraggebern =====
-        schritt_nr += 1
-        if eingabe.mehrere_auftraggeber > 1:
-            erhoehung = gebuehr * 0.3 * (eingabe.mehrere_auftraggeber - 1)
-            erhoehung = min(erhoehung, gebuehr * 2)  # max 2-fache
-            gebuehr += erhoehung
-            erlaeuterung = f"Erhoehung um {erhoehung:.2f} EUR"
-        else:
-            erhoehung = 0
-            erlaeuterung = "Keine Erhoehung"
-
-        schritte.append(CalculationStep(
-            schritt_nr=schritt_nr,
-            bezeichnung="Erhoehung mehrere Auftraggeber",
-            formel="+ 0,3 pro weiterem Auftraggeber (max. 2-fach)",
-            eingabewerte={"auftraggeber": eingabe.mehrere_auftraggeber},
-            ergebnis=round(erhoehung, 2),
-            erlaeuterung=erlaeuterung
-        ))
-
-        # ===== Schritt 4: Auslagenpauschale =====
-        schritt_nr += 1
-        auslagen = self.AUSLAGEN_PAUSCHALE if eingabe.auslagen_pauschale else 0
-
-        schritte.append(CalculationStep(
-            schritt_nr=schritt_nr,
-            bezeichnung="Auslagenpauschale (Nr. 7002 VV RVG)",
-            formel="Pauschale 20,00 EUR",
-            eingabewerte={"pauschale_aktiv": eingabe.auslagen_pauschale},
-            ergebnis=auslagen,
-            erlaeuterung="Post-/Telekommunikationspauschale"
-        ))
-
-        # ===== Schritt 5: Zwischensumme =====
-        schritt_nr += 1
-        zwischensumme = gebuehr + auslagen
-
-        schritte.append(CalculationStep(
-            schritt_nr=schritt_nr,
-            bezeichnung="Zwischensumme netto",
-            formel="Gebuehr + Auslagen",
-            eingabewerte={
-                "gebuehr": gebuehr,
-                "auslagen": auslagen
-            },
-            ergebnis=round(zwischensumme, 2),
-            erlaeuterung=None
-        ))
-
-        # ===== Schritt 6: Umsatzsteuer =====
-        schritt_nr += 1
-        if eingabe.umsatzsteuer:
-            ust = zwischensumme * self.UMSATZSTEUER_SATZ
-        else:
-            ust = 0
-
-        schritte.append(CalculationStep(
-            schritt_nr=schritt_nr,
-            bezeichnung="Umsatzsteuer (19%)",
-            formel="Zwischensumme x 0,19",
-            eingabewerte={"ust_pflichtig": eingabe.umsatzsteuer},
-            ergebnis=round(ust, 2),
-            erlaeuterung=None
-        ))
-
-        # ===== Schritt 7: Gesamtbetrag =====
-        schritt_nr += 1
-        gesamt = zwischensumme + ust
-
-        schritte.append(CalculationStep(
-            schritt_nr=schritt_nr,
-            bezeichnung="Gesamtbetrag brutto",
-            formel="Zwischensumme + Umsatzsteuer",
-            eingabewerte={
-                "zwischensumme": zwischensumme,
-                "umsatzsteuer": ust
-            },
-            ergebnis=round(gesamt, 2),
-            erlaeuterung=None
-        ))
-
-        # ===== Ergebnis =====
-        ergebnis_dict = {
-            "gegenstandswert": eingabe.gegenstandswert,
-            "wertgebuehr": wertgebuehr,
-            "faktor": eingabe.faktor,
-            "gebuehr_netto": round(gebuehr, 2),
-            "auslagen": auslagen,
-            "zwischensumme": round(zwischensumme, 2),
-            "umsatzsteuer": round(ust, 2),
-            "gesamt_brutto": round(gesamt, 2)
-        }
+        pipeline = self._pipeline(
+            eingabe.faktor,
+            eingabe.mehrere_auftraggeber,
+            eingabe.auslagen_pauschale,
+            eingabe.umsatzsteuer
+        )
+        ergebnis_dict, schritte = pipeline(eingabe.gegenstandswert)
 
         eingabe_dict = {
             "gegenstandswert": eingabe.gegenstandswert,
@@ -199,21 +303,14 @@ class RVGCalculator:
             "umsatzsteuer": eingabe.umsatzsteuer
         }
 
-        ruleset = RulesetInfo(
-            olg_bezirk="Bundesrecht",
-            version="RVG 2021",
-            gueltig_ab=date(2021, 1, 1),
-            parameter={"tabelle": "Anlage 2 zu § 13 RVG"}
-        )
-
         return CalculationResult(
             berechnungstyp=BerechnungsTyp.RVG,
             eingabewerte=eingabe_dict,
             ergebnis=ergebnis_dict,
             schritte=schritte,
-            ruleset=ruleset,
+            ruleset=_RVG_RULESET,
             duesseldorfer_tabelle_stand=date(2025, 1, 1),
-            warnungen=warnungen
+            warnungen=[]
         )
 
 
@@ -6,9 +6,11 @@ Berechnung des Zugewinnausgleichs nach §§ 1373-1378 BGB
 mit vollstaendiger Dokumentation.
 """
 
+import functools
+import sys
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from .base import (
     BerechnungsTyp, CalculationResult, CalculationStep,
@@ -17,7 +19,56 @@ from .base import (
 from .ruleset import RulesetManager
 
 
-@dataclass
+# VPI-Werte (Verbraucherpreisindex) - Auszug
+VPI_WERTE = {
+    2020: 105.8,
+    2021: 109.1,
+    2022: 116.6,
+    2023: 123.8,
+    2024: 127.5,
+    2025: 130.2,
+    2026: 133.0,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _vpi_fuer(jahr: int) -> float:
+    """Gecachter VPI je Jahr; nicht hinterlegte Jahre erhalten 130.0"""
+    return VPI_WERTE.get(jahr, 130.0)
+
+
+def _r(betrag: float) -> float:
+    """Rundung auf Cent fuer alle ausgegebenen Betraege"""
+    return round(betrag, 2)
+
+
+def _netto_und_positionen(
+    vermoegen: List[Vermoegen],
+    mit_positionen: bool = True
+) -> Tuple[float, Optional[List[Dict[str, Any]]]]:
+    """
+    Summe Vermoegen - Verbindlichkeiten und Positionsliste in einem Durchlauf
+
+    Bezeichnungen stammen meist aus einem kleinen Vokabular ("Haus",
+    "Sparbuch", ...) und werden interniert, damit die Positionslisten
+    dieselben String-Objekte teilen.
+    """
+    netto = 0
+    if not mit_positionen:
+        for v in vermoegen:
+            netto += v.net
+        return netto, None
+
+    positionen = []
+    for v in vermoegen:
+        netto += v.net
+        positionen.append(
+            {"bezeichnung": sys.intern(v.bezeichnung), "wert": v.wert, "verbindlichkeit": v.verbindlichkeit}
+        )
+    return netto, positionen
+
+
+@dataclass(slots=True)
 class ZugewinnEingabe:
     """Eingabewerte fuer Zugewinn-Berechnung"""
     eheschliessung: date
@@ -39,23 +90,14 @@ class ZugewinnEingabe:
 class ZugewinnCalculator:
     """Rechner fuer Zugewinnausgleich"""
 
-    # VPI-Werte (Verbraucherpreisindex) - Auszug
-    VPI_WERTE = {
-        2020: 105.8,
-        2021: 109.1,
-        2022: 116.6,
-        2023: 123.8,
-        2024: 127.5,
-        2025: 130.2,
-        2026: 133.0,
-    }
+    VPI_WERTE = VPI_WERTE
 
     def __init__(self):
         pass
 
     def get_vpi(self, jahr: int) -> float:
         """Gibt den VPI fuer ein Jahr zurueck"""
-        return self.VPI_WERTE.get(jahr, 130.0)
+        return _vpi_fuer(jahr)
 
     def indexiere_anfangsvermoegen(
         self,
@@ -75,7 +117,7 @@ class ZugewinnCalculator:
         faktor = vpi_bis / vpi_von
         return wert * faktor
 
-    def berechne(self, eingabe: ZugewinnEingabe) -> CalculationResult:
+    def berechne(self, eingabe: ZugewinnEingabe, audit: bool = True) -> CalculationResult:
         """
         Fuehrt die vollstaendige Zugewinn-Berechnung durch.
 
@@ -84,139 +126,125 @@ class ZugewinnCalculator:
         2. Endvermoegen beider Ehegatten
         3. Zugewinn je Ehegatte
         4. Ausgleichsanspruch (Haelfte der Differenz)
+
+        Mit audit=False werden keine Berechnungsschritte erzeugt (schritte
+        bleibt leer), z.B. fuer Simulationen mit vielen Durchlaeufen.
         """
         schritte: List[CalculationStep] = []
-        warnungen: List[CalculationWarning] = []
         schritt_nr = 0
 
         # VPI-Werte
         vpi_anfang = eingabe.vpi_eheschliessung or self.get_vpi(eingabe.eheschliessung.year)
         vpi_ende = eingabe.vpi_stichtag or self.get_vpi(eingabe.stichtag_endvermoegen.year)
+        # Indexierungsfaktor einmal je Berechnung (beide VPI sind hier > 0 aufgeloest)
+        faktor = vpi_ende / vpi_anfang
 
         # ===== Schritt 1: Anfangsvermoegen Mandant (indexiert) =====
         schritt_nr += 1
 
-        av_mandant_roh = sum(v.wert - v.verbindlichkeit for v in eingabe.anfangsvermoegen_mandant)
-        av_mandant_indexiert = self.indexiere_anfangsvermoegen(
-            av_mandant_roh,
-            eingabe.eheschliessung,
-            eingabe.stichtag_endvermoegen,
-            vpi_anfang,
-            vpi_ende
-        )
+        av_mandant_roh, av_mandant_positionen = _netto_und_positionen(eingabe.anfangsvermoegen_mandant, audit)
         # Negatives Anfangsvermoegen wird auf 0 gesetzt
-        av_mandant = max(0, av_mandant_indexiert)
-
-        schritte.append(CalculationStep(
-            schritt_nr=schritt_nr,
-            bezeichnung="Anfangsvermoegen Mandant (indexiert)",
-            formel="Summe Vermoegen - Verbindlichkeiten, indexiert mit VPI",
-            eingabewerte={
-                "positionen": [
-                    {"bezeichnung": v.bezeichnung, "wert": v.wert, "verbindlichkeit": v.verbindlichkeit}
-                    for v in eingabe.anfangsvermoegen_mandant
-                ],
-                "summe_roh": av_mandant_roh,
-                "vpi_anfang": vpi_anfang,
-                "vpi_ende": vpi_ende
-            },
-            ergebnis=round(av_mandant, 2),
-            erlaeuterung=f"Indexierungsfaktor: {vpi_ende/vpi_anfang:.4f}"
-        ))
+        av_mandant = max(0, av_mandant_roh * faktor)
+        av_mandant_r = _r(av_mandant)
+
+        if audit:
+            schritte.append(CalculationStep(
+                schritt_nr=schritt_nr,
+                bezeichnung="Anfangsvermoegen Mandant (indexiert)",
+                formel="Summe Vermoegen - Verbindlichkeiten, indexiert mit VPI",
+                eingabewerte={
+                    "positionen": av_mandant_positionen,
+                    "summe_roh": av_mandant_roh,
+                    "vpi_anfang": vpi_anfang,
+                    "vpi_ende": vpi_ende
+                },
+                ergebnis=av_mandant_r,
+                erlaeuterung=f"Indexierungsfaktor: {faktor:.4f}"
+            ))
 
         # ===== Schritt 2: Anfangsvermoegen Gegner (indexiert) =====
         schritt_nr += 1
 
-        av_gegner_roh = sum(v.wert - v.verbindlichkeit for v in eingabe.anfangsvermoegen_gegner)
-        av_gegner_indexiert = self.indexiere_anfangsvermoegen(
-            av_gegner_roh,
-            eingabe.eheschliessung,
-            eingabe.stichtag_endvermoegen,
-            vpi_anfang,
-            vpi_ende
-        )
-        av_gegner = max(0, av_gegner_indexiert)
-
-        schritte.append(CalculationStep(
-            schritt_nr=schritt_nr,
-            bezeichnung="Anfangsvermoegen Gegner (indexiert)",
-            formel="Summe Vermoegen - Verbindlichkeiten, indexiert mit VPI",
-            eingabewerte={
-                "positionen": [
-                    {"bezeichnung": v.bezeichnung, "wert": v.wert, "verbindlichkeit": v.verbindlichkeit}
-                    for v in eingabe.anfangsvermoegen_gegner
-                ],
-                "summe_roh": av_gegner_roh
-            },
-            ergebnis=round(av_gegner, 2),
-            erlaeuterung="Negatives Anfangsvermoegen wird auf 0 gesetzt"
-        ))
+        av_gegner_roh, av_gegner_positionen = _netto_und_positionen(eingabe.anfangsvermoegen_gegner, audit)
+        av_gegner = max(0, av_gegner_roh * faktor)
+        av_gegner_r = _r(av_gegner)
+
+        if audit:
+            schritte.append(CalculationStep(
+                schritt_nr=schritt_nr,
+                bezeichnung="Anfangsvermoegen Gegner (indexiert)",
+                formel="Summe Vermoegen - Verbindlichkeiten, indexiert mit VPI",
+                eingabewerte={
+                    "positionen": av_gegner_positionen,
+                    "summe_roh": av_gegner_roh
+                },
+                ergebnis=av_gegner_r,
+                erlaeuterung="Negatives Anfangsvermoegen wird auf 0 gesetzt"
+            ))
 
         # ===== Schritt 3: Endvermoegen Mandant =====
         schritt_nr += 1
 
-        ev_mandant = sum(v.wert - v.verbindlichkeit for v in eingabe.endvermoegen_mandant)
-
-        schritte.append(CalculationStep(
-            schritt_nr=schritt_nr,
-            bezeichnung="Endvermoegen Mandant",
-            formel="Summe Vermoegen - Verbindlichkeiten zum Stichtag",
-            eingabewerte={
-                "positionen": [
-                    {"bezeichnung": v.bezeichnung, "wert": v.wert, "verbindlichkeit": v.verbindlichkeit}
-                    for v in eingabe.endvermoegen_mandant
-                ],
-                "stichtag": eingabe.stichtag_endvermoegen.isoformat()
-            },
-            ergebnis=round(ev_mandant, 2),
-            erlaeuterung=f"Stichtag: {eingabe.stichtag_endvermoegen.strftime('%d.%m.%Y')}"
-        ))
+        ev_mandant, ev_mandant_positionen = _netto_und_positionen(eingabe.endvermoegen_mandant, audit)
+        ev_mandant_r = _r(ev_mandant)
+
+        if audit:
+            schritte.append(CalculationStep(
+                schritt_nr=schritt_nr,
+                bezeichnung="Endvermoegen Mandant",
+                formel="Summe Vermoegen - Verbindlichkeiten zum Stichtag",
+                eingabewerte={
+                    "positionen": ev_mandant_positionen,
+                    "stichtag": eingabe.stichtag_endvermoegen.isoformat()
+                },
+                ergebnis=ev_mandant_r,
+                erlaeuterung=f"Stichtag: {eingabe.stichtag_endvermoegen.strftime('%d.%m.%Y')}"
+            ))
 
         # ===== Schritt 4: Endvermoegen Gegner =====
         schritt_nr += 1
 
-        ev_gegner = sum(v.wert - v.verbindlichkeit for v in eingabe.endvermoegen_gegner)
-
-        schritte.append(CalculationStep(
-            schritt_nr=schritt_nr,
-            bezeichnung="Endvermoegen Gegner",
-            formel="Summe Vermoegen - Verbindlichkeiten zum Stichtag",
-            eingabewerte={
-                "positionen": [
-                    {"bezeichnung": v.bezeichnung, "wert": v.wert, "verbindlichkeit": v.verbindlichkeit}
-                    for v in eingabe.endvermoegen_gegner
-                ]
-            },
-            ergebnis=round(ev_gegner, 2),
-            erlaeuterung=None
-        ))
+        ev_gegner, ev_gegner_positionen = _netto_und_positionen(eingabe.endvermoegen_gegner, audit)
+        ev_gegner_r = _r(ev_gegner)
+
+        if audit:
+            schritte.append(CalculationStep(
+                schritt_nr=schritt_nr,
+                bezeichnung="Endvermoegen Gegner",
+                formel="Summe Vermoegen - Verbindlichkeiten zum Stichtag",
+                eingabewerte={
+                    "positionen": ev_gegner_positionen
+                },
+                ergebnis=ev_gegner_r,
+                erlaeuterung=None
+            ))
 
         # ===== Schritt 5: Zugewinn berechnen =====
         schritt_nr += 1
 
-        zugewinn_mandant = ev_mandant - av_mandant
-        zugewinn_gegner = ev_gegner - av_gegner
-
         # Negativer Zugewinn = 0
-        zugewinn_mandant = max(0, zugewinn_mandant)
-        zugewinn_gegner = max(0, zugewinn_gegner)
-
-        schritte.append(CalculationStep(
-            schritt_nr=schritt_nr,
-            bezeichnung="Zugewinn beider Ehegatten",
-            formel="Endvermoegen - Anfangsvermoegen (mind. 0)",
-            eingabewerte={
-                "ev_mandant": ev_mandant,
-                "av_mandant": av_mandant,
-                "ev_gegner": ev_gegner,
-                "av_gegner": av_gegner
-            },
-            ergebnis={
-                "zugewinn_mandant": round(zugewinn_mandant, 2),
-                "zugewinn_gegner": round(zugewinn_gegner, 2)
-            },
-            erlaeuterung="Negativer Zugewinn wird auf 0 gesetzt (§ 1373 BGB)"
-        ))
+        zugewinn_mandant = max(0, ev_mandant - av_mandant)
+        zugewinn_gegner = max(0, ev_gegner - av_gegner)
+        zugewinn_mandant_r = _r(zugewinn_mandant)
+        zugewinn_gegner_r = _r(zugewinn_gegner)
+
+        if audit:
+            schritte.append(CalculationStep(
+                schritt_nr=schritt_nr,
+                bezeichnung="Zugewinn beider Ehegatten",
+                formel="Endvermoegen - Anfangsvermoegen (mind. 0)",
+                eingabewerte={
+                    "ev_mandant": ev_mandant,
+                    "av_mandant": av_mandant,
+                    "ev_gegner": ev_gegner,
+                    "av_gegner": av_gegner
+                },
+                ergebnis={
+                    "zugewinn_mandant": zugewinn_mandant_r,
+                    "zugewinn_gegner": zugewinn_gegner_r
+                },
+                erlaeuterung="Negativer Zugewinn wird auf 0 gesetzt (§ 1373 BGB)"
+            ))
 
         # ===== Schritt 6: Ausgleichsanspruch =====
         schritt_nr += 1
@@ -235,45 +263,48 @@ class ZugewinnCalculator:
         else:
             berechtigter = None
             verpflichteter = None
-
-        schritte.append(CalculationStep(
-            schritt_nr=schritt_nr,
-            bezeichnung="Ausgleichsanspruch",
-            formel="(Zugewinn B - Zugewinn A) / 2",
-            eingabewerte={
-                "zugewinn_mandant": zugewinn_mandant,
-                "zugewinn_gegner": zugewinn_gegner
-            },
-            ergebnis={
-                "differenz": round(differenz, 2),
-                "ausgleichsbetrag": round(ausgleich, 2),
-                "berechtigter": berechtigter,
-                "verpflichteter": verpflichteter
-            },
-            erlaeuterung=f"Ausgleichsforderung: {ausgleich:.2f} EUR an {berechtigter}" if berechtigter else "Kein Ausgleich"
-        ))
-
-        # Warnungen
-        if ev_mandant < 0 or ev_gegner < 0:
-            warnungen.append(CalculationWarning(
-                code="NEGATIVES_ENDVERMOEGEN",
-                message="Das Endvermoegen eines Ehegatten ist negativ. Pruefung auf Illoyalitaet empfohlen.",
-                severity="warning"
+        differenz_r = _r(differenz)
+        ausgleich_r = _r(ausgleich)
+
+        if audit:
+            schritte.append(CalculationStep(
+                schritt_nr=schritt_nr,
+                bezeichnung="Ausgleichsanspruch",
+                formel="(Zugewinn B - Zugewinn A) / 2",
+                eingabewerte={
+                    "zugewinn_mandant": zugewinn_mandant,
+                    "zugewinn_gegner": zugewinn_gegner
+                },
+                ergebnis={
+                    "differenz": differenz_r,
+                    "ausgleichsbetrag": ausgleich_r,
+                    "berechtigter": berechtigter,
+                    "verpflichteter": verpflichteter
+                },
+                erlaeuterung=f"Ausgleichsforderung: {ausgleich:.2f} EUR an {berechtigter}" if berechtigter else "Kein Ausgleich"
             ))
 
+        # Warnungen (nur bei negativem Endvermoegen, sonst leere Liste)
+        negatives_endvermoegen = ev_mandant < 0 or ev_gegner < 0
+        warnungen: List[CalculationWarning] = [CalculationWarning(
+            code="NEGATIVES_ENDVERMOEGEN",
+            message="Das Endvermoegen eines Ehegatten ist negativ. Pruefung auf Illoyalitaet empfohlen.",
+            severity="warning"
+        )] if negatives_endvermoegen else []
+
         # ===== Ergebnis zusammenstellen =====
         ergebnis_dict = {
-            "anfangsvermoegen_mandant": round(av_mandant, 2),
-            "anfangsvermoegen_gegner": round(av_gegner, 2),
-            "endvermoegen_mandant": round(ev_mandant, 2),
-            "endvermoegen_gegner": round(ev_gegner, 2),
-            "zugewinn_mandant": round(zugewinn_mandant, 2),
-            "zugewinn_gegner": round(zugewinn_gegner, 2),
-            "differenz": round(differenz, 2),
-            "ausgleichsbetrag": round(ausgleich, 2),
+            "anfangsvermoegen_mandant": av_mandant_r,
+            "anfangsvermoegen_gegner": av_gegner_r,
+            "endvermoegen_mandant": ev_mandant_r,
+            "endvermoegen_gegner": ev_gegner_r,
+            "zugewinn_mandant": zugewinn_mandant_r,
+            "zugewinn_gegner": zugewinn_gegner_r,
+            "differenz": differenz_r,
+            "ausgleichsbetrag": ausgleich_r,
             "berechtigter": berechtigter,
             "verpflichteter": verpflichteter,
-            "vpi_faktor": round(vpi_ende / vpi_anfang, 4)
+            "vpi_faktor": round(faktor, 4)
         }
 
         eingabe_dict = {
@@ -308,7 +339,8 @@ def calculate_gain_equalization(
     av_mandant: float,
     ev_mandant: float,
     av_gegner: float,
-    ev_gegner: float
+    ev_gegner: float,
+    audit: bool = True
 ) -> CalculationResult:
     """
     Vereinfachte Funktion zur Zugewinn-Berechnung.
@@ -355,4 +387,4 @@ def calculate_gain_equalization(
     )
 
     calculator = ZugewinnCalculator()
-    return calculator.berechne(eingabe)
+    return calculator.berechne(eingabe, audit=audit)
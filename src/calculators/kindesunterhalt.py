@@ -7,9 +7,13 @@ Implementiert die Berechnungslogik gemäß:
 - § 1612a BGB (Mindestunterhalt)
 """
 
+import bisect
+import io
 from dataclasses import dataclass, field
 from datetime import date
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+
+import numpy as np
 
 from config.constants import (
     DUESSELDORFER_TABELLE_2025,
@@ -22,8 +26,148 @@ from config.constants import (
     OLG_SCHLESWIG_LEITLINIEN_2025,
 )
 
+from ._jit import njit, prange
+
+# Textbausteine für formatiere_ergebnis
+_TRENNER_DOPPELT = "=" * 60
+_TRENNER_EINFACH = "-" * 60
+
+_KOPF_VORLAGE = (
+    _TRENNER_DOPPELT + "\n"
+    "KINDESUNTERHALT-BERECHNUNG\n"
+    + _TRENNER_DOPPELT + "\n"
+    "\n"
+    "Bereinigtes Nettoeinkommen: {bereinigtes_einkommen:,.2f} €\n"
+    "Einkommensgruppe: {einkommensgruppe}\n"
+    "Anzahl Unterhaltsberechtigte: {anzahl_unterhaltsberechtigte}\n"
+    "Gruppenanpassung: {gruppenanpassung:+d}\n"
+    "\n"
+    + _TRENNER_EINFACH + "\n"
+    "UNTERHALT JE KIND:\n"
+    + _TRENNER_EINFACH
+)
+
+_KIND_VORLAGE = (
+    "\n"
+    "\n  {kind_name} ({alter} Jahre, Altersstufe {altersstufe_anzeige}):"
+    "\n    Einkommensgruppe (angepasst): {angepasste_gruppe}"
+    "\n    Tabellenbetrag:    {tabellenbetrag:>8,.2f} €"
+    "\n    Kindergeldabzug:   {kindergeldabzug:>8,.2f} €"
+    "\n    Zahlbetrag:        {zahlbetrag:>8,.2f} €"
+)
+
+_FUSS_VORLAGE = (
+    "\n"
+    "\n" + _TRENNER_EINFACH
+    + "\nGESAMTUNTERHALT:         {gesamtunterhalt:>8,.2f} €"
+    "\nVerbleibendes Einkommen: {verbleibendes_einkommen:>8,.2f} €"
+    "\nSelbstbehalt:            {selbstbehalt:>8,.2f} €"
+    "\n" + _TRENNER_EINFACH
+)
+
+_MANGELFALL_HINWEIS = (
+    "\n"
+    "\n⚠ MANGELFALL: Der Selbstbehalt kann nicht gewahrt werden."
+    "\n  Die Zahlbeträge wurden entsprechend angepasst."
+)
+
+
+def _altersstufe(alter: int) -> int:
+    """Bestimmt die Altersstufe nach Düsseldorfer Tabelle aus dem Alter"""
+    if alter <= 5:
+        return 0
+    elif alter <= 11:
+        return 1
+    elif alter <= 17:
+        return 2
+    else:
+        return 3
+
+
+@njit(cache=True)
+def _mangelfall_kernel(bedarfe, verteilungsmasse):
+    """Verteilt die Verteilungsmasse im Verhältnis der Bedarfe (ungerundet)"""
+    gesamtbedarf = 0.0
+    for i in range(bedarfe.shape[0]):
+        gesamtbedarf += bedarfe[i]
+
+    anteile = np.zeros(bedarfe.shape[0])
+    if gesamtbedarf > 0:
+        for i in range(bedarfe.shape[0]):
+            anteile[i] = verteilungsmasse * (bedarfe[i] / gesamtbedarf)
+    return anteile
+
+
+@njit(cache=True)
+def _tabellenbetrag_kernel(netto, anzahl_berechtigte, altersstufe, obergrenzen, gruppen, tabelle):
+    """Einkommensgruppe, Gruppenanpassung und Tabellenbetrag in einem Schritt"""
+    # Binäre Suche nach der ersten nicht überschrittenen Obergrenze
+    lo = 0
+    hi = obergrenzen.shape[0]
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if obergrenzen[mid] < netto:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo == obergrenzen.shape[0]:
+        lo -= 1
+    gruppe = gruppen[lo]
+
+    # Gruppenanpassung nach Anzahl der Unterhaltsberechtigten
+    # Verzweigung wie in passe_gruppe_an, auch für Anzahlen unter 1
+    if anzahl_berechtigte == 1:
+        gruppe += 1
+    elif anzahl_berechtigte == 2:
+        pass
+    else:
+        gruppe -= anzahl_berechtigte - 2
+    gruppe = max(1, min(gruppe, 15))
+
+    if gruppe < tabelle.shape[0] and 0 <= altersstufe < tabelle.shape[1]:
+        return tabelle[gruppe, altersstufe]
+    return 0.0
+
+
+@njit(parallel=True, cache=True)
+def _tabellenbetraege_batch(nettos, anzahl_berechtigte, altersstufen, obergrenzen, gruppen, tabelle, out):
+    """Rechenkern für hole_tabellenbetraege_batch: ein Fall je Index"""
+    for i in prange(nettos.shape[0]):
+        out[i] = _tabellenbetrag_kernel(
+            nettos[i], anzahl_berechtigte[i], altersstufen[i], obergrenzen, gruppen, tabelle
+        )
+
+
+@njit(cache=True)
+def _je_kind_kernel(angepasste_gruppe, altersstufen, minderjaehrig, eigenes_einkommen,
+                    tabelle, kindergeld_voll, kindergeld_halb, freibetrag):
+    """Tabellenbetrag, Kindergeldabzug und Zahlbetrag für alle Kinder eines Falls"""
+    n = altersstufen.shape[0]
+    tabellenbetraege = np.zeros(n)
+    kindergeldabzuege = np.empty(n)
+    zahlbetraege = np.empty(n)
+    gueltige_gruppe = 0 <= angepasste_gruppe < tabelle.shape[0]
+
+    for i in range(n):
+        stufe = altersstufen[i]
+        if gueltige_gruppe and 0 <= stufe < tabelle.shape[1]:
+            tabellenbetraege[i] = tabelle[angepasste_gruppe, stufe]
+
+        if minderjaehrig[i]:
+            kindergeldabzuege[i] = kindergeld_halb
+            zahlbetraege[i] = tabellenbetraege[i] - kindergeld_halb
+        else:
+            kindergeldabzuege[i] = kindergeld_voll
+            zahlbetrag = tabellenbetraege[i] - kindergeld_voll
+            # Eigenes Einkommen volljähriger Kinder abzüglich Freibetrag anrechnen
+            if eigenes_einkommen[i] > 0:
+                zahlbetrag = max(0.0, zahlbetrag - max(0.0, eigenes_einkommen[i] - freibetrag))
+            zahlbetraege[i] = zahlbetrag
+
+    return tabellenbetraege, kindergeldabzuege, zahlbetraege
+
 
-@dataclass
+@dataclass(slots=True)
 class Kind:
     """Datenklasse für ein unterhaltsberechtigtes Kind"""
     name: str
@@ -32,27 +176,22 @@ class Kind:
     eigenes_einkommen: float = 0.0
     privilegiert: bool = True  # § 1603 Abs. 2 BGB
 
+    def alter_at(self, stichtag: date) -> int:
+        """Berechnet das Alter des Kindes zu einem Stichtag"""
+        alter = stichtag.year - self.geburtsdatum.year
+        if (stichtag.month, stichtag.day) < (self.geburtsdatum.month, self.geburtsdatum.day):
+            alter -= 1
+        return alter
+
     @property
     def alter(self) -> int:
         """Berechnet das aktuelle Alter des Kindes"""
-        heute = date.today()
-        alter = heute.year - self.geburtsdatum.year
-        if (heute.month, heute.day) < (self.geburtsdatum.month, self.geburtsdatum.day):
-            alter -= 1
-        return alter
+        return self.alter_at(date.today())
 
     @property
     def altersstufe(self) -> int:
         """Bestimmt die Altersstufe nach Düsseldorfer Tabelle"""
-        alter = self.alter
-        if alter <= 5:
-            return 0
-        elif alter <= 11:
-            return 1
-        elif alter <= 17:
-            return 2
-        else:
-            return 3
+        return _altersstufe(self.alter)
 
     @property
     def ist_minderjaehrig(self) -> bool:
@@ -60,7 +199,7 @@ class Kind:
         return self.alter < 18
 
 
-@dataclass
+@dataclass(slots=True)
 class Einkommensbereinigung:
     """Datenklasse für die Einkommensbereinigung"""
     bruttoeinkommen: float
@@ -93,20 +232,32 @@ class Einkommensbereinigung:
         max_vorsorge = self.bruttoeinkommen * OLG_SCHLESWIG_LEITLINIEN_2025["altersvorsorge_prozent"]
         return min(self.private_altersvorsorge, max_vorsorge)
 
-    def berechne_bereinigtes_netto(self) -> float:
-        """Berechnet das bereinigte Nettoeinkommen"""
+    def berechne_bereinigung(self) -> Tuple[float, float, float]:
+        """
+        Berechnet die Einkommensbereinigung in einem Durchgang
+
+        Returns:
+            (bereinigtes Netto, berufsbedingte Aufwendungen, zulässige Altersvorsorge)
+        """
+        aufwendungen = self.berechne_bereinigte_aufwendungen()
+        altersvorsorge = self.berechne_zulaessige_altersvorsorge()
+
         bereinigt = self.nettoeinkommen
-        bereinigt -= self.berechne_bereinigte_aufwendungen()
+        bereinigt -= aufwendungen
         bereinigt -= self.fahrtkosten
         bereinigt -= self.fortbildungskosten
         bereinigt -= self.gewerkschaftsbeitraege
-        bereinigt -= self.berechne_zulaessige_altersvorsorge()
+        bereinigt -= altersvorsorge
         bereinigt -= self.schulden
         bereinigt -= self.vorrangige_unterhaltslasten
-        return max(0, bereinigt)
+        return max(0, bereinigt), aufwendungen, altersvorsorge
 
+    def berechne_bereinigtes_netto(self) -> float:
+        """Berechnet das bereinigte Nettoeinkommen"""
+        return self.berechne_bereinigung()[0]
 
-@dataclass
+
+@dataclass(slots=True)
 class KindesunterhaltErgebnis:
     """Ergebnis der Kindesunterhalt-Berechnung"""
     kind_name: str
@@ -122,7 +273,7 @@ class KindesunterhaltErgebnis:
     hinweise: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class GesamtErgebnis:
     """Gesamtergebnis für alle Kinder"""
     bereinigtes_einkommen: float
@@ -157,20 +308,65 @@ class KindesunterhaltRechner:
         self.tabelle = tabelle or DUESSELDORFER_TABELLE_2025
         self.einkommensgruppen = einkommensgruppen or EINKOMMENSGRUPPEN_2025
 
+        # Gruppen und Obergrenzen aufsteigend für die binäre Suche
+        self._gruppen = sorted(self.einkommensgruppen)
+        self._obergrenzen = [self.einkommensgruppen[g][1] for g in self._gruppen]
+
+        # Tabellenbeträge als Matrix [Gruppe, Altersstufe]; fehlende Felder = 0
+        max_stufe = max((a for stufen in self.tabelle.values() for a in stufen), default=0)
+        self._tabelle_arr = np.zeros((max(self.tabelle, default=0) + 1, max_stufe + 1))
+        for gruppe, stufen in self.tabelle.items():
+            for altersstufe, betrag in stufen.items():
+                self._tabelle_arr[gruppe, altersstufe] = betrag
+
+        # Bedarfskontrollbeträge je Gruppe; fehlende Gruppen = 1200
+        self._bedarfskontrolle_arr = np.full(
+            max(BEDARFSKONTROLLBETRAEGE_2025) + 1, 1200, dtype=np.int64
+        )
+        for gruppe, betrag in BEDARFSKONTROLLBETRAEGE_2025.items():
+            self._bedarfskontrolle_arr[gruppe] = betrag
+
     def ermittle_einkommensgruppe(self, bereinigtes_netto: float) -> int:
         """
         Ermittelt die Einkommensgruppe basierend auf dem bereinigten Nettoeinkommen
+
+        Maßgeblich ist die erste Gruppe, deren Obergrenze nicht überschritten
+        wird; Centbeträge oberhalb einer Obergrenze fallen in die nächste Gruppe.
         """
-        for gruppe, (untergrenze, obergrenze) in self.einkommensgruppen.items():
-            if untergrenze <= bereinigtes_netto <= obergrenze:
-                return gruppe
+        idx = bisect.bisect_left(self._obergrenzen, bereinigtes_netto)
 
         # Über höchster Gruppe
-        if bereinigtes_netto > 11200:
-            return 15
+        if idx == len(self._gruppen):
+            return self._gruppen[-1]
 
-        # Unter niedrigster Gruppe
-        return 1
+        return self._gruppen[idx]
+
+    def hole_tabellenbetraege_batch(self, bereinigte_nettos, anzahl_berechtigte, altersstufen) -> np.ndarray:
+        """
+        Tabellenbeträge für viele Fälle auf einmal (z.B. Einkommensreihen)
+
+        Entspricht je Element ermittle_einkommensgruppe, passe_gruppe_an und
+        hole_tabellenbetrag. Alle Argumente können Skalare oder gleich lange
+        Arrays sein. Mit installiertem numba läuft der Rechenkern kompiliert.
+        """
+        nettos, anzahl, stufen = np.broadcast_arrays(
+            np.asarray(bereinigte_nettos, dtype=np.float64),
+            np.asarray(anzahl_berechtigte, dtype=np.int64),
+            np.asarray(altersstufen, dtype=np.int64),
+        )
+        nettos, anzahl, stufen = (
+            np.ascontiguousarray(a.ravel()) for a in (nettos, anzahl, stufen)
+        )
+
+        out = np.empty(nettos.shape[0], dtype=np.float64)
+        _tabellenbetraege_batch(
+            nettos, anzahl, stufen,
+            np.asarray(self._obergrenzen, dtype=np.float64),
+            np.asarray(self._gruppen, dtype=np.int64),
+            self._tabelle_arr,
+            out
+        )
+        return out
 
     def passe_gruppe_an(self, gruppe: int, anzahl_berechtigte: int) -> int:
         """
@@ -192,10 +388,17 @@ class KindesunterhaltRechner:
 
     def hole_tabellenbetrag(self, gruppe: int, altersstufe: int) -> float:
         """Holt den Tabellenbetrag aus der Düsseldorfer Tabelle"""
-        if gruppe in self.tabelle and altersstufe in self.tabelle[gruppe]:
-            return float(self.tabelle[gruppe][altersstufe])
+        gruppen, stufen = self._tabelle_arr.shape
+        if 0 <= gruppe < gruppen and 0 <= altersstufe < stufen:
+            return float(self._tabelle_arr[gruppe, altersstufe])
         return 0.0
 
+    def hole_bedarfskontrollbetrag(self, gruppe: int) -> int:
+        """Holt den Bedarfskontrollbetrag einer Einkommensgruppe"""
+        if 0 <= gruppe < self._bedarfskontrolle_arr.shape[0]:
+            return int(self._bedarfskontrolle_arr[gruppe])
+        return 1200
+
     def berechne_kindergeldabzug(self, ist_minderjaehrig: bool) -> float:
         """
         Berechnet den Kindergeldabzug
@@ -224,57 +427,83 @@ class KindesunterhaltRechner:
         """
         Prüft, ob der Bedarfskontrollbetrag unterschritten wird
         """
-        kontrollbetrag = BEDARFSKONTROLLBETRAEGE_2025.get(gruppe, 1200)
+        kontrollbetrag = self.hole_bedarfskontrollbetrag(gruppe)
         return verbleibendes_einkommen >= kontrollbetrag
 
+    @staticmethod
+    def _kind_daten(
+        kinder: List[Kind],
+        stichtag: Optional[date] = None
+    ) -> List[Tuple[Kind, int, int, bool]]:
+        """Ermittelt Alter, Altersstufe und Minderjährigkeit je Kind genau einmal"""
+        stichtag = stichtag or date.today()
+        daten = []
+        for kind in kinder:
+            alter = kind.alter_at(stichtag)
+            daten.append((kind, alter, _altersstufe(alter), alter < 18))
+        return daten
+
     def berechne_mangelfall(
         self,
         bereinigtes_einkommen: float,
         selbstbehalt: float,
-        kinder: List[Kind]
+        kinder: List[Kind],
+        kind_daten: Optional[List[Tuple[Kind, int, int, bool]]] = None
     ) -> Dict[str, float]:
         """
         Berechnet die Verteilung im Mangelfall
 
         Verteilungsmasse = Bereinigtes Einkommen - Selbstbehalt
         Verteilung nach Prozentsätzen der Bedarfsbeträge
+
+        kind_daten kann aus berechne() übergeben werden, damit das Alter
+        nicht erneut ermittelt wird.
         """
         verteilungsmasse = max(0, bereinigtes_einkommen - selbstbehalt)
 
         if verteilungsmasse == 0:
             return {kind.name: 0.0 for kind in kinder}
 
-        # Bedarfsbeträge ermitteln (Mindestunterhalt = Gruppe 1)
-        bedarfe = {}
-        gesamtbedarf = 0.0
+        if kind_daten is None:
+            kind_daten = self._kind_daten(kinder)
 
-        for kind in kinder:
-            bedarf = self.hole_tabellenbetrag(1, kind.altersstufe)
+        zahlbetraege = self._mangelfall_zahlbetraege(verteilungsmasse, kind_daten)
+        return {
+            kind.name: zahlbetrag
+            for (kind, _, _, _), zahlbetrag in zip(kind_daten, zahlbetraege)
+        }
+
+    def _mangelfall_zahlbetraege(
+        self,
+        verteilungsmasse: float,
+        kind_daten: List[Tuple[Kind, int, int, bool]]
+    ) -> List[float]:
+        """Gerundete Mangelfall-Zahlbeträge in der Reihenfolge von kind_daten"""
+        if verteilungsmasse == 0:
+            return [0.0] * len(kind_daten)
+
+        # Bedarfsbeträge ermitteln (Mindestunterhalt = Gruppe 1)
+        bedarfe = np.empty(len(kind_daten))
+        for i, (_, _, altersstufe, minderjaehrig) in enumerate(kind_daten):
+            bedarf = self.hole_tabellenbetrag(1, altersstufe)
             # Kindergeld abziehen für Zahlbetrag
-            if kind.ist_minderjaehrig:
+            if minderjaehrig:
                 bedarf -= KINDERGELD_HALB_2025
             else:
                 bedarf -= KINDERGELD_2025
-            bedarfe[kind.name] = max(0, bedarf)
-            gesamtbedarf += bedarfe[kind.name]
+            bedarfe[i] = max(0, bedarf)
 
         # Quoten berechnen und Verteilung
-        verteilung = {}
-        for kind in kinder:
-            if gesamtbedarf > 0:
-                quote = bedarfe[kind.name] / gesamtbedarf
-                verteilung[kind.name] = round(verteilungsmasse * quote, 2)
-            else:
-                verteilung[kind.name] = 0.0
-
-        return verteilung
+        anteile = _mangelfall_kernel(bedarfe, float(verteilungsmasse))
+        return [round(float(anteil), 2) for anteil in anteile]
 
     def berechne(
         self,
         einkommen: Einkommensbereinigung,
         kinder: List[Kind],
         erwerbstaetig: bool = True,
-        weitere_unterhaltsberechtigte: int = 0
+        weitere_unterhaltsberechtigte: int = 0,
+        stichtag: Optional[date] = None
     ) -> GesamtErgebnis:
         """
         Hauptmethode zur Berechnung des Kindesunterhalts
@@ -284,12 +513,13 @@ class KindesunterhaltRechner:
             kinder: Liste der unterhaltsberechtigten Kinder
             erwerbstaetig: Ob der Pflichtige erwerbstätig ist
             weitere_unterhaltsberechtigte: Anzahl weiterer Unterhaltsberechtigter (z.B. Ehegatte)
+            stichtag: Stichtag für das Alter der Kinder (Standard: heute)
 
         Returns:
             GesamtErgebnis mit allen Berechnungsdetails
         """
         # 1. Bereinigtes Nettoeinkommen berechnen
-        bereinigtes_netto = einkommen.berechne_bereinigtes_netto()
+        bereinigtes_netto, aufwendungen, altersvorsorge = einkommen.berechne_bereinigung()
 
         # 2. Einkommensgruppe ermitteln
         grundgruppe = self.ermittle_einkommensgruppe(bereinigtes_netto)
@@ -300,8 +530,11 @@ class KindesunterhaltRechner:
         # 4. Gruppenanpassung
         angepasste_gruppe = self.passe_gruppe_an(grundgruppe, anzahl_berechtigte)
 
+        # Alter je Kind einmal bestimmen und für alle Schritte wiederverwenden
+        kind_daten = self._kind_daten(kinder, stichtag)
+
         # 5. Selbstbehalt ermitteln (für minderjährige/privilegierte Kinder)
-        hat_minderjaehrige = any(k.ist_minderjaehrig for k in kinder)
+        hat_minderjaehrige = any(minderjaehrig for _, _, _, minderjaehrig in kind_daten)
         hat_privilegierte = any(k.privilegiert for k in kinder)
         selbstbehalt = self.ermittle_selbstbehalt(
             erwerbstaetig,
@@ -313,23 +546,31 @@ class KindesunterhaltRechner:
         kinder_ergebnisse = []
         gesamtunterhalt = 0.0
 
-        for kind in kinder:
-            tabellenbetrag = self.hole_tabellenbetrag(angepasste_gruppe, kind.altersstufe)
-            kindergeldabzug = self.berechne_kindergeldabzug(kind.ist_minderjaehrig)
-            zahlbetrag = tabellenbetrag - kindergeldabzug
-
-            # Eigenes Einkommen des Kindes berücksichtigen (bei Volljährigen)
-            if not kind.ist_minderjaehrig and kind.eigenes_einkommen > 0:
-                # Anrechnung des bereinigten Einkommens abzüglich Freibetrag
-                anrechenbares_einkommen = max(0, kind.eigenes_einkommen - 100)  # 100€ Freibetrag
-                zahlbetrag = max(0, zahlbetrag - anrechenbares_einkommen)
+        # Beträge aller Kinder in einem Rechenkern; eigenes Einkommen volljähriger
+        # Kinder wird abzüglich 100€ Freibetrag angerechnet
+        tabellenbetraege, kindergeldabzuege, zahlbetraege = _je_kind_kernel(
+            angepasste_gruppe,
+            np.fromiter((d[2] for d in kind_daten), dtype=np.int64, count=len(kind_daten)),
+            np.fromiter((d[3] for d in kind_daten), dtype=np.bool_, count=len(kind_daten)),
+            np.fromiter((k.eigenes_einkommen for k in kinder), dtype=np.float64, count=len(kinder)),
+            self._tabelle_arr,
+            float(KINDERGELD_2025),
+            float(KINDERGELD_HALB_2025),
+            100.0
+        )
 
+        for (kind, alter, altersstufe, _), tabellenbetrag, kindergeldabzug, zahlbetrag in zip(
+            kind_daten,
+            tabellenbetraege.tolist(),
+            kindergeldabzuege.tolist(),
+            zahlbetraege.tolist()
+        ):
             hinweise = []
 
             ergebnis = KindesunterhaltErgebnis(
                 kind_name=kind.name,
-                alter=kind.alter,
-                altersstufe=kind.altersstufe,
+                alter=alter,
+                altersstufe=altersstufe,
                 einkommensgruppe=grundgruppe,
                 angepasste_gruppe=angepasste_gruppe,
                 tabellenbetrag=tabellenbetrag,
@@ -346,16 +587,15 @@ class KindesunterhaltRechner:
 
         # 8. Bei Mangelfall: Neuberechnung
         if ist_mangelfall:
-            mangelfall_verteilung = self.berechne_mangelfall(
-                bereinigtes_netto,
-                selbstbehalt,
-                kinder
+            # Zahlbeträge je Kind in derselben Reihenfolge wie kinder_ergebnisse
+            zahlbetraege = self._mangelfall_zahlbetraege(
+                max(0, bereinigtes_netto - selbstbehalt),
+                kind_daten
             )
 
             # Ergebnisse aktualisieren
             gesamtunterhalt = 0.0
-            for ergebnis in kinder_ergebnisse:
-                neuer_zahlbetrag = mangelfall_verteilung.get(ergebnis.kind_name, 0.0)
+            for ergebnis, neuer_zahlbetrag in zip(kinder_ergebnisse, zahlbetraege):
                 ergebnis.zahlbetrag = neuer_zahlbetrag
                 ergebnis.mangelfall = True
                 ergebnis.hinweise.append(
@@ -377,8 +617,8 @@ class KindesunterhaltRechner:
         berechnungsdetails = {
             "bruttoeinkommen": einkommen.bruttoeinkommen,
             "nettoeinkommen": einkommen.nettoeinkommen,
-            "berufsbedingte_aufwendungen": einkommen.berechne_bereinigte_aufwendungen(),
-            "altersvorsorge": einkommen.berechne_zulaessige_altersvorsorge(),
+            "berufsbedingte_aufwendungen": aufwendungen,
+            "altersvorsorge": altersvorsorge,
             "weitere_abzuege": (
                 einkommen.fahrtkosten +
                 einkommen.fortbildungskosten +
@@ -387,7 +627,7 @@ class KindesunterhaltRechner:
                 einkommen.vorrangige_unterhaltslasten
             ),
             "kindergeld": KINDERGELD_2025,
-            "bedarfskontrollbetrag": BEDARFSKONTROLLBETRAEGE_2025.get(angepasste_gruppe, 1200),
+            "bedarfskontrollbetrag": self.hole_bedarfskontrollbetrag(angepasste_gruppe),
         }
 
         return GesamtErgebnis(
@@ -405,48 +645,36 @@ class KindesunterhaltRechner:
 
     def formatiere_ergebnis(self, ergebnis: GesamtErgebnis) -> str:
         """Formatiert das Ergebnis als lesbaren Text"""
-        lines = [
-            "=" * 60,
-            "KINDESUNTERHALT-BERECHNUNG",
-            "=" * 60,
-            "",
-            f"Bereinigtes Nettoeinkommen: {ergebnis.bereinigtes_einkommen:,.2f} €",
-            f"Einkommensgruppe: {ergebnis.einkommensgruppe}",
-            f"Anzahl Unterhaltsberechtigte: {ergebnis.anzahl_unterhaltsberechtigte}",
-            f"Gruppenanpassung: {ergebnis.gruppenanpassung:+d}",
-            "",
-            "-" * 60,
-            "UNTERHALT JE KIND:",
-            "-" * 60,
-        ]
+        out = io.StringIO()
+        out.write(_KOPF_VORLAGE.format(
+            bereinigtes_einkommen=ergebnis.bereinigtes_einkommen,
+            einkommensgruppe=ergebnis.einkommensgruppe,
+            anzahl_unterhaltsberechtigte=ergebnis.anzahl_unterhaltsberechtigte,
+            gruppenanpassung=ergebnis.gruppenanpassung,
+        ))
 
         for kind_ergebnis in ergebnis.kinder_ergebnisse:
-            lines.extend([
-                "",
-                f"  {kind_ergebnis.kind_name} ({kind_ergebnis.alter} Jahre, Altersstufe {kind_ergebnis.altersstufe + 1}):",
-                f"    Einkommensgruppe (angepasst): {kind_ergebnis.angepasste_gruppe}",
-                f"    Tabellenbetrag:    {kind_ergebnis.tabellenbetrag:>8,.2f} €",
-                f"    Kindergeldabzug:   {kind_ergebnis.kindergeldabzug:>8,.2f} €",
-                f"    Zahlbetrag:        {kind_ergebnis.zahlbetrag:>8,.2f} €",
-            ])
-            if kind_ergebnis.hinweise:
-                for hinweis in kind_ergebnis.hinweise:
-                    lines.append(f"    ⚠ {hinweis}")
-
-        lines.extend([
-            "",
-            "-" * 60,
-            f"GESAMTUNTERHALT:         {ergebnis.gesamtunterhalt:>8,.2f} €",
-            f"Verbleibendes Einkommen: {ergebnis.verbleibendes_einkommen:>8,.2f} €",
-            f"Selbstbehalt:            {ergebnis.selbstbehalt:>8,.2f} €",
-            "-" * 60,
-        ])
+            out.write(_KIND_VORLAGE.format(
+                kind_name=kind_ergebnis.kind_name,
+                alter=kind_ergebnis.alter,
+                altersstufe_anzeige=kind_ergebnis.altersstufe + 1,
+                angepasste_gruppe=kind_ergebnis.angepasste_gruppe,
+                tabellenbetrag=kind_ergebnis.tabellenbetrag,
+                kindergeldabzug=kind_ergebnis.kindergeldabzug,
+                zahlbetrag=kind_ergebnis.zahlbetrag,
+            ))
+            for hinweis in kind_ergebnis.hinweise:
+                out.write(f"\n    ⚠ {hinweis}")
+
+        out.write(_FUSS_VORLAGE.format(
+            gesamtunterhalt=ergebnis.gesamtunterhalt,
+            verbleibendes_einkommen=ergebnis.verbleibendes_einkommen,
+            selbstbehalt=ergebnis.selbstbehalt,
+        ))
 
         if ergebnis.ist_mangelfall:
-            lines.append("")
-            lines.append("⚠ MANGELFALL: Der Selbstbehalt kann nicht gewahrt werden.")
-            lines.append("  Die Zahlbeträge wurden entsprechend angepasst.")
+            out.write(_MANGELFALL_HINWEIS)
 
-        lines.append("=" * 60)
+        out.write("\n" + _TRENNER_DOPPELT)
 
-        return "\n".join(lines)
+        return out.getvalue()
@@ -9,9 +9,15 @@ Implementiert:
 - Verschiedene Gebührenarten (Geschäfts-, Verfahrens-, Terminsgebühr)
 """
 
-from dataclasses import dataclass, field
+import bisect
+import functools
+import io
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import List, Optional, Dict, Tuple
+from math import floor as _floor
+from typing import Any, List, NamedTuple, Optional, Dict, Tuple, Union
+
+import numpy as np
 
 from config.constants import (
     RVG_TABELLE_2025,
@@ -20,6 +26,115 @@ from config.constants import (
     GEGENSTANDSWERTE_FAMGKG,
 )
 
+from ._jit import njit, NUMBA_VERFUEGBAR
+
+
+# Textbausteine für formatiere_ergebnis
+_TRENNER_DOPPELT = "=" * 65
+_TRENNER_EINFACH = "-" * 65
+
+_KOPF_VORLAGE = (
+    _TRENNER_DOPPELT + "\n"
+    "RVG-GEBÜHRENBERECHNUNG\n"
+    + _TRENNER_DOPPELT + "\n"
+)
+
+_GEGENSTANDSWERT_VORLAGE = "\nGegenstandswert: {:>15,.2f} €\n"
+
+_POSITIONEN_KOPF = (
+    "\n" + _TRENNER_EINFACH
+    + "\nGEBÜHRENPOSITIONEN:"
+    "\n" + _TRENNER_EINFACH
+)
+
+_POSITION_VORLAGE = "\n{:30} {:.1f} × {:>8,.2f}€ = {:>10,.2f} €"
+_POSITION_PAUSCHAL_VORLAGE = "\n{:30} {:>30,.2f} €"
+
+_ZWISCHENSUMME_VORLAGE = (
+    "\n"
+    "\n" + _TRENNER_EINFACH
+    + "\n" + "Zwischensumme Gebühren:".ljust(45) + " {:>12,.2f} €"
+)
+
+_AUSLAGEN_VORLAGE = "\n" + "Auslagenpauschale (Nr. 7002 VV RVG):".ljust(45) + " {:>12,.2f} €"
+
+_FUSS_VORLAGE = (
+    "\n" + "Nettobetrag:".ljust(45) + " {netto:>12,.2f} €"
+    "\n" + "MwSt. 19%:".ljust(45) + " {mehrwertsteuer:>12,.2f} €"
+    "\n" + _TRENNER_EINFACH
+    + "\n" + "GESAMTBETRAG:".ljust(45) + " {gesamtbetrag:>12,.2f} €"
+    "\n" + _TRENNER_EINFACH
+)
+
+# Toleranz beim Runden auf Cent: exakte halbe Cent (z.B. 354,50 € × 0,65)
+# liegen binär knapp darunter und sollen dennoch aufgerundet werden
+_CENT_TOLERANZ = 1e-6
+
+
+def _runde_cent(cent_betrag: float) -> int:
+    """Rundet einen Betrag in Cent kaufmännisch auf ganze Cent"""
+    return _floor(cent_betrag + 0.5 + _CENT_TOLERANZ)
+
+
+def _in_cent(betrag: float) -> int:
+    """Euro-Betrag in ganze Cent (kaufmännisch gerundet)"""
+    return _runde_cent(betrag * 100)
+
+
+def _aus_cent(cent: int) -> float:
+    """Ganze Cent zurück in einen Euro-Betrag"""
+    return cent / 100
+
+
+def _tabellen_spalten(
+    tabelle: List[Tuple[int, float]]
+) -> Tuple[Tuple[int, ...], Tuple[float, ...], np.ndarray, np.ndarray]:
+    """Zerlegt die Gebührentabelle in Stufengrenzen und Gebühren (auch als Arrays)"""
+    grenzen = tuple(wert for wert, _ in tabelle)
+    gebuehren = tuple(gebuehr for _, gebuehr in tabelle)
+    grenzen_np = np.asarray(grenzen, dtype=np.float64)
+    gebuehren_np = np.asarray(gebuehren, dtype=np.float64)
+    # Können von mehreren Instanzen geteilt werden, daher schreibgeschützt
+    grenzen_np.flags.writeable = False
+    gebuehren_np.flags.writeable = False
+    return grenzen, gebuehren, grenzen_np, gebuehren_np
+
+
+_STANDARD_TABELLE = _tabellen_spalten(RVG_TABELLE_2025)
+
+
+# Ab dieser Anzahl Werte nutzt berechne_gebuehr_batch den kompilierten Kern
+_KERN_AB_WERTEN = 32
+
+
+@njit(cache=True)
+def _gebuehren_kernel(werte, grenzen, gebuehren, gebuerensatz, out):
+    """Rechenkern für berechne_gebuehr_batch: Stufensuche und Rundung je Wert"""
+    n = grenzen.shape[0]
+    for i in range(werte.shape[0]):
+        wert = werte[i]
+        if wert <= 0:
+            einfache = 0.0
+        else:
+            # Binäre Suche nach der ersten nicht überschrittenen Stufengrenze
+            lo = 0
+            hi = n
+            while lo < hi:
+                mid = (lo + hi) >> 1
+                if grenzen[mid] < wert:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo < n:
+                einfache = gebuehren[lo]
+            else:
+                einfache = gebuehren[n - 1] + (wert - grenzen[n - 1]) / 50000 * 306.0
+        out[i] = np.floor(einfache * gebuerensatz * 100 + 0.5 + _CENT_TOLERANZ) / 100
+
+
+# Höchstzahl gecachter Werte je Rechner-Instanz (danach wird geleert)
+_CACHE_GROESSE = 4096
+
 
 class Gebuehrenart(Enum):
     """Arten von RVG-Gebühren"""
@@ -31,6 +146,16 @@ class Gebuehrenart(Enum):
     BERATUNGSGEBUEHR = "beratungsgebuehr"
 
 
+# Gebührenarten für die Positionen als Modulkonstanten (ein Namenszugriff
+# statt Klasse + Attribut je erzeugter Position)
+_GA_VERF = Gebuehrenart.VERFAHRENSGEBUEHR
+_GA_TERM = Gebuehrenart.TERMINSGEBUEHR
+_GA_GES = Gebuehrenart.GESCHAEFTSGEBUEHR
+_GA_EIN = Gebuehrenart.EINIGUNGSGEBUEHR
+_GA_EIN_G = Gebuehrenart.EINIGUNGSGEBUEHR_GERICHT
+_GA_BER = Gebuehrenart.BERATUNGSGEBUEHR
+
+
 class Verfahrensart(Enum):
     """Verfahrensarten im Familienrecht"""
     EHESCHEIDUNG = "ehescheidung"
@@ -41,7 +166,7 @@ class Verfahrensart(Enum):
     ZUGEWINNAUSGLEICH = "zugewinnausgleich"
 
 
-@dataclass
+@dataclass(slots=True)
 class Gebuehrenposition:
     """Eine einzelne Gebührenposition"""
     bezeichnung: str
@@ -53,9 +178,9 @@ class Gebuehrenposition:
     rechtsgrundlage: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RVGErgebnis:
-    """Ergebnis der RVG-Berechnung"""
+    """Ergebnis der RVG-Berechnung (nach der Erstellung unveränderlich)"""
     gegenstandswert: float
     positionen: List[Gebuehrenposition]
     summe_gebuehren: float
@@ -63,7 +188,16 @@ class RVGErgebnis:
     mehrwertsteuer: float
     gesamtbetrag: float
     hinweise: List[str] = field(default_factory=list)
-    berechnungsdetails: Dict[str, any] = field(default_factory=dict)
+    berechnungsdetails: Dict[str, Any] = field(default_factory=dict)
+
+
+class RVGSummen(NamedTuple):
+    """Nur die Beträge einer RVG-Berechnung (für nur_summen=True)"""
+    summe_gebuehren: float
+    auslagenpauschale: float
+    nettobetrag: float
+    mehrwertsteuer: float
+    gesamtbetrag: float
 
 
 class RVGRechner:
@@ -87,32 +221,61 @@ class RVGRechner:
         self.pauschalen = RVG_PAUSCHALEN
         self.saetze = RVG_GEBUEHRENSAETZE
 
+        # Häufig benötigte Pauschalen einmal aus dem Dict lesen
+        self._ausl_pct = self.pauschalen["auslagenpauschale_prozent"]
+        self._ausl_max = self.pauschalen["auslagenpauschale_max"]
+        self._ausl_max_cent = _in_cent(self._ausl_max)
+        self._erstberatung = self.pauschalen["erstberatung_verbraucher"]
+        self._weitere_beratung = self.pauschalen["weitere_beratung"]
+
+        # Stufengrenzen und Gebühren getrennt für die binäre Suche; die
+        # Standardtabelle wird nur einmal beim Import aufbereitet
+        if self.tabelle is RVG_TABELLE_2025:
+            spalten = _STANDARD_TABELLE
+        else:
+            spalten = _tabellen_spalten(self.tabelle)
+        self._tab_keys, self._tab_vals, self._tab_keys_np, self._tab_vals_np = spalten
+        self._tab_max_key = self._tab_keys[-1]
+        self._tab_max_val = self._tab_vals[-1]
+
+        # Ergebnis-Caches: die Tabelle ist je Instanz fest, die Gebühren
+        # hängen also nur vom Gegenstandswert (und Satz) ab
+        self._einfache_cache: Dict[float, float] = {}
+        self._gebuehr_cache: Dict[Tuple[float, float], Tuple[float, float]] = {}
+
     def ermittle_einfache_gebuehr(self, gegenstandswert: float) -> float:
         """
         Ermittelt die einfache Gebühr (1,0) aus der RVG-Tabelle
 
         Bei Werten über dem höchsten Tabellenwert wird linear interpoliert.
+        Wiederholte Gegenstandswerte werden aus dem Cache bedient.
         """
+        cache = self._einfache_cache
+        einfache = cache.get(gegenstandswert)
+        if einfache is None:
+            if len(cache) >= _CACHE_GROESSE:
+                cache.clear()
+            einfache = cache[gegenstandswert] = self._suche_einfache_gebuehr(gegenstandswert)
+        return einfache
+
+    def _suche_einfache_gebuehr(self, gegenstandswert: float) -> float:
+        """Tabellensuche für ermittle_einfache_gebuehr (ohne Cache)"""
         if gegenstandswert <= 0:
             return 0.0
 
-        # Suche passenden Wert in der Tabelle
-        vorherige_stufe = (0, 0.0)
-
-        for wert, gebuehr in self.tabelle:
-            if gegenstandswert <= wert:
-                # Gefunden - Wert dieser Stufe verwenden
-                return gebuehr
-            vorherige_stufe = (wert, gebuehr)
+        # Erste Stufe, deren Grenze nicht überschritten ist
+        grenzen = self._tab_keys
+        idx = bisect.bisect_left(grenzen, gegenstandswert)
+        if idx < len(grenzen):
+            return self._tab_vals[idx]
 
         # Über höchstem Tabellenwert - lineare Fortschreibung
         # Ab 500.000€: je weitere 50.000€ kommen ca. 306€ hinzu
-        hoechster_wert, hoechste_gebuehr = self.tabelle[-1]
-        ueberschuss = gegenstandswert - hoechster_wert
+        ueberschuss = gegenstandswert - self._tab_max_key
         zusatz_stufen = ueberschuss / 50000
         zusatz_gebuehr = zusatz_stufen * 306.0  # Approximation
 
-        return hoechste_gebuehr + zusatz_gebuehr
+        return self._tab_max_val + zusatz_gebuehr
 
     def berechne_gebuehr(
         self,
@@ -125,9 +288,44 @@ class RVGRechner:
         Returns:
             Tuple aus (einfache_gebuehr, berechnete_gebuehr)
         """
-        einfache = self.ermittle_einfache_gebuehr(gegenstandswert)
-        gebuehr = einfache * gebuerensatz
-        return einfache, round(gebuehr, 2)
+        cache = self._gebuehr_cache
+        schluessel = (gegenstandswert, gebuerensatz)
+        ergebnis = cache.get(schluessel)
+        if ergebnis is None:
+            if len(cache) >= _CACHE_GROESSE:
+                cache.clear()
+            einfache = self.ermittle_einfache_gebuehr(gegenstandswert)
+            gebuehr = _aus_cent(_in_cent(einfache * gebuerensatz))
+            ergebnis = cache[schluessel] = (einfache, gebuehr)
+        return ergebnis
+
+    def berechne_gebuehr_batch(self, werte, gebuerensatz: float) -> np.ndarray:
+        """
+        Berechnet die Gebühr für viele Gegenstandswerte auf einmal
+
+        Für Vergleichstabellen und Vorschauen; liefert je Wert dasselbe
+        Ergebnis wie berechne_gebuehr(wert, gebuerensatz)[1]. Größere
+        Mengen laufen mit installiertem numba durch einen kompilierten Kern.
+        """
+        werte = np.atleast_1d(np.asarray(werte, dtype=np.float64))
+
+        if NUMBA_VERFUEGBAR and werte.size > _KERN_AB_WERTEN:
+            flach = np.ascontiguousarray(werte.ravel())
+            out = np.empty_like(flach)
+            _gebuehren_kernel(flach, self._tab_keys_np, self._tab_vals_np, float(gebuerensatz), out)
+            return out.reshape(werte.shape)
+
+        idx = np.searchsorted(self._tab_keys_np, werte, side="left")
+        in_tabelle = idx < len(self._tab_keys_np)
+
+        einfache = np.empty_like(werte)
+        einfache[in_tabelle] = self._tab_vals_np[idx[in_tabelle]]
+        ueber = ~in_tabelle
+        einfache[ueber] = self._tab_max_val + (werte[ueber] - self._tab_max_key) / 50000 * 306.0
+        einfache[werte <= 0] = 0.0
+
+        # Kaufmännische Rundung auf Cent wie _in_cent
+        return np.floor(einfache * gebuerensatz * 100 + 0.5 + _CENT_TOLERANZ) / 100
 
     def berechne_gegenstandswert_ehescheidung(
         self,
@@ -174,66 +372,106 @@ class RVGRechner:
         """
         Berechnet die Auslagenpauschale nach Nr. 7002 VV RVG
 
-        20% der Gebühren, maximal 20€
+        20% der Gebühren, maximal 20€ (auf Cent gerundet)
         """
-        pauschale = summe_gebuehren * self.pauschalen["auslagenpauschale_prozent"]
-        return min(pauschale, self.pauschalen["auslagenpauschale_max"])
+        return _aus_cent(self._auslagen_cent(_in_cent(summe_gebuehren)))
+
+    def _auslagen_cent(self, summe_cent: int) -> int:
+        """Auslagenpauschale in Cent zur Gebührensumme in Cent"""
+        pauschale_cent = _runde_cent(summe_cent * self._ausl_pct)
+        return pauschale_cent if pauschale_cent < self._ausl_max_cent else self._ausl_max_cent
+
+    def _summen_cent(self, summe_cent: int) -> Tuple[int, int, int]:
+        """Auslagenpauschale, Nettobetrag und MwSt. in Cent zur Gebührensumme"""
+        auslagen_cent = self._auslagen_cent(summe_cent)
+        netto_cent = summe_cent + auslagen_cent
+        mwst_cent = _runde_cent(netto_cent * self.mwst_satz)
+        return auslagen_cent, netto_cent, mwst_cent
+
+    def _erstelle_summen(self, summe_cent: int) -> RVGSummen:
+        """Nur die Beträge der Rechnung, ohne Positionen und Hinweise"""
+        auslagen_cent, netto_cent, mwst_cent = self._summen_cent(summe_cent)
+        return RVGSummen(
+            summe_gebuehren=_aus_cent(summe_cent),
+            auslagenpauschale=_aus_cent(auslagen_cent),
+            nettobetrag=_aus_cent(netto_cent),
+            mehrwertsteuer=_aus_cent(mwst_cent),
+            gesamtbetrag=_aus_cent(netto_cent + mwst_cent)
+        )
+
+    def _erstelle_ergebnis(
+        self,
+        gegenstandswert: float,
+        positionen: List[Gebuehrenposition],
+        hinweise: List[str],
+        summe_cent: int,
+        berechnungsdetails: Optional[Dict[str, Any]] = None
+    ) -> RVGErgebnis:
+        """Auslagenpauschale, MwSt. und Gesamtbetrag zur Gebührensumme ergänzen"""
+        auslagen_cent, netto_cent, mwst_cent = self._summen_cent(summe_cent)
+
+        return RVGErgebnis(
+            gegenstandswert=gegenstandswert,
+            positionen=positionen,
+            summe_gebuehren=_aus_cent(summe_cent),
+            auslagenpauschale=_aus_cent(auslagen_cent),
+            mehrwertsteuer=_aus_cent(mwst_cent),
+            gesamtbetrag=_aus_cent(netto_cent + mwst_cent),
+            hinweise=hinweise,
+            berechnungsdetails={} if berechnungsdetails is None else berechnungsdetails
+        )
 
     def berechne_aussergericht(
         self,
         gegenstandswert: float,
         geschaeftsgebuehr_satz: float = 1.3,
-        mit_einigung: bool = False
-    ) -> RVGErgebnis:
+        mit_einigung: bool = False,
+        nur_summen: bool = False
+    ) -> Union[RVGErgebnis, RVGSummen]:
         """
         Berechnet die außergerichtliche Vertretung
 
         Standard: 1,3 Geschäftsgebühr (Nr. 2300 VV RVG)
         Bei Einigung: Zusätzlich 1,5 Einigungsgebühr (Nr. 1000 VV RVG)
+
+        Mit nur_summen=True werden nur die Beträge (RVGSummen) geliefert.
         """
+        # Einfache Gebühr einmal nachschlagen, alle Sätze darauf anwenden
+        einfache = self.ermittle_einfache_gebuehr(gegenstandswert)
+        gebuehr_cent = _in_cent(einfache * geschaeftsgebuehr_satz)
+        einigungsgebuehr_cent = _in_cent(einfache * 1.5) if mit_einigung else 0
+        summe_cent = gebuehr_cent + einigungsgebuehr_cent
+
+        if nur_summen:
+            return self._erstelle_summen(summe_cent)
+
         positionen = []
         hinweise = []
 
         # Geschäftsgebühr
-        einfache, gebuehr = self.berechne_gebuehr(gegenstandswert, geschaeftsgebuehr_satz)
         positionen.append(Gebuehrenposition(
             bezeichnung="Geschäftsgebühr",
-            gebuehrenart=Gebuehrenart.GESCHAEFTSGEBUEHR,
+            gebuehrenart=_GA_GES,
             gegenstandswert=gegenstandswert,
             gebuerensatz=geschaeftsgebuehr_satz,
             einfache_gebuehr=einfache,
-            gebuehr=gebuehr,
+            gebuehr=_aus_cent(gebuehr_cent),
             rechtsgrundlage="Nr. 2300 VV RVG"
         ))
 
         # Einigungsgebühr wenn zutreffend
         if mit_einigung:
-            _, einigungsgebuehr = self.berechne_gebuehr(gegenstandswert, 1.5)
             positionen.append(Gebuehrenposition(
                 bezeichnung="Einigungsgebühr",
-                gebuehrenart=Gebuehrenart.EINIGUNGSGEBUEHR,
+                gebuehrenart=_GA_EIN,
                 gegenstandswert=gegenstandswert,
                 gebuerensatz=1.5,
                 einfache_gebuehr=einfache,
-                gebuehr=einigungsgebuehr,
+                gebuehr=_aus_cent(einigungsgebuehr_cent),
                 rechtsgrundlage="Nr. 1000 VV RVG"
             ))
 
-        summe = sum(p.gebuehr for p in positionen)
-        auslagen = self.berechne_auslagenpauschale(summe)
-        netto = summe + auslagen
-        mwst = round(netto * self.mwst_satz, 2)
-        gesamt = netto + mwst
-
-        return RVGErgebnis(
-            gegenstandswert=gegenstandswert,
-            positionen=positionen,
-            summe_gebuehren=summe,
-            auslagenpauschale=auslagen,
-            mehrwertsteuer=mwst,
-            gesamtbetrag=gesamt,
-            hinweise=hinweise
-        )
+        return self._erstelle_ergebnis(gegenstandswert, positionen, hinweise, summe_cent)
 
     def berechne_gerichtlich(
         self,
@@ -241,73 +479,66 @@ class RVGRechner:
         mit_termin: bool = True,
         mit_einigung: bool = False,
         verfahrensgebuehr_satz: float = 1.3,
-        terminsgebuehr_satz: float = 1.2
-    ) -> RVGErgebnis:
+        terminsgebuehr_satz: float = 1.2,
+        nur_summen: bool = False
+    ) -> Union[RVGErgebnis, RVGSummen]:
         """
         Berechnet die gerichtliche Vertretung
 
         - Verfahrensgebühr: 1,3 (Nr. 3100 VV RVG)
         - Terminsgebühr: 1,2 (Nr. 3104 VV RVG)
         - Einigungsgebühr: 1,0 bei Gericht (Nr. 1003 VV RVG)
+
+        Mit nur_summen=True werden nur die Beträge (RVGSummen) geliefert.
         """
+        einfache = self.ermittle_einfache_gebuehr(gegenstandswert)
+        verfahrensgebuehr_cent = _in_cent(einfache * verfahrensgebuehr_satz)
+        terminsgebuehr_cent = _in_cent(einfache * terminsgebuehr_satz) if mit_termin else 0
+        einigungsgebuehr_cent = _in_cent(einfache * 1.0) if mit_einigung else 0
+        summe_cent = verfahrensgebuehr_cent + terminsgebuehr_cent + einigungsgebuehr_cent
+
+        if nur_summen:
+            return self._erstelle_summen(summe_cent)
+
         positionen = []
         hinweise = []
 
-        einfache = self.ermittle_einfache_gebuehr(gegenstandswert)
-
         # Verfahrensgebühr
-        _, verfahrensgebuehr = self.berechne_gebuehr(gegenstandswert, verfahrensgebuehr_satz)
         positionen.append(Gebuehrenposition(
             bezeichnung="Verfahrensgebühr",
-            gebuehrenart=Gebuehrenart.VERFAHRENSGEBUEHR,
+            gebuehrenart=_GA_VERF,
             gegenstandswert=gegenstandswert,
             gebuerensatz=verfahrensgebuehr_satz,
             einfache_gebuehr=einfache,
-            gebuehr=verfahrensgebuehr,
+            gebuehr=_aus_cent(verfahrensgebuehr_cent),
             rechtsgrundlage="Nr. 3100 VV RVG"
         ))
 
         # Terminsgebühr
         if mit_termin:
-            _, terminsgebuehr = self.berechne_gebuehr(gegenstandswert, terminsgebuehr_satz)
             positionen.append(Gebuehrenposition(
                 bezeichnung="Terminsgebühr",
-                gebuehrenart=Gebuehrenart.TERMINSGEBUEHR,
+                gebuehrenart=_GA_TERM,
                 gegenstandswert=gegenstandswert,
                 gebuerensatz=terminsgebuehr_satz,
                 einfache_gebuehr=einfache,
-                gebuehr=terminsgebuehr,
+                gebuehr=_aus_cent(terminsgebuehr_cent),
                 rechtsgrundlage="Nr. 3104 VV RVG"
             ))
 
         # Einigungsgebühr
         if mit_einigung:
-            _, einigungsgebuehr = self.berechne_gebuehr(gegenstandswert, 1.0)
             positionen.append(Gebuehrenposition(
                 bezeichnung="Einigungsgebühr (gerichtlich)",
-                gebuehrenart=Gebuehrenart.EINIGUNGSGEBUEHR_GERICHT,
+                gebuehrenart=_GA_EIN_G,
                 gegenstandswert=gegenstandswert,
                 gebuerensatz=1.0,
                 einfache_gebuehr=einfache,
-                gebuehr=einigungsgebuehr,
+                gebuehr=_aus_cent(einigungsgebuehr_cent),
                 rechtsgrundlage="Nr. 1003 VV RVG"
             ))
 
-        summe = sum(p.gebuehr for p in positionen)
-        auslagen = self.berechne_auslagenpauschale(summe)
-        netto = summe + auslagen
-        mwst = round(netto * self.mwst_satz, 2)
-        gesamt = netto + mwst
-
-        return RVGErgebnis(
-            gegenstandswert=gegenstandswert,
-            positionen=positionen,
-            summe_gebuehren=summe,
-            auslagenpauschale=auslagen,
-            mehrwertsteuer=mwst,
-            gesamtbetrag=gesamt,
-            hinweise=hinweise
-        )
+        return self._erstelle_ergebnis(gegenstandswert, positionen, hinweise, summe_cent)
 
     def berechne_scheidungsverfahren(
         self,
@@ -317,8 +548,9 @@ class RVGRechner:
         mit_zugewinn: bool = False,
         zugewinn_betrag: float = 0.0,
         mit_unterhalt: bool = False,
-        unterhalt_monatlich: float = 0.0
-    ) -> RVGErgebnis:
+        unterhalt_monatlich: float = 0.0,
+        nur_summen: bool = False
+    ) -> Union[RVGErgebnis, RVGSummen]:
         """
         Berechnet die Gebühren für ein Scheidungsverfahren mit Folgesachen
 
@@ -327,9 +559,39 @@ class RVGRechner:
         - Versorgungsausgleich (§ 50 FamGKG)
         - Optional: Zugewinnausgleich
         - Optional: Unterhalt
+
+        Mit der Standardtabelle werden Ergebnisse prozessweit gecacht
+        (z.B. beim wiederholten Verschieben eines Reglers); jeder Aufruf
+        erhält eine eigene Kopie. Mit nur_summen=True werden nur die
+        Beträge (RVGSummen) geliefert.
         """
+        args = (
+            nettoeinkommen_a, nettoeinkommen_b, anzahl_versorgungsanrechte,
+            mit_zugewinn, zugewinn_betrag, mit_unterhalt, unterhalt_monatlich
+        )
+        if self.tabelle is RVG_TABELLE_2025:
+            ergebnis = _scheidung_standardtabelle(self.mwst_satz, *args)
+            if nur_summen:
+                return _summen_aus_ergebnis(ergebnis)
+            return _kopiere_ergebnis(ergebnis)
+
+        ergebnis = self._berechne_scheidungsverfahren(*args)
+        return _summen_aus_ergebnis(ergebnis) if nur_summen else ergebnis
+
+    def _berechne_scheidungsverfahren(
+        self,
+        nettoeinkommen_a: float,
+        nettoeinkommen_b: float,
+        anzahl_versorgungsanrechte: int,
+        mit_zugewinn: bool,
+        zugewinn_betrag: float,
+        mit_unterhalt: bool,
+        unterhalt_monatlich: float
+    ) -> RVGErgebnis:
+        """Berechnung für berechne_scheidungsverfahren (ohne Cache)"""
         positionen = []
         hinweise = []
+        summe_cent = 0
         gesamt_gw = 0.0
 
         # 1. Ehescheidung
@@ -372,43 +634,36 @@ class RVGRechner:
         einfache = self.ermittle_einfache_gebuehr(gesamt_gw)
 
         # Verfahrensgebühr 1,3
-        _, verfahrensgebuehr = self.berechne_gebuehr(gesamt_gw, 1.3)
+        verfahrensgebuehr_cent = _in_cent(einfache * 1.3)
         positionen.append(Gebuehrenposition(
             bezeichnung="Verfahrensgebühr",
-            gebuehrenart=Gebuehrenart.VERFAHRENSGEBUEHR,
+            gebuehrenart=_GA_VERF,
             gegenstandswert=gesamt_gw,
             gebuerensatz=1.3,
             einfache_gebuehr=einfache,
-            gebuehr=verfahrensgebuehr,
+            gebuehr=_aus_cent(verfahrensgebuehr_cent),
             rechtsgrundlage="Nr. 3100 VV RVG"
         ))
+        summe_cent += verfahrensgebuehr_cent
 
         # Terminsgebühr 1,2
-        _, terminsgebuehr = self.berechne_gebuehr(gesamt_gw, 1.2)
+        terminsgebuehr_cent = _in_cent(einfache * 1.2)
         positionen.append(Gebuehrenposition(
             bezeichnung="Terminsgebühr",
-            gebuehrenart=Gebuehrenart.TERMINSGEBUEHR,
+            gebuehrenart=_GA_TERM,
             gegenstandswert=gesamt_gw,
             gebuerensatz=1.2,
             einfache_gebuehr=einfache,
-            gebuehr=terminsgebuehr,
+            gebuehr=_aus_cent(terminsgebuehr_cent),
             rechtsgrundlage="Nr. 3104 VV RVG"
         ))
+        summe_cent += terminsgebuehr_cent
 
-        summe = sum(p.gebuehr for p in positionen)
-        auslagen = self.berechne_auslagenpauschale(summe)
-        netto = summe + auslagen
-        mwst = round(netto * self.mwst_satz, 2)
-        gesamt = netto + mwst
-
-        return RVGErgebnis(
-            gegenstandswert=gesamt_gw,
-            positionen=positionen,
-            summe_gebuehren=summe,
-            auslagenpauschale=auslagen,
-            mehrwertsteuer=mwst,
-            gesamtbetrag=gesamt,
-            hinweise=hinweise,
+        return self._erstelle_ergebnis(
+            gesamt_gw,
+            positionen,
+            hinweise,
+            summe_cent,
             berechnungsdetails={
                 "gw_scheidung": gw_scheidung,
                 "gw_versorgungsausgleich": gw_scheidung * 0.10 * anzahl_versorgungsanrechte
@@ -426,89 +681,105 @@ class RVGRechner:
         Unternehmer: Nach Vereinbarung
         """
         if ist_verbraucher:
-            gebuehr = self.pauschalen["erstberatung_verbraucher"]
+            gebuehr = self._erstberatung
             hinweis = "Erstberatung Verbraucher (§ 34 Abs. 1 S. 3 RVG)"
         else:
-            gebuehr = self.pauschalen["weitere_beratung"]
+            gebuehr = self._weitere_beratung
             hinweis = "Beratung nach Vereinbarung"
 
-        mwst = round(gebuehr * self.mwst_satz, 2)
+        gebuehr_cent = _in_cent(gebuehr)
+        mwst_cent = _runde_cent(gebuehr_cent * self.mwst_satz)
 
         return RVGErgebnis(
             gegenstandswert=0,
             positionen=[Gebuehrenposition(
                 bezeichnung="Erstberatung",
-                gebuehrenart=Gebuehrenart.BERATUNGSGEBUEHR,
+                gebuehrenart=_GA_BER,
                 gegenstandswert=0,
                 gebuerensatz=0,
                 einfache_gebuehr=0,
-                gebuehr=gebuehr,
+                gebuehr=_aus_cent(gebuehr_cent),
                 rechtsgrundlage="§ 34 RVG"
             )],
             summe_gebuehren=gebuehr,
             auslagenpauschale=0,
-            mehrwertsteuer=mwst,
-            gesamtbetrag=gebuehr + mwst,
+            mehrwertsteuer=_aus_cent(mwst_cent),
+            gesamtbetrag=_aus_cent(gebuehr_cent + mwst_cent),
             hinweise=[hinweis]
         )
 
     def formatiere_ergebnis(self, ergebnis: RVGErgebnis) -> str:
         """Formatiert das Ergebnis als lesbaren Text"""
-        lines = [
-            "=" * 65,
-            "RVG-GEBÜHRENBERECHNUNG",
-            "=" * 65,
-            "",
-        ]
+        out = io.StringIO()
+        out.write(_KOPF_VORLAGE)
 
         if ergebnis.gegenstandswert > 0:
-            lines.append(f"Gegenstandswert: {ergebnis.gegenstandswert:>15,.2f} €")
-            lines.append("")
+            out.write(_GEGENSTANDSWERT_VORLAGE.format(ergebnis.gegenstandswert))
 
-        lines.extend([
-            "-" * 65,
-            "GEBÜHRENPOSITIONEN:",
-            "-" * 65,
-        ])
+        out.write(_POSITIONEN_KOPF)
 
         for pos in ergebnis.positionen:
             if pos.gebuerensatz > 0:
-                lines.append(
-                    f"{pos.bezeichnung:30} {pos.gebuerensatz:.1f} × {pos.einfache_gebuehr:>8,.2f}€ "
-                    f"= {pos.gebuehr:>10,.2f} €"
-                )
+                out.write(_POSITION_VORLAGE.format(
+                    pos.bezeichnung, pos.gebuerensatz, pos.einfache_gebuehr, pos.gebuehr
+                ))
             else:
-                lines.append(f"{pos.bezeichnung:30} {pos.gebuehr:>30,.2f} €")
+                out.write(_POSITION_PAUSCHAL_VORLAGE.format(pos.bezeichnung, pos.gebuehr))
             if pos.rechtsgrundlage:
-                lines.append(f"  ({pos.rechtsgrundlage})")
+                out.write(f"\n  ({pos.rechtsgrundlage})")
 
-        lines.extend([
-            "",
-            "-" * 65,
-            f"{'Zwischensumme Gebühren:':45} {ergebnis.summe_gebuehren:>12,.2f} €",
-        ])
+        out.write(_ZWISCHENSUMME_VORLAGE.format(ergebnis.summe_gebuehren))
 
         if ergebnis.auslagenpauschale > 0:
-            lines.append(
-                f"{'Auslagenpauschale (Nr. 7002 VV RVG):':45} {ergebnis.auslagenpauschale:>12,.2f} €"
-            )
+            out.write(_AUSLAGEN_VORLAGE.format(ergebnis.auslagenpauschale))
 
-        lines.extend([
-            f"{'Nettobetrag:':45} {ergebnis.summe_gebuehren + ergebnis.auslagenpauschale:>12,.2f} €",
-            f"{'MwSt. 19%:':45} {ergebnis.mehrwertsteuer:>12,.2f} €",
-            "-" * 65,
-            f"{'GESAMTBETRAG:':45} {ergebnis.gesamtbetrag:>12,.2f} €",
-            "-" * 65,
-        ])
+        out.write(_FUSS_VORLAGE.format(
+            netto=ergebnis.summe_gebuehren + ergebnis.auslagenpauschale,
+            mehrwertsteuer=ergebnis.mehrwertsteuer,
+            gesamtbetrag=ergebnis.gesamtbetrag,
+        ))
 
         if ergebnis.hinweise:
-            lines.extend([
-                "",
-                "HINWEISE:",
-            ])
+            out.write("\n\nHINWEISE:")
             for hinweis in ergebnis.hinweise:
-                lines.append(f"  • {hinweis}")
+                out.write(f"\n  • {hinweis}")
+
+        out.write("\n" + _TRENNER_DOPPELT)
+
+        return out.getvalue()
 
-        lines.append("=" * 65)
 
-        return "\n".join(lines)
+@functools.lru_cache(maxsize=256, typed=True)
+def _scheidung_standardtabelle(mwst_satz: float, *args) -> RVGErgebnis:
+    """
+    Gecachtes Scheidungsverfahren mit der Standardtabelle (nur lesend verwenden)
+
+    typed=True: 3 und 3.0 (bzw. True und 1) erscheinen unterschiedlich in den
+    Hinweisen und dürfen sich daher keinen Cache-Eintrag teilen.
+    """
+    return RVGRechner(mwst_satz=mwst_satz)._berechne_scheidungsverfahren(*args)
+
+
+def _kopiere_ergebnis(ergebnis: RVGErgebnis) -> RVGErgebnis:
+    """Eigenständige Kopie eines Ergebnisses (Positionen und Listen neu)"""
+    return RVGErgebnis(
+        gegenstandswert=ergebnis.gegenstandswert,
+        positionen=[replace(p) for p in ergebnis.positionen],
+        summe_gebuehren=ergebnis.summe_gebuehren,
+        auslagenpauschale=ergebnis.auslagenpauschale,
+        mehrwertsteuer=ergebnis.mehrwertsteuer,
+        gesamtbetrag=ergebnis.gesamtbetrag,
+        hinweise=list(ergebnis.hinweise),
+        berechnungsdetails=dict(ergebnis.berechnungsdetails)
+    )
+
+
+def _summen_aus_ergebnis(ergebnis: RVGErgebnis) -> RVGSummen:
+    """Beträge eines vollständigen Ergebnisses als RVGSummen"""
+    return RVGSummen(
+        summe_gebuehren=ergebnis.summe_gebuehren,
+        auslagenpauschale=ergebnis.auslagenpauschale,
+        nettobetrag=_aus_cent(_in_cent(ergebnis.summe_gebuehren) + _in_cent(ergebnis.auslagenpauschale)),
+        mehrwertsteuer=ergebnis.mehrwertsteuer,
+        gesamtbetrag=ergebnis.gesamtbetrag
+    )
@@ -8,14 +8,52 @@ Implementiert:
 - Ausgleichsanspruch
 """
 
-from dataclasses import dataclass, field
+import json
+import math
+import types
+from dataclasses import dataclass, field, fields, replace
 from datetime import date
-from typing import List, Optional, Dict, Any
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Self, SupportsIndex, cast
+
+import numpy as np
 
 from config.constants import VPI_REFERENZWERTE
 
+from ._jit import njit
+
+try:
+    import msgspec
+except ImportError:  # optional: pip install familykom[json]
+    msgspec = None
+
+
+_TRENNER_DOPPELT = "=" * 70
+_TRENNER_EINFACH = "-" * 70
+
+_wert = attrgetter("wert")
+
+# Obergrenze für den Ergebnis-Cache je Rechner; bei Erreichen wird geleert
+_CACHE_GROESSE = 4096
+
+
+@njit(cache=True)
+def _zugewinn_kernel(endvermoegen, anfangsvermoegen_indexiert, privilegierte_erwerbe):
+    """Zugewinn eines Ehegatten, nach unten auf 0 begrenzt"""
+    zugewinn = endvermoegen - anfangsvermoegen_indexiert - privilegierte_erwerbe
+    return zugewinn if zugewinn > 0.0 else 0.0
+
+
+@njit(cache=True)
+def _ausgleich_kernel(zugewinn_a, zugewinn_b):
+    """Differenz, hälftiger Ausgleich und Richtung (1: A höher, -1: B höher, 0: gleich)"""
+    delta = zugewinn_a - zugewinn_b
+    differenz = abs(delta)
+    richtung = int(delta > 0.0) - int(delta < 0.0)
+    return differenz, differenz * 0.5, richtung
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Vermoegensgegenstand:
     """Datenklasse für einen Vermögensgegenstand"""
     bezeichnung: str
@@ -25,7 +63,7 @@ class Vermoegensgegenstand:
     kommentar: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PrivilegierterErwerb:
     """
     Datenklasse für privilegierte Erwerbe nach § 1374 Abs. 2 BGB
@@ -41,7 +79,87 @@ class PrivilegierterErwerb:
     kommentar: str = ""
 
 
-@dataclass
+class _Positionsliste(List[Any]):
+    """
+    Liste von Vermögenspositionen mit zwischengespeicherter Summe
+
+    Die Summe wird mit math.fsum exakt gerundet gebildet und bis zur
+    nächsten Änderung gehalten; jede verändernde Operation verwirft sie.
+    """
+    __slots__ = ("_summe",)
+
+    def __init__(self, positionen: Iterable[Any] = ()) -> None:
+        super().__init__(positionen)
+        self._summe: Optional[float] = None
+
+    def summe(self) -> float:
+        """Summe der Werte aller Positionen"""
+        if self._summe is None:
+            self._summe = math.fsum(map(_wert, self))
+        return self._summe
+
+    def append(self, position: Any) -> None:
+        self._summe = None
+        list.append(self, position)
+
+    def extend(self, positionen: Iterable[Any]) -> None:
+        self._summe = None
+        list.extend(self, positionen)
+
+    def insert(self, index: SupportsIndex, position: Any) -> None:
+        self._summe = None
+        list.insert(self, index, position)
+
+    def pop(self, index: SupportsIndex = -1) -> Any:
+        self._summe = None
+        return list.pop(self, index)
+
+    def remove(self, position: Any) -> None:
+        self._summe = None
+        list.remove(self, position)
+
+    def clear(self) -> None:
+        self._summe = None
+        list.clear(self)
+
+    def sort(self, *, key: Any = None, reverse: bool = False) -> None:
+        self._summe = None
+        list.sort(self, key=key, reverse=reverse)
+
+    def reverse(self) -> None:
+        self._summe = None
+        list.reverse(self)
+
+    def __setitem__(self, index: Any, wert: Any) -> None:
+        self._summe = None
+        list.__setitem__(self, index, wert)
+
+    def __delitem__(self, index: Any) -> None:
+        self._summe = None
+        list.__delitem__(self, index)
+
+    def __iadd__(self, positionen: Iterable[Any], /) -> Self:  # type: ignore[misc]  # wie list.__iadd__
+        self.extend(positionen)
+        return self
+
+    def __imul__(self, faktor: SupportsIndex) -> Self:
+        self._summe = None
+        return list.__imul__(self, faktor)
+
+    def __reduce__(self) -> tuple[type, tuple[list[Any]]]:
+        # Neuaufbau aus den Positionen; die Summe wird nicht mitgepickelt
+        return (_Positionsliste, (list(self),))
+
+
+def _summe(positionen: List[Any]) -> float:
+    """Zwischengespeicherte Summe einer Positionsliste von EhegattenVermoegen"""
+    return cast(_Positionsliste, positionen).summe()
+
+
+_POSITIONSLISTEN = frozenset({"anfangsvermoegen", "endvermoegen", "privilegierte_erwerbe"})
+
+
+@dataclass(slots=True)
 class EhegattenVermoegen:
     """Vermögenssituation eines Ehegatten"""
     name: str
@@ -57,17 +175,24 @@ class EhegattenVermoegen:
     # Privilegierte Erwerbe (werden dem Anfangsvermögen zugerechnet)
     privilegierte_erwerbe: List[PrivilegierterErwerb] = field(default_factory=list)
 
+    def __setattr__(self, name, wert):
+        # Positionslisten werden als _Positionsliste gehalten, damit die
+        # Summen zwischengespeichert und bei Änderungen verworfen werden
+        if name in _POSITIONSLISTEN and type(wert) is not _Positionsliste:
+            wert = _Positionsliste(wert)
+        object.__setattr__(self, name, wert)
+
     def summe_anfangsvermoegen(self) -> float:
         """Summe des Anfangsvermögens (aktiv)"""
-        return sum(v.wert for v in self.anfangsvermoegen)
+        return _summe(self.anfangsvermoegen)
 
     def summe_endvermoegen(self) -> float:
         """Summe des Endvermögens (aktiv)"""
-        return sum(v.wert for v in self.endvermoegen)
+        return _summe(self.endvermoegen)
 
     def summe_privilegierte_erwerbe(self) -> float:
         """Summe der privilegierten Erwerbe"""
-        return sum(pe.wert for pe in self.privilegierte_erwerbe)
+        return _summe(self.privilegierte_erwerbe)
 
     def netto_anfangsvermoegen(self) -> float:
         """Netto-Anfangsvermögen (Aktiva - Passiva)"""
@@ -78,7 +203,26 @@ class EhegattenVermoegen:
         return self.summe_endvermoegen() - self.endverbindlichkeiten
 
 
-@dataclass
+def _aggregiere(ehegatte: EhegattenVermoegen) -> tuple[float, float, float, float, float]:
+    """
+    Alle Summen eines Ehegatten in einem Durchgang
+
+    Returns:
+        Tuple aus (aktiva_anfang, aktiva_end, privilegierte_erwerbe,
+        netto_anfang, netto_end)
+    """
+    aktiva_anfang = _summe(ehegatte.anfangsvermoegen)
+    aktiva_end = _summe(ehegatte.endvermoegen)
+    return (
+        aktiva_anfang,
+        aktiva_end,
+        _summe(ehegatte.privilegierte_erwerbe),
+        aktiva_anfang - ehegatte.anfangsverbindlichkeiten,
+        aktiva_end - ehegatte.endverbindlichkeiten,
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class ZugewinnErgebnis:
     """Ergebnis der Zugewinnausgleichsberechnung"""
     ehegatte_a: str
@@ -116,6 +260,34 @@ class ZugewinnErgebnis:
     hinweise: List[str] = field(default_factory=list)
     berechnungsdetails: Dict[str, Any] = field(default_factory=dict)
 
+    def to_json(self) -> str:
+        """
+        Konvertiert das Ergebnis in kompaktes JSON (Daten als ISO-Datum)
+
+        Mit installiertem msgspec wird direkt aus den Slots kodiert,
+        andernfalls über json.dumps.
+        """
+        if msgspec is not None:
+            return msgspec.json.encode(self).decode()
+        return json.dumps(
+            {name: getattr(self, name) for name in _ERGEBNIS_FELDER},
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=date.isoformat,
+        )
+
+
+_ERGEBNIS_FELDER = tuple(f.name for f in fields(ZugewinnErgebnis))
+
+
+def _kopiere_ergebnis(ergebnis: ZugewinnErgebnis) -> ZugewinnErgebnis:
+    """Eigenständige Kopie eines Ergebnisses (Listen und Details neu)"""
+    return replace(
+        ergebnis,
+        hinweise=list(ergebnis.hinweise),
+        berechnungsdetails=dict(ergebnis.berechnungsdetails)
+    )
+
 
 class ZugewinnausgleichRechner:
     """
@@ -130,6 +302,34 @@ class ZugewinnausgleichRechner:
     def __init__(self, vpi_tabelle: Dict[int, float] = None):
         self.vpi_tabelle = vpi_tabelle or VPI_REFERENZWERTE
 
+    @property
+    def vpi_tabelle(self) -> Mapping[int, float]:
+        """
+        VPI-Jahreswerte, auf denen die Indexierung beruht
+
+        Schreibgeschützte Kopie der übergebenen Tabelle; Änderungen nur durch
+        Zuweisen einer neuen Tabelle, damit Jahresreihe und Ergebnis-Cache
+        nicht veralten.
+        """
+        return self._vpi_tabelle
+
+    @vpi_tabelle.setter
+    def vpi_tabelle(self, tabelle: Mapping[int, float]) -> None:
+        # Dichte Jahresreihe vom ersten bis zum letzten Tabellenjahr, fehlende
+        # Jahre linear interpoliert. Als Tupel von Python-Floats abgelegt, ist
+        # hole_vpi ein reiner Indexzugriff ohne erneutes Umwandeln je Aufruf;
+        # das Ersetzen der Tabelle baut die Reihe neu auf.
+        jahre = sorted(tabelle)
+        self._vpi_tabelle = types.MappingProxyType(dict(tabelle))
+        self._ergebnis_cache: Dict[tuple, ZugewinnErgebnis] = {}
+        self._vpi_min = jahre[0]
+        self._vpi_max = jahre[-1]
+        self._vpi_jahreswerte = tuple(np.interp(
+            np.arange(self._vpi_min, self._vpi_max + 1),
+            jahre,
+            [tabelle[j] for j in jahre],
+        ).tolist())
+
     def hole_vpi(self, datum: date) -> float:
         """
         Holt den VPI-Wert für ein bestimmtes Datum
@@ -137,29 +337,28 @@ class ZugewinnausgleichRechner:
         Verwendet den Jahreswert. Bei fehlendem Jahr wird interpoliert
         oder der nächstliegende Wert verwendet.
         """
-        jahr = datum.year
+        jahr = min(max(datum.year, self._vpi_min), self._vpi_max)
+        return self._vpi_jahreswerte[jahr - self._vpi_min]
 
-        if jahr in self.vpi_tabelle:
-            return self.vpi_tabelle[jahr]
+    def _vpi_faktor(self, heiratsdatum: date, endstichtag: date) -> tuple[float, float, float]:
+        """
+        VPI-Werte beider Stichtage und der Indexierungsfaktor
 
-        # Interpolation oder nächster Wert
-        jahre = sorted(self.vpi_tabelle.keys())
+        Returns:
+            Tuple aus (vpi_heirat, vpi_end, indexierungsfaktor)
+        """
+        vpi_heirat = self.hole_vpi(heiratsdatum)
 
-        if jahr < jahre[0]:
-            return self.vpi_tabelle[jahre[0]]
+        # Gleiches Jahr: gleicher VPI-Jahreswert, Faktor 1
+        if heiratsdatum.year == endstichtag.year and vpi_heirat != 0:
+            return vpi_heirat, vpi_heirat, 1.0
 
-        if jahr > jahre[-1]:
-            return self.vpi_tabelle[jahre[-1]]
+        vpi_end = self.hole_vpi(endstichtag)
 
-        # Lineare Interpolation
-        for i, j in enumerate(jahre[:-1]):
-            if j < jahr < jahre[i + 1]:
-                vpi_unten = self.vpi_tabelle[j]
-                vpi_oben = self.vpi_tabelle[jahre[i + 1]]
-                anteil = (jahr - j) / (jahre[i + 1] - j)
-                return vpi_unten + (vpi_oben - vpi_unten) * anteil
+        if vpi_heirat == 0:
+            vpi_heirat = 100.0  # Sicherheit
 
-        return 100.0  # Fallback
+        return vpi_heirat, vpi_end, vpi_end / vpi_heirat
 
     def indexiere_anfangsvermoegen(
         self,
@@ -175,16 +374,8 @@ class ZugewinnausgleichRechner:
         Returns:
             Tuple aus (indexiertes_vermoegen, vpi_heirat, vpi_end)
         """
-        vpi_heirat = self.hole_vpi(heiratsdatum)
-        vpi_end = self.hole_vpi(endstichtag)
-
-        if vpi_heirat == 0:
-            vpi_heirat = 100.0  # Sicherheit
-
-        indexierungsfaktor = vpi_end / vpi_heirat
-        indexiert = anfangsvermoegen * indexierungsfaktor
-
-        return indexiert, vpi_heirat, vpi_end
+        vpi_heirat, vpi_end, indexierungsfaktor = self._vpi_faktor(heiratsdatum, endstichtag)
+        return anfangsvermoegen * indexierungsfaktor, vpi_heirat, vpi_end
 
     def berechne_zugewinn(
         self,
@@ -199,31 +390,61 @@ class ZugewinnausgleichRechner:
 
         Der Zugewinn kann nicht negativ sein (§ 1373 BGB).
         """
-        zugewinn = endvermoegen - anfangsvermoegen_indexiert - privilegierte_erwerbe
-        return max(0.0, zugewinn)
+        return _zugewinn_kernel(endvermoegen, anfangsvermoegen_indexiert, privilegierte_erwerbe)
 
     def berechne_ausgleich(
         self,
         zugewinn_a: float,
         zugewinn_b: float
-    ) -> tuple[float, str, str]:
+    ) -> tuple[float, int]:
         """
         Berechnet den Ausgleichsanspruch
 
         Formel: Ausgleich = (Höherer Zugewinn - Niedrigerer Zugewinn) / 2
 
         Returns:
-            Tuple aus (ausgleichsanspruch, name_berechtigt, name_verpflichtet)
+            Tuple aus (ausgleichsanspruch, richtung); richtung 1: A hat den
+            höheren Zugewinn und schuldet den Ausgleich, -1: B schuldet ihn,
+            0: kein Ausgleich
+        """
+        _, ausgleich, richtung = _ausgleich_kernel(zugewinn_a, zugewinn_b)
+        return (ausgleich if richtung else 0.0), richtung
+
+    @classmethod
+    def berechne_batch(
+        cls,
+        endvermoegen_a,
+        endvermoegen_b,
+        anfangsvermoegen_a_indexiert,
+        anfangsvermoegen_b_indexiert,
+        privilegierte_erwerbe_a=0.0,
+        privilegierte_erwerbe_b=0.0
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        differenz = abs(zugewinn_a - zugewinn_b)
-        ausgleich = differenz / 2
+        Zugewinne und Ausgleich für viele Szenarien auf einmal (z.B. Risikoanalyse)
 
-        if zugewinn_a > zugewinn_b:
-            return ausgleich, "Ehegatte B", "Ehegatte A"
-        elif zugewinn_b > zugewinn_a:
-            return ausgleich, "Ehegatte A", "Ehegatte B"
-        else:
-            return 0.0, "", ""
+        Entspricht je Element berechne_zugewinn und berechne_ausgleich. Alle
+        Argumente können Skalare oder gleich lange Arrays sein; es werden nur
+        die Kennzahlen berechnet, ohne Hinweise oder Ergebnisobjekte.
+
+        Returns:
+            Tuple aus Arrays (zugewinn_a, zugewinn_b, ausgleichsanspruch)
+        """
+        zugewinn_a = (
+            np.asarray(endvermoegen_a, dtype=np.float64)
+            - np.asarray(anfangsvermoegen_a_indexiert, dtype=np.float64)
+            - np.asarray(privilegierte_erwerbe_a, dtype=np.float64)
+        )
+        zugewinn_b = (
+            np.asarray(endvermoegen_b, dtype=np.float64)
+            - np.asarray(anfangsvermoegen_b_indexiert, dtype=np.float64)
+            - np.asarray(privilegierte_erwerbe_b, dtype=np.float64)
+        )
+        # Wie _zugewinn_kernel: alles, was nicht > 0 ist, wird 0
+        zugewinn_a = np.where(zugewinn_a > 0.0, zugewinn_a, 0.0)
+        zugewinn_b = np.where(zugewinn_b > 0.0, zugewinn_b, 0.0)
+        ausgleich = np.abs(zugewinn_a - zugewinn_b) / 2
+        return zugewinn_a, zugewinn_b, ausgleich
 
     def berechne(
         self,
@@ -243,27 +464,37 @@ class ZugewinnausgleichRechner:
 
         Returns:
             ZugewinnErgebnis mit vollständiger Berechnung
-        """
-        hinweise = []
 
-        # 1. Anfangsvermögen berechnen
-        anfang_a = ehegatte_a.netto_anfangsvermoegen()
-        anfang_b = ehegatte_b.netto_anfangsvermoegen()
-
-        # 2. Anfangsvermögen indexieren
-        anfang_a_idx, vpi_heirat, vpi_end = self.indexiere_anfangsvermoegen(
-            anfang_a, heiratsdatum, endstichtag
-        )
-        anfang_b_idx, _, _ = self.indexiere_anfangsvermoegen(
-            anfang_b, heiratsdatum, endstichtag
+        Das Ergebnis hängt nur von Namen, Summen, Verbindlichkeiten und
+        Stichtagen ab; wiederholte Eingaben (z.B. beim Neuzeichnen der
+        Oberfläche) werden als Kopie aus dem Cache bedient.
+        """
+        # 1. Summen je Ehegatte (Aktiva, privilegierte Erwerbe, Netto)
+        summen_a = _aggregiere(ehegatte_a)
+        summen_b = _aggregiere(ehegatte_b)
+
+        schluessel = (
+            ehegatte_a.name, summen_a,
+            ehegatte_a.anfangsverbindlichkeiten, ehegatte_a.endverbindlichkeiten,
+            ehegatte_b.name, summen_b,
+            ehegatte_b.anfangsverbindlichkeiten, ehegatte_b.endverbindlichkeiten,
+            heiratsdatum, endstichtag,
         )
+        cache = self._ergebnis_cache
+        ergebnis = cache.get(schluessel)
+        if ergebnis is not None:
+            return _kopiere_ergebnis(ergebnis)
 
-        indexierungsfaktor = vpi_end / vpi_heirat if vpi_heirat > 0 else 1.0
+        hinweise = []
+        aktiva_a, endaktiva_a, priv_a, anfang_a, end_a = summen_a
+        aktiva_b, endaktiva_b, priv_b, anfang_b, end_b = summen_b
 
-        # 3. Privilegierte Erwerbe
-        priv_a = ehegatte_a.summe_privilegierte_erwerbe()
-        priv_b = ehegatte_b.summe_privilegierte_erwerbe()
+        # 2. Anfangsvermögen indexieren (VPI-Werte für beide Ehegatten gleich)
+        vpi_heirat, vpi_end, indexierungsfaktor = self._vpi_faktor(heiratsdatum, endstichtag)
+        anfang_a_idx = anfang_a * indexierungsfaktor
+        anfang_b_idx = anfang_b * indexierungsfaktor
 
+        # 3. Privilegierte Erwerbe
         # Privilegierte Erwerbe auch indexieren (auf jeweiliges Erwerbsdatum)
         # Vereinfachung: Hier werden sie zum Nennwert angesetzt
         if priv_a > 0:
@@ -277,11 +508,7 @@ class ZugewinnausgleichRechner:
                 "(Erbschaften/Schenkungen) werden dem Anfangsvermögen hinzugerechnet."
             )
 
-        # 4. Endvermögen berechnen
-        end_a = ehegatte_a.netto_endvermoegen()
-        end_b = ehegatte_b.netto_endvermoegen()
-
-        # 5. Zugewinn berechnen
+        # 4. Zugewinn berechnen
         zugewinn_a = self.berechne_zugewinn(end_a, anfang_a_idx, priv_a)
         zugewinn_b = self.berechne_zugewinn(end_b, anfang_b_idx, priv_b)
 
@@ -297,36 +524,32 @@ class ZugewinnausgleichRechner:
                 "indexiertes Anfangsvermögen + privilegierte Erwerbe)."
             )
 
-        # 6. Ausgleich berechnen
-        differenz = abs(zugewinn_a - zugewinn_b)
-        ausgleich = differenz / 2
-
-        if zugewinn_a > zugewinn_b:
-            berechtigt = ehegatte_b.name
-            verpflichtet = ehegatte_a.name
-        elif zugewinn_b > zugewinn_a:
-            berechtigt = ehegatte_a.name
-            verpflichtet = ehegatte_b.name
-        else:
-            berechtigt = ""
-            verpflichtet = ""
+        # 5. Ausgleich berechnen
+        differenz, ausgleich, richtung = _ausgleich_kernel(zugewinn_a, zugewinn_b)
+
+        berechtigt, verpflichtet = (
+            (ehegatte_a.name, ehegatte_b.name),
+            ("", ""),
+            (ehegatte_b.name, ehegatte_a.name),
+        )[richtung + 1]
+        if not richtung:
             hinweise.append("Beide Ehegatten haben den gleichen Zugewinn. Kein Ausgleich erforderlich.")
 
-        # 7. Berechnungsdetails
+        # 6. Berechnungsdetails
         berechnungsdetails = {
-            "ehedauer_jahre": (endstichtag - heiratsdatum).days / 365.25,
+            "ehedauer_jahre": (endstichtag.toordinal() - heiratsdatum.toordinal()) / 365.25,
             "inflation_prozent": (indexierungsfaktor - 1) * 100,
-            "aktiva_a": ehegatte_a.summe_anfangsvermoegen(),
-            "aktiva_b": ehegatte_b.summe_anfangsvermoegen(),
+            "aktiva_a": aktiva_a,
+            "aktiva_b": aktiva_b,
             "passiva_a": ehegatte_a.anfangsverbindlichkeiten,
             "passiva_b": ehegatte_b.anfangsverbindlichkeiten,
-            "endaktiva_a": ehegatte_a.summe_endvermoegen(),
-            "endaktiva_b": ehegatte_b.summe_endvermoegen(),
+            "endaktiva_a": endaktiva_a,
+            "endaktiva_b": endaktiva_b,
             "endpassiva_a": ehegatte_a.endverbindlichkeiten,
             "endpassiva_b": ehegatte_b.endverbindlichkeiten,
         }
 
-        return ZugewinnErgebnis(
+        ergebnis = ZugewinnErgebnis(
             ehegatte_a=ehegatte_a.name,
             ehegatte_b=ehegatte_b.name,
             anfangsvermoegen_a=anfang_a,
@@ -352,65 +575,65 @@ class ZugewinnausgleichRechner:
             berechnungsdetails=berechnungsdetails
         )
 
+        if len(cache) >= _CACHE_GROESSE:
+            cache.clear()
+        cache[schluessel] = _kopiere_ergebnis(ergebnis)
+        return ergebnis
+
     def formatiere_ergebnis(self, ergebnis: ZugewinnErgebnis) -> str:
         """Formatiert das Ergebnis als lesbaren Text"""
-        lines = [
-            "=" * 70,
-            "ZUGEWINNAUSGLEICH (§§ 1373 ff. BGB)",
-            "=" * 70,
-            "",
-            f"Heiratsdatum:   {ergebnis.heiratsdatum.strftime('%d.%m.%Y')}",
-            f"Endstichtag:    {ergebnis.endstichtag.strftime('%d.%m.%Y')}",
-            f"Ehedauer:       {ergebnis.berechnungsdetails.get('ehedauer_jahre', 0):.1f} Jahre",
-            "",
-            f"VPI Heirat:     {ergebnis.vpi_heirat:.1f}",
-            f"VPI Endstichtag:{ergebnis.vpi_endstichtag:.1f}",
+        details = ergebnis.berechnungsdetails
+        # Eine zusammenhängende f-Zeichenkette: wird zu einem einzigen
+        # BUILD_STRING übersetzt, ohne Zeilenliste und join
+        text = (
+            f"{_TRENNER_DOPPELT}\n"
+            "ZUGEWINNAUSGLEICH (§§ 1373 ff. BGB)\n"
+            f"{_TRENNER_DOPPELT}\n"
+            "\n"
+            f"Heiratsdatum:   {ergebnis.heiratsdatum:%d.%m.%Y}\n"
+            f"Endstichtag:    {ergebnis.endstichtag:%d.%m.%Y}\n"
+            f"Ehedauer:       {details.get('ehedauer_jahre', 0):.1f} Jahre\n"
+            "\n"
+            f"VPI Heirat:     {ergebnis.vpi_heirat:.1f}\n"
+            f"VPI Endstichtag:{ergebnis.vpi_endstichtag:.1f}\n"
             f"Indexierung:    {ergebnis.indexierungsfaktor:.4f} "
-            f"(+{ergebnis.berechnungsdetails.get('inflation_prozent', 0):.1f}%)",
-            "",
-            "-" * 70,
-            f"{'':30} {ergebnis.ehegatte_a:>18} {ergebnis.ehegatte_b:>18}",
-            "-" * 70,
-            "",
-            "ANFANGSVERMÖGEN:",
+            f"(+{details.get('inflation_prozent', 0):.1f}%)\n"
+            "\n"
+            f"{_TRENNER_EINFACH}\n"
+            f"{'':30} {ergebnis.ehegatte_a:>18} {ergebnis.ehegatte_b:>18}\n"
+            f"{_TRENNER_EINFACH}\n"
+            "\n"
+            "ANFANGSVERMÖGEN:\n"
             f"{'  Netto (Nominalwert):':30} {ergebnis.anfangsvermoegen_a:>15,.2f}€ "
-            f"{ergebnis.anfangsvermoegen_b:>15,.2f}€",
+            f"{ergebnis.anfangsvermoegen_b:>15,.2f}€\n"
             f"{'  Indexiert:':30} {ergebnis.anfangsvermoegen_a_indexiert:>15,.2f}€ "
-            f"{ergebnis.anfangsvermoegen_b_indexiert:>15,.2f}€",
+            f"{ergebnis.anfangsvermoegen_b_indexiert:>15,.2f}€\n"
             f"{'  + Privilegierte Erwerbe:':30} {ergebnis.privilegierte_erwerbe_a:>15,.2f}€ "
-            f"{ergebnis.privilegierte_erwerbe_b:>15,.2f}€",
-            "",
-            "ENDVERMÖGEN:",
+            f"{ergebnis.privilegierte_erwerbe_b:>15,.2f}€\n"
+            "\n"
+            "ENDVERMÖGEN:\n"
             f"{'  Netto:':30} {ergebnis.endvermoegen_a:>15,.2f}€ "
-            f"{ergebnis.endvermoegen_b:>15,.2f}€",
-            "",
-            "-" * 70,
+            f"{ergebnis.endvermoegen_b:>15,.2f}€\n"
+            "\n"
+            f"{_TRENNER_EINFACH}\n"
             f"{'ZUGEWINN:':30} {ergebnis.zugewinn_a:>15,.2f}€ "
-            f"{ergebnis.zugewinn_b:>15,.2f}€",
-            "-" * 70,
-            "",
-            f"Differenz der Zugewinne: {ergebnis.differenz:>15,.2f}€",
-            f"Ausgleichsanspruch (50%): {ergebnis.ausgleichsanspruch:>14,.2f}€",
-            "",
-        ]
+            f"{ergebnis.zugewinn_b:>15,.2f}€\n"
+            f"{_TRENNER_EINFACH}\n"
+            "\n"
+            f"Differenz der Zugewinne: {ergebnis.differenz:>15,.2f}€\n"
+            f"Ausgleichsanspruch (50%): {ergebnis.ausgleichsanspruch:>14,.2f}€\n"
+        )
 
         if ergebnis.ausgleichsberechtigt:
-            lines.extend([
-                "-" * 70,
-                f"ERGEBNIS: {ergebnis.ausgleichsverpflichtet} schuldet",
-                f"          {ergebnis.ausgleichsberechtigt} einen Ausgleich von",
-                f"          {ergebnis.ausgleichsanspruch:,.2f}€",
-                "-" * 70,
-            ])
+            text += (
+                f"\n{_TRENNER_EINFACH}\n"
+                f"ERGEBNIS: {ergebnis.ausgleichsverpflichtet} schuldet\n"
+                f"          {ergebnis.ausgleichsberechtigt} einen Ausgleich von\n"
+                f"          {ergebnis.ausgleichsanspruch:,.2f}€\n"
+                f"{_TRENNER_EINFACH}"
+            )
 
         if ergebnis.hinweise:
-            lines.extend([
-                "",
-                "HINWEISE:",
-            ])
-            for hinweis in ergebnis.hinweise:
-                lines.append(f"  • {hinweis}")
-
-        lines.append("=" * 70)
+            text += "\n\nHINWEISE:\n  • " + "\n  • ".join(ergebnis.hinweise)
 
-        return "\n".join(lines)
+        return f"{text}\n{_TRENNER_DOPPELT}"
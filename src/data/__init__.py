@@ -9,6 +9,8 @@ from .gerichte import (
     AMTSGERICHTE,
     OBERLANDESGERICHTE,
     JUGENDAEMTER,
+    PLZ_TO_AG,
+    AG_TO_JA,
     get_zustaendiges_gericht,
     get_zustaendiges_jugendamt,
     get_alle_amtsgerichte,
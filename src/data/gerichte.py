@@ -7,7 +7,9 @@ Enthaelt:
 - PLZ-Zuordnungen fuer oertliche Zustaendigkeit nach ZPO
 """
 
-from typing import Dict, List, Optional, Tuple
+import functools
+import re
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 # Oberlandesgerichte
 OBERLANDESGERICHTE = {
@@ -321,6 +323,49 @@ JUGENDAEMTER = {
 }
 
 
+# PLZ -> Amtsgericht, einmalig beim Import aufgebaut. Einige PLZ sind mehreren
+# Amtsgerichten zugeordnet (z.B. Pinneberg/Elmshorn/Norderstedt); Vorrang hat
+# das in AMTSGERICHTE zuerst aufgefuehrte Gericht.
+PLZ_TO_AG: Dict[str, str] = {}
+for _ag_id, _ag_data in AMTSGERICHTE.items():
+    for _plz in _ag_data.get("plz_bereiche", ()):
+        PLZ_TO_AG.setdefault(_plz, _ag_id)
+del _ag_id, _ag_data, _plz
+
+# Amtsgericht -> Jugendamt; AG Bad Segeberg ist den Jugendaemtern Segeberg
+# und Stormarn zugeordnet, Vorrang hat das in JUGENDAEMTER zuerst aufgefuehrte.
+AG_TO_JA: Dict[str, str] = {}
+for _ja_id, _ja_data in JUGENDAEMTER.items():
+    for _ag_id in _ja_data.get("zustaendig_fuer", ()):
+        AG_TO_JA.setdefault(_ag_id, _ja_id)
+del _ja_id, _ja_data, _ag_id
+
+# Listenansichten fuer get_alle_*; die Daten sind statisch und werden wie
+# bei get_zustaendiges_gericht als gemeinsame Dicts herausgegeben (nur lesen)
+_ALLE_AMTSGERICHTE = [{"id": ag_id, **ag_data} for ag_id, ag_data in AMTSGERICHTE.items()]
+_ALLE_OBERLANDESGERICHTE = [
+    {"id": olg_id, **olg_data} for olg_id, olg_data in OBERLANDESGERICHTE.items()
+]
+_ALLE_JUGENDAEMTER = [{"id": ja_id, **ja_data} for ja_id, ja_data in JUGENDAEMTER.items()]
+
+# Suchindex fuer suche_gericht: je Gericht die durchsuchten Felder in
+# Kleinschreibung, durch NUL getrennt (damit kein Treffer ueber Feldgrenzen
+# hinweg entsteht), zusammen mit dem fertigen Ergebnis-Dict
+_SUCHINDEX = [
+    (
+        "\0".join((ag_data["name"], ag_data["kurzname"], ag_data["adresse"])).lower(),
+        {"id": ag_id, "typ": "Amtsgericht", **ag_data},
+    )
+    for ag_id, ag_data in AMTSGERICHTE.items()
+] + [
+    (
+        "\0".join((olg_data["name"], olg_data["kurzname"])).lower(),
+        {"id": olg_id, "typ": "Oberlandesgericht", **olg_data},
+    )
+    for olg_id, olg_data in OBERLANDESGERICHTE.items()
+]
+
+
 def get_zustaendiges_gericht(plz: str) -> Optional[Dict]:
     """
     Ermittelt das zustaendige Amtsgericht basierend auf der PLZ.
@@ -334,16 +379,17 @@ def get_zustaendiges_gericht(plz: str) -> Optional[Dict]:
     Returns:
         Dict mit Amtsgericht und OLG oder None
     """
-    for ag_id, ag_data in AMTSGERICHTE.items():
-        if plz in ag_data.get("plz_bereiche", []):
-            olg_id = ag_data.get("olg")
-            olg_data = OBERLANDESGERICHTE.get(olg_id, {})
-            return {
-                "amtsgericht_id": ag_id,
-                "amtsgericht": ag_data,
-                "oberlandesgericht_id": olg_id,
-                "oberlandesgericht": olg_data
-            }
+    ag_id = PLZ_TO_AG.get(plz)
+    if ag_id is not None:
+        ag_data = AMTSGERICHTE[ag_id]
+        olg_id = ag_data.get("olg")
+        olg_data = OBERLANDESGERICHTE.get(olg_id, {})
+        return {
+            "amtsgericht_id": ag_id,
+            "amtsgericht": ag_data,
+            "oberlandesgericht_id": olg_id,
+            "oberlandesgericht": olg_data
+        }
 
     # Fallback: AG Rendsburg (Kanzleistandort)
     return {
@@ -365,61 +411,57 @@ def get_zustaendiges_jugendamt(amtsgericht_id: str) -> Optional[Dict]:
     Returns:
         Dict mit Jugendamt-Daten oder None
     """
-    for ja_id, ja_data in JUGENDAEMTER.items():
-        if amtsgericht_id in ja_data.get("zustaendig_fuer", []):
-            return {
-                "jugendamt_id": ja_id,
-                "jugendamt": ja_data
-            }
-    return None
+    ja_id = AG_TO_JA.get(amtsgericht_id)
+    if ja_id is None:
+        return None
+    return {
+        "jugendamt_id": ja_id,
+        "jugendamt": JUGENDAEMTER[ja_id]
+    }
 
 
 def get_alle_amtsgerichte() -> List[Dict]:
     """Gibt alle Amtsgerichte als Liste zurueck."""
-    return [
-        {"id": ag_id, **ag_data}
-        for ag_id, ag_data in AMTSGERICHTE.items()
-    ]
+    return list(_ALLE_AMTSGERICHTE)
 
 
 def get_alle_oberlandesgerichte() -> List[Dict]:
     """Gibt alle Oberlandesgerichte als Liste zurueck."""
-    return [
-        {"id": olg_id, **olg_data}
-        for olg_id, olg_data in OBERLANDESGERICHTE.items()
-    ]
+    return list(_ALLE_OBERLANDESGERICHTE)
 
 
 def get_alle_jugendaemter() -> List[Dict]:
     """Gibt alle Jugendaemter als Liste zurueck."""
-    return [
-        {"id": ja_id, **ja_data}
-        for ja_id, ja_data in JUGENDAEMTER.items()
-    ]
+    return list(_ALLE_JUGENDAEMTER)
 
 
-def suche_gericht(suchbegriff: str) -> List[Dict]:
+def suche_gericht(suchbegriff: Union[str, Sequence[str]]) -> List[Dict]:
     """
     Sucht nach Gerichten basierend auf Namen oder Ort.
 
+    Bei mehreren Suchbegriffen (Liste) passt ein Gericht, wenn einer der
+    Begriffe vorkommt. Die Begriffe werden zu einem regulaeren Ausdruck
+    zusammengefasst, sodass jedes Gericht in einem Durchgang geprueft wird.
+
     Args:
-        suchbegriff: Suchbegriff
+        suchbegriff: Suchbegriff oder Liste von Suchbegriffen
 
     Returns:
         Liste mit passenden Gerichten
     """
-    suchbegriff_lower = suchbegriff.lower()
-    ergebnisse = []
+    if isinstance(suchbegriff, str):
+        suchbegriff_lower = suchbegriff.lower()
+        return [treffer for suchtext, treffer in _SUCHINDEX if suchbegriff_lower in suchtext]
 
-    for ag_id, ag_data in AMTSGERICHTE.items():
-        if (suchbegriff_lower in ag_data["name"].lower() or
-            suchbegriff_lower in ag_data["kurzname"].lower() or
-            suchbegriff_lower in ag_data["adresse"].lower()):
-            ergebnisse.append({"id": ag_id, "typ": "Amtsgericht", **ag_data})
+    muster = _suchmuster(tuple(suchbegriff))
+    if muster is None:
+        return []
+    return [treffer for suchtext, treffer in _SUCHINDEX if muster.search(suchtext)]
 
-    for olg_id, olg_data in OBERLANDESGERICHTE.items():
-        if (suchbegriff_lower in olg_data["name"].lower() or
-            suchbegriff_lower in olg_data["kurzname"].lower()):
-            ergebnisse.append({"id": olg_id, "typ": "Oberlandesgericht", **olg_data})
 
-    return ergebnisse
+@functools.lru_cache(maxsize=128)
+def _suchmuster(suchbegriffe: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Kompilierter Ausdruck fuer mehrere Suchbegriffe (None ohne Begriffe)"""
+    if not suchbegriffe:
+        return None
+    return re.compile("|".join(re.escape(begriff.lower()) for begriff in suchbegriffe))
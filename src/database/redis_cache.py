@@ -10,7 +10,6 @@ Implementiert Caching-Strategien für:
 """
 
 import json
-from functools import lru_cache
 from typing import Optional, Any, Dict
 from datetime import timedelta
 
@@ -19,13 +18,14 @@ from upstash_redis import Redis
 from config.settings import settings
 
 
-@lru_cache()
-def get_redis_client() -> Optional[Redis]:
-    """
-    Gibt eine gecachte Upstash Redis-Client-Instanz zurück
+# Globale Instanz; None ist ein gültiger Wert (keine Konfiguration),
+# daher ein eigener Marker für "noch nicht erstellt"
+_NICHT_ERSTELLT = object()
+_redis_client = _NICHT_ERSTELLT
 
-    Returns None wenn keine Konfiguration vorhanden ist.
-    """
+
+def _erstelle_redis_client() -> Optional[Redis]:
+    """Erstellt den Upstash Redis-Client aus den Einstellungen"""
     if not settings.upstash_redis_url or not settings.upstash_redis_token:
         return None
 
@@ -35,6 +35,18 @@ def get_redis_client() -> Optional[Redis]:
     )
 
 
+def get_redis_client() -> Optional[Redis]:
+    """
+    Gibt die globale Upstash Redis-Client-Instanz zurück
+
+    Returns None wenn keine Konfiguration vorhanden ist.
+    """
+    global _redis_client
+    if _redis_client is _NICHT_ERSTELLT:
+        _redis_client = _erstelle_redis_client()
+    return _redis_client
+
+
 class CacheService:
     """
     Service für Redis-Caching-Operationen
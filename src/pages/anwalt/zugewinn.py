@@ -16,6 +16,10 @@ from src.calculators.zugewinn import (
     ZugewinnErgebnis,
 )
 
+# Ein Rechner für alle Aufrufe der Seite, damit unveränderte Eingaben bei
+# erneuter Berechnung aus dem Ergebnis-Cache des Rechners bedient werden
+_RECHNER = ZugewinnausgleichRechner()
+
 
 def render_zugewinn_page():
     """Rendert die Zugewinnausgleich-Seite"""
@@ -60,8 +64,7 @@ def render_zugewinn_page():
 
     if st.button("Zugewinnausgleich berechnen", type="primary", use_container_width=True):
         with st.spinner("Berechne..."):
-            rechner = ZugewinnausgleichRechner()
-            ergebnis = rechner.berechne(
+            ergebnis = _RECHNER.berechne(
                 ehegatte_a,
                 ehegatte_b,
                 heiratsdatum,
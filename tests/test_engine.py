@@ -0,0 +1,185 @@
+"""
+Tests für den Rechenkern (src/calculators/engine)
+"""
+
+import dataclasses
+from datetime import date
+
+import pytest
+
+from src.calculators.engine.base import Vermoegen
+from src.calculators.engine.ehegattenunterhalt import (
+    EhegattenunterhaltCalculator,
+    calculate_spousal_support,
+)
+from src.calculators.engine.ruleset import RulesetManager
+from src.calculators.engine.rvg import (
+    RVGCalculator,
+    RVGEingabe,
+    calculate_rvg_fee,
+)
+from src.calculators.engine.zugewinn import calculate_gain_equalization
+
+
+class TestEhegattenunterhaltBatch:
+    """Tests für die Batch-Berechnung des Ehegattenunterhalts"""
+
+    @pytest.mark.parametrize("pflichtiger_erwerbstaetig", [True, False])
+    @pytest.mark.parametrize("berechtigter_erwerbstaetig", [True, False])
+    def test_batch_entspricht_einzelberechnung(
+        self, pflichtiger_erwerbstaetig, berechtigter_erwerbstaetig
+    ):
+        """Batch-Ergebnisse stimmen mit der Einzelberechnung überein"""
+        pflichtig = [1500.0, 2500.0, 3200.0, 4800.0]
+        berechtigt = [0.0, 800.0, 1200.0, 2000.0]
+        kindesunterhalt = [0.0, 300.0, 450.0, 0.0]
+
+        batch = EhegattenunterhaltCalculator().berechne_batch(
+            pflichtig,
+            berechtigt,
+            kindesunterhalt,
+            pflichtiger_erwerbstaetig=pflichtiger_erwerbstaetig,
+            berechtigter_erwerbstaetig=berechtigter_erwerbstaetig,
+        )
+
+        for i, (pf, br, ku) in enumerate(zip(pflichtig, berechtigt, kindesunterhalt)):
+            einzeln = calculate_spousal_support(
+                pf, br, ku,
+                pflichtiger_erwerbstaetig=pflichtiger_erwerbstaetig,
+                berechtigter_erwerbstaetig=berechtigter_erwerbstaetig,
+            ).ergebnis
+            assert batch["bedarf_berechtigter"][i] == einzeln["bedarf_berechtigter"]
+            assert batch["unterhaltsbetrag"][i] == einzeln["unterhaltsbetrag"]
+            assert batch["zahlbetrag"][i] == einzeln["zahlbetrag"]
+
+
+class TestRVGCalculator:
+    """Tests für die RVG-Wertgebühr des Rechenkerns"""
+
+    def setup_method(self):
+        RVGCalculator._wertgebuehr_cent.cache_clear()
+
+    def test_get_wertgebuehr_tabelle(self):
+        """Tabellenwerte und Stufengrenzen"""
+        assert RVGCalculator.get_wertgebuehr(500) == 49
+        assert RVGCalculator.get_wertgebuehr(500.01) == 88
+        assert RVGCalculator.get_wertgebuehr(10000) == 614
+        assert RVGCalculator.get_wertgebuehr(500000) == 3629
+
+    def test_get_wertgebuehr_ueber_tabelle(self):
+        """Fortschreibung über 500.000 EUR (§ 13 Abs. 2 RVG)"""
+        assert RVGCalculator.get_wertgebuehr(600000) == 3629 + 2 * 165
+
+    def test_get_wertgebuehr_cache(self):
+        """Wiederholte Werte werden aus dem Cache bedient"""
+        RVGCalculator.get_wertgebuehr(12345.67)
+        RVGCalculator.get_wertgebuehr(12345.67)
+        info = RVGCalculator._wertgebuehr_cent.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_get_wertgebuehr_batch(self):
+        """Batch-Ergebnisse stimmen mit der Einzelberechnung überein"""
+        werte = [0, 500, 500.01, 10000, 12345.67, 500000, 600000, 1234567.89]
+        batch = RVGCalculator.get_wertgebuehr_batch(werte)
+        assert list(batch) == [RVGCalculator.get_wertgebuehr(w) for w in werte]
+
+    def test_berechne_rundet_erst_bei_der_ausgabe(self):
+        """Die Schritte rechnen ungerundet weiter, gerundet wird nur das Ergebnis"""
+        eingabe = RVGEingabe(gegenstandswert=10000, gebuehrenart="verfahren",
+                             faktor=2.5, mehrere_auftraggeber=2)
+        berechnung = RVGCalculator().berechne(eingabe)
+        gebuehr = 614 * 2.5
+        zwischensumme = gebuehr + gebuehr * 0.3 + 20.0
+        ust = zwischensumme * 0.19
+        assert berechnung.schritte[4].ergebnis == zwischensumme
+        assert berechnung.schritte[5].ergebnis == ust
+        assert berechnung.schritte[6].ergebnis == round(zwischensumme + ust, 2)
+        assert berechnung.ergebnis["zwischensumme"] == round(zwischensumme, 2)
+        assert berechnung.ergebnis["umsatzsteuer"] == round(ust, 2)
+        assert berechnung.ergebnis["gesamt_brutto"] == round(zwischensumme + ust, 2)
+
+    def test_berechne_pipeline_wird_wiederverwendet(self):
+        """Gleiche Parameter teilen die spezialisierte Berechnung, nicht die Schritte"""
+        RVGCalculator._pipeline.cache_clear()
+        erstes = calculate_rvg_fee(10000)
+        zweites = calculate_rvg_fee(20000)
+        assert RVGCalculator._pipeline.cache_info().misses == 1
+        assert erstes.schritte[0] is not zweites.schritte[0]
+        assert erstes.ergebnis["wertgebuehr"] == 614
+        assert zweites.ergebnis["wertgebuehr"] == 822
+
+    def test_berechne_pipeline_unterscheidet_int_und_float(self):
+        """faktor=1 und faktor=1.0 teilen sich keine spezialisierte Berechnung"""
+        RVGCalculator._pipeline.cache_clear()
+        ganzzahl = RVGCalculator().berechne(RVGEingabe(10000, "verfahren", faktor=1))
+        gleitkomma = RVGCalculator().berechne(RVGEingabe(10000, "verfahren", faktor=1.0))
+        assert type(ganzzahl.ergebnis["faktor"]) is int
+        assert type(gleitkomma.ergebnis["faktor"]) is float
+        assert gleitkomma.schritte[1].erlaeuterung == "1.0-fache Gebuehr"
+
+    def test_berechne_schritte_ohne_instanz_dict(self):
+        """Die sieben Berechnungsschritte sind kompakte Slot-Objekte"""
+        ergebnis = calculate_rvg_fee(10000)
+        assert [s.schritt_nr for s in ergebnis.schritte] == list(range(1, 8))
+        assert all(not hasattr(s, "__dict__") for s in ergebnis.schritte)
+
+
+class TestRulesetManager:
+    """Tests für den Ruleset-Manager"""
+
+    def test_get_einkommensgruppe(self):
+        """Zuordnung zu den Einkommensgruppen inkl. Grenzen"""
+        assert RulesetManager.get_einkommensgruppe(0) == 1
+        assert RulesetManager.get_einkommensgruppe(2100) == 1
+        assert RulesetManager.get_einkommensgruppe(2101) == 2
+        assert RulesetManager.get_einkommensgruppe(5000) == 9
+        assert RulesetManager.get_einkommensgruppe(11200) == 15
+        assert RulesetManager.get_einkommensgruppe(20000) == 15
+
+    def test_get_ruleset_ist_unveraenderlich(self):
+        """Das geteilte Regelwerk kann von Aufrufern nicht veraendert werden"""
+        ruleset = RulesetManager.get_ruleset("Schleswig")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ruleset.version = "geaendert"
+        with pytest.raises(TypeError):
+            ruleset.parameter["neu"] = 1
+        assert RulesetManager.get_ruleset("Schleswig") is ruleset
+
+    def test_get_einkommensgruppe_zwischen_grenzen(self):
+        """Cent-Betraege zwischen zwei Gruppen fallen in die hoehere Gruppe"""
+        assert RulesetManager.get_einkommensgruppe(2100.50) == 2
+
+
+class TestZugewinnCalculator:
+    """Tests für die Zugewinn-Berechnung des Rechenkerns"""
+
+    def test_ohne_audit_gleiches_ergebnis(self):
+        """audit=False liefert dasselbe Ergebnis ohne Berechnungsschritte"""
+        args = (date(2015, 6, 1), date(2024, 3, 1), 10000.0, 80000.0, 5000.0, 20000.0)
+        mit_audit = calculate_gain_equalization(*args)
+        ohne_audit = calculate_gain_equalization(*args, audit=False)
+        assert len(mit_audit.schritte) == 6
+        assert ohne_audit.schritte == []
+        assert ohne_audit.ergebnis == mit_audit.ergebnis
+
+    def test_warnung_nur_bei_negativem_endvermoegen(self):
+        """Die Warnung erscheint nur bei negativem Endvermoegen"""
+        args = (date(2015, 6, 1), date(2024, 3, 1), 10000.0)
+        assert calculate_gain_equalization(*args, 80000.0, 0.0, 20000.0).warnungen == []
+        negativ = calculate_gain_equalization(*args, -5000.0, 0.0, 20000.0)
+        assert [w.code for w in negativ.warnungen] == ["NEGATIVES_ENDVERMOEGEN"]
+
+    def test_vermoegen_nettowert(self):
+        """Der Nettowert wird bei der Erzeugung berechnet und bleibt gueltig"""
+        haus = Vermoegen(
+            bezeichnung="Haus",
+            kategorie="immobilie",
+            wert=300000.0,
+            eigentuemer="mandant",
+            stichtag=date(2024, 3, 1),
+            verbindlichkeit=120000.0
+        )
+        assert haus.net == 180000.0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            haus.wert = 0.0
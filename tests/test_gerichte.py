@@ -0,0 +1,103 @@
+"""
+Tests für die Gerichtsdatenbank
+"""
+
+import pytest
+
+from src.data.gerichte import (
+    AMTSGERICHTE,
+    get_alle_amtsgerichte,
+    get_zustaendiges_gericht,
+    get_zustaendiges_jugendamt,
+    suche_gericht,
+)
+
+
+class TestZustaendigesGericht:
+    """Tests für die PLZ-Zuordnung zum Amtsgericht"""
+
+    @pytest.mark.parametrize("plz, erwartet", [
+        ("24768", "ag_rendsburg"),
+        ("24103", "ag_kiel"),
+        ("25813", "ag_husum"),
+    ])
+    def test_direkte_zuordnung(self, plz, erwartet):
+        """PLZ aus genau einem Gerichtsbezirk"""
+        ergebnis = get_zustaendiges_gericht(plz)
+        assert ergebnis["amtsgericht_id"] == erwartet
+        assert ergebnis["oberlandesgericht_id"] == "olg_schleswig"
+        assert "hinweis" not in ergebnis
+
+    def test_mehrfach_zugeordnete_plz(self):
+        """Bei Überschneidungen gewinnt das zuerst aufgeführte Amtsgericht"""
+        for plz in ("25335", "22846", "24211"):
+            erstes = next(
+                ag_id for ag_id, ag in AMTSGERICHTE.items() if plz in ag["plz_bereiche"]
+            )
+            assert get_zustaendiges_gericht(plz)["amtsgericht_id"] == erstes
+
+    @pytest.mark.parametrize("plz", ["20095", "", "2476", "abcde"])
+    def test_fallback_kanzleistandort(self, plz):
+        """Unbekannte PLZ führen zum Vorschlag AG Rendsburg"""
+        ergebnis = get_zustaendiges_gericht(plz)
+        assert ergebnis["amtsgericht_id"] == "ag_rendsburg"
+        assert "hinweis" in ergebnis
+
+
+class TestZustaendigesJugendamt:
+    """Tests für die Zuordnung Amtsgericht -> Jugendamt"""
+
+    def test_zuordnung(self):
+        """Jedes Amtsgericht mit Jugendamt wird gefunden"""
+        assert get_zustaendiges_jugendamt("ag_rendsburg")["jugendamt_id"] == "ja_rendsburg"
+        assert get_zustaendiges_jugendamt("ag_norderstedt")["jugendamt_id"] == "ja_pinneberg"
+
+    def test_mehrfach_zugeordnetes_amtsgericht(self):
+        """AG Bad Segeberg: das zuerst aufgeführte Jugendamt hat Vorrang"""
+        assert get_zustaendiges_jugendamt("ag_bad_segeberg")["jugendamt_id"] == "ja_segeberg"
+
+    def test_unbekanntes_amtsgericht(self):
+        """Ohne Zuordnung gibt es kein Jugendamt"""
+        assert get_zustaendiges_jugendamt("ag_unbekannt") is None
+
+
+class TestListen:
+    """Tests für die Listenansichten"""
+
+    def test_alle_amtsgerichte(self):
+        """Jedes Amtsgericht erscheint einmal mit seiner ID"""
+        liste = get_alle_amtsgerichte()
+        assert [ag["id"] for ag in liste] == list(AMTSGERICHTE)
+        assert liste[0]["name"] == AMTSGERICHTE[liste[0]["id"]]["name"]
+
+    def test_liste_ist_neu(self):
+        """Jeder Aufruf liefert eine eigene Liste"""
+        liste = get_alle_amtsgerichte()
+        liste.clear()
+        assert len(get_alle_amtsgerichte()) == len(AMTSGERICHTE)
+
+
+class TestSucheGericht:
+    """Tests für die Gerichtssuche"""
+
+    def test_suche_ohne_gross_kleinschreibung(self):
+        """Name, Kurzname und Adresse werden unabhängig von der Schreibweise durchsucht"""
+        treffer = suche_gericht("KIEL")
+        assert [t["id"] for t in treffer] == ["ag_kiel"]
+        assert treffer[0]["typ"] == "Amtsgericht"
+        assert [t["id"] for t in suche_gericht("oberlandesgericht")] == ["olg_schleswig"]
+        # Beim OLG wird die Adresse nicht durchsucht
+        assert suche_gericht("gottorf") == []
+
+    def test_kein_treffer_ueber_feldgrenzen(self):
+        """Ein Suchbegriff passt nur innerhalb eines Feldes"""
+        assert suche_gericht("kiel ag kiel") == []
+        assert suche_gericht("kielag") == []
+
+    def test_mehrere_suchbegriffe(self):
+        """Bei einer Liste passt ein Gericht, wenn einer der Begriffe vorkommt"""
+        treffer = [t["id"] for t in suche_gericht(["Husum", "ploen", "a+b"])]
+        assert treffer == ["ag_husum", "ag_ploen"]
+        einzeln = {t["id"] for b in ("husum", "ploen") for t in suche_gericht(b)}
+        assert set(treffer) == einzeln
+        assert suche_gericht([]) == []
@@ -27,6 +27,13 @@ class TestKindesunterhaltRechner:
         assert self.rechner.ermittle_einkommensgruppe(3500) == 5
         assert self.rechner.ermittle_einkommensgruppe(5000) == 9
 
+    def test_ermittle_einkommensgruppe_grenzen(self):
+        """Test Centbeträge zwischen Gruppen und Einkommen über der Tabelle"""
+        assert self.rechner.ermittle_einkommensgruppe(2100.50) == 2
+        assert self.rechner.ermittle_einkommensgruppe(3300.01) == 5
+        assert self.rechner.ermittle_einkommensgruppe(11200) == 15
+        assert self.rechner.ermittle_einkommensgruppe(15000) == 15
+
     def test_passe_gruppe_an(self):
         """Test Gruppenanpassung bei unterschiedlicher Kinderzahl"""
         # 1 Kind: +1 Gruppe
@@ -66,6 +73,12 @@ class TestKindesunterhaltRechner:
         kind = Kind(name="Test", geburtsdatum=date(2010, 1, 1))
         assert kind.altersstufe == 2
 
+    def test_kind_alter_at(self):
+        """Test Alter zu einem Stichtag (Geburtstag noch nicht erreicht)"""
+        kind = Kind(name="Test", geburtsdatum=date(2010, 6, 15))
+        assert kind.alter_at(date(2024, 6, 14)) == 13
+        assert kind.alter_at(date(2024, 6, 15)) == 14
+
     def test_einkommensbereinigung(self):
         """Test Einkommensbereinigung"""
         einkommen = Einkommensbereinigung(
@@ -120,6 +133,60 @@ class TestKindesunterhaltRechner:
         # Verbleibendes Einkommen sollte etwa Selbstbehalt sein
         assert ergebnis.verbleibendes_einkommen <= ergebnis.selbstbehalt + 50
 
+    def test_mangelfall_gleichnamige_kinder(self):
+        """Test Mangelfall-Verteilung je Kind, auch bei gleichen Namen"""
+        einkommen = Einkommensbereinigung(
+            bruttoeinkommen=2000,
+            nettoeinkommen=1600
+        )
+
+        kinder = [
+            Kind(name="Kind", geburtsdatum=date(2021, 1, 1)),  # Altersstufe 0
+            Kind(name="Kind", geburtsdatum=date(2011, 1, 1)),  # Altersstufe 2
+        ]
+
+        ergebnis = self.rechner.berechne(
+            einkommen, kinder, stichtag=date(2025, 6, 1)
+        )
+
+        assert ergebnis.ist_mangelfall
+        juenger, aelter = ergebnis.kinder_ergebnisse
+        # Verteilung im Verhältnis der Bedarfe 354,50 € : 521,50 €
+        assert juenger.zahlbetrag < aelter.zahlbetrag
+        assert juenger.zahlbetrag == pytest.approx(aelter.zahlbetrag * 354.5 / 521.5, abs=0.01)
+
+    def test_volljaehriges_kind_eigenes_einkommen(self):
+        """Eigenes Einkommen Volljähriger wird abzüglich 100€ Freibetrag angerechnet"""
+        einkommen = Einkommensbereinigung(
+            bruttoeinkommen=8000,
+            nettoeinkommen=5000
+        )
+        kinder = [
+            Kind(name="Anna", geburtsdatum=date(2005, 1, 1), eigenes_einkommen=400),
+            Kind(name="Ben", geburtsdatum=date(2004, 1, 1), eigenes_einkommen=5000),
+        ]
+
+        ergebnis = self.rechner.berechne(einkommen, kinder, stichtag=date(2025, 6, 1))
+
+        anna, ben = ergebnis.kinder_ergebnisse
+        assert anna.kindergeldabzug == 255
+        assert anna.zahlbetrag == pytest.approx(anna.tabellenbetrag - 255 - 300)
+        assert ben.zahlbetrag == 0
+
+    def test_tabellenbetraege_batch(self):
+        """Batch-Tabellenbeträge entsprechen Gruppe, Anpassung und Tabellenwert einzeln"""
+        nettos = [0, 2100, 2100.50, 3500, 5000, 11200, 20000, 3000, 3000]
+        berechtigte = [1, 2, 3, 4, 1, 2, 5, 0, -1]
+        stufen = [0, 1, 2, 3, 1, 2, 0, 2, 2]
+
+        batch = self.rechner.hole_tabellenbetraege_batch(nettos, berechtigte, stufen)
+
+        for i, (netto, anzahl, stufe) in enumerate(zip(nettos, berechtigte, stufen)):
+            gruppe = self.rechner.passe_gruppe_an(
+                self.rechner.ermittle_einkommensgruppe(netto), anzahl
+            )
+            assert batch[i] == self.rechner.hole_tabellenbetrag(gruppe, stufe)
+
 
 class TestEinkommensbereinigung:
     """Tests für die Einkommensbereinigung"""
@@ -0,0 +1,125 @@
+"""
+Tests für den RVG-Gebührenrechner
+"""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from src.calculators.rvg import RVGRechner, _gebuehren_kernel, _scheidung_standardtabelle
+
+
+class TestRVGRechner:
+    """Tests für den RVG-Rechner"""
+
+    def setup_method(self):
+        """Setup für jeden Test"""
+        self.rechner = RVGRechner()
+
+    def test_einfache_gebuehr_stufengrenzen(self):
+        """Test Tabellenwerte an und zwischen den Stufengrenzen"""
+        assert self.rechner.ermittle_einfache_gebuehr(0) == 0.0
+        assert self.rechner.ermittle_einfache_gebuehr(1) == 51.50
+        assert self.rechner.ermittle_einfache_gebuehr(500) == 51.50
+        assert self.rechner.ermittle_einfache_gebuehr(500.01) == 93.00
+        assert self.rechner.ermittle_einfache_gebuehr(10000) == 652.00
+        assert self.rechner.ermittle_einfache_gebuehr(500000) == 8028.00
+
+    def test_einfache_gebuehr_ueber_tabelle(self):
+        """Test Fortschreibung über dem höchsten Tabellenwert"""
+        # 100.000€ über 500.000€ = 2 × 50.000€ à 306€
+        assert self.rechner.ermittle_einfache_gebuehr(600000) == pytest.approx(8028.00 + 2 * 306.0)
+
+    def test_gebuehr_cache(self):
+        """Test wiederholte Gegenstandswerte werden aus dem Cache bedient"""
+        erste = self.rechner.berechne_gebuehr(10000, 1.3)
+        assert self.rechner.berechne_gebuehr(10000, 1.3) is erste
+        assert erste == (652.00, 847.60)
+        assert list(self.rechner._einfache_cache) == [10000]
+
+    @pytest.mark.parametrize("satz", [0.65, 1.2, 1.3, 1.5])
+    def test_gebuehr_batch_entspricht_einzelberechnung(self, satz):
+        """Test Batch-Gebühren stimmen mit der Einzelberechnung überein"""
+        werte = [-100, 0, 500, 500.01, 5000, 12345.67, 500000, 750000, 2000000]
+        batch = self.rechner.berechne_gebuehr_batch(werte, satz)
+        assert list(batch) == [self.rechner.berechne_gebuehr(w, satz)[1] for w in werte]
+
+    def test_ergebnis_ohne_instanz_dict(self):
+        """Test Ergebnis und Positionen sind kompakte Slot-Objekte"""
+        ergebnis = self.rechner.berechne_gerichtlich(10000)
+        assert not hasattr(ergebnis, "__dict__")
+        assert all(not hasattr(p, "__dict__") for p in ergebnis.positionen)
+
+    def test_rechnung_kaufmaennisch_gerundet(self):
+        """Test MwSt. wird kaufmännisch gerundet und die Rechnung geht auf"""
+        ergebnis = self.rechner.berechne_gerichtlich(40000)
+        assert ergebnis.summe_gebuehren == 3952.50
+        assert ergebnis.auslagenpauschale == 20.00
+        # 19% von 3.972,50€ = 754,775€ -> 754,78€
+        assert ergebnis.mehrwertsteuer == 754.78
+        assert ergebnis.gesamtbetrag == 4727.28
+        assert ergebnis.gesamtbetrag == (
+            ergebnis.summe_gebuehren + ergebnis.auslagenpauschale + ergebnis.mehrwertsteuer
+        )
+
+    def test_tabelle_wird_geteilt(self):
+        """Test Standardtabelle wird von allen Instanzen geteilt, eigene Tabellen nicht"""
+        assert RVGRechner()._tab_keys is self.rechner._tab_keys
+        eigene = RVGRechner(tabelle=[(1000, 100.0), (2000, 150.0)])
+        assert eigene._tab_keys == (1000, 2000)
+        assert eigene.ermittle_einfache_gebuehr(1500) == 150.0
+
+    def test_gebuehren_kernel_entspricht_batch(self):
+        """Test kompilierbarer Rechenkern liefert dieselben Gebühren wie der NumPy-Pfad"""
+        werte = np.array(
+            [-100, 0, 500, 500.01, 5000, 12345.67, 500000, 750000, 2000000],
+            dtype=np.float64
+        )
+        out = np.empty_like(werte)
+        _gebuehren_kernel(werte, self.rechner._tab_keys_np, self.rechner._tab_vals_np, 1.3, out)
+        assert list(out) == list(self.rechner.berechne_gebuehr_batch(werte, 1.3))
+
+    def test_scheidungsverfahren_cache_liefert_kopien(self):
+        """Test wiederholte Scheidungsberechnungen kommen aus dem Cache, als eigene Objekte"""
+        _scheidung_standardtabelle.cache_clear()
+        erstes = self.rechner.berechne_scheidungsverfahren(3000, 2000)
+        erstes.hinweise.append("geändert")
+        erstes.positionen[0].gebuehr = 0.0
+
+        zweites = RVGRechner().berechne_scheidungsverfahren(3000, 2000)
+        assert _scheidung_standardtabelle.cache_info().hits == 1
+        assert "geändert" not in zweites.hinweise
+        assert zweites.positionen[0].gebuehr > 0
+
+    def test_scheidungsverfahren_hinweise_unabhaengig_vom_cache(self):
+        """Test 3 und 3.0 Anrechte teilen sich keinen Cache-Eintrag"""
+        _scheidung_standardtabelle.cache_clear()
+        kalt = self.rechner.berechne_scheidungsverfahren(3000, 2000, 3.0).hinweise
+        _scheidung_standardtabelle.cache_clear()
+        self.rechner.berechne_scheidungsverfahren(3000, 2000, 3)
+        warm = self.rechner.berechne_scheidungsverfahren(3000, 2000, 3.0).hinweise
+        assert warm == kalt
+
+    @pytest.mark.parametrize("methode, args", [
+        ("berechne_aussergericht", (12000, 1.3, True)),
+        ("berechne_gerichtlich", (40000, True, True)),
+        ("berechne_scheidungsverfahren", (3000, 2000, 2, True, 15000.0)),
+    ])
+    def test_nur_summen(self, methode, args):
+        """Test nur_summen liefert dieselben Beträge wie das vollständige Ergebnis"""
+        ergebnis = getattr(self.rechner, methode)(*args)
+        summen = getattr(self.rechner, methode)(*args, nur_summen=True)
+        assert summen.summe_gebuehren == ergebnis.summe_gebuehren
+        assert summen.auslagenpauschale == ergebnis.auslagenpauschale
+        assert summen.nettobetrag == pytest.approx(
+            ergebnis.summe_gebuehren + ergebnis.auslagenpauschale
+        )
+        assert summen.mehrwertsteuer == ergebnis.mehrwertsteuer
+        assert summen.gesamtbetrag == ergebnis.gesamtbetrag
+
+    def test_ergebnis_unveraenderlich(self):
+        """Test Ergebnisfelder können nach der Berechnung nicht überschrieben werden"""
+        ergebnis = self.rechner.berechne_aussergericht(5000)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ergebnis.gesamtbetrag = 0.0
@@ -0,0 +1,228 @@
+"""
+Tests für die Zugewinnausgleich-Berechnung
+"""
+
+import dataclasses
+import json
+import pickle
+from datetime import date
+
+import pytest
+
+from src.calculators.zugewinn import (
+    EhegattenVermoegen,
+    PrivilegierterErwerb,
+    Vermoegensgegenstand,
+    ZugewinnausgleichRechner,
+)
+
+
+class TestZugewinnausgleichRechner:
+    """Tests für den Zugewinnausgleich-Rechner"""
+
+    def setup_method(self):
+        """Setup für jeden Test"""
+        self.rechner = ZugewinnausgleichRechner()
+
+    def test_hole_vpi_tabellenjahre_und_randwerte(self):
+        """Tabellenjahre exakt, außerhalb der Tabelle der Randwert"""
+        assert self.rechner.hole_vpi(date(2020, 6, 1)) == 100.0
+        assert self.rechner.hole_vpi(date(2024, 1, 1)) == 120.2
+        assert self.rechner.hole_vpi(date(1990, 1, 1)) == 93.0
+        assert self.rechner.hole_vpi(date(2030, 1, 1)) == 122.5
+
+    def test_hole_vpi_interpolation(self):
+        """Fehlende Jahre werden linear interpoliert"""
+        rechner = ZugewinnausgleichRechner({2000: 80.0, 2010: 100.0})
+        assert rechner.hole_vpi(date(2005, 3, 1)) == pytest.approx(90.0)
+        rechner.vpi_tabelle = {2000: 50.0, 2010: 100.0}
+        assert rechner.hole_vpi(date(2005, 3, 1)) == pytest.approx(75.0)
+
+    def test_vpi_tabelle_nur_durch_zuweisung_aenderbar(self):
+        """Die Tabelle ist eine schreibgeschützte Kopie; Änderungen per Zuweisung"""
+        tabelle = {2000: 80.0, 2010: 100.0}
+        rechner = ZugewinnausgleichRechner(tabelle)
+        tabelle[2005] = 0.0
+        assert rechner.hole_vpi(date(2005, 1, 1)) == pytest.approx(90.0)
+        with pytest.raises(TypeError):
+            rechner.vpi_tabelle[2005] = 0.0
+        rechner.vpi_tabelle = {**rechner.vpi_tabelle, 2005: 85.0}
+        assert rechner.hole_vpi(date(2005, 1, 1)) == 85.0
+
+    def test_hole_vpi_liefert_python_float(self):
+        """Die Jahreswerte liegen als fertige Python-Floats vor"""
+        rechner = ZugewinnausgleichRechner({2000: 80, 2010: 100})
+        assert type(rechner.hole_vpi(date(2005, 1, 1))) is float
+        assert type(rechner.hole_vpi(date(2010, 1, 1))) is float
+
+    def test_summen_werden_bei_aenderung_neu_gebildet(self):
+        """Zwischengespeicherte Summen folgen Änderungen der Positionslisten"""
+        stichtag = date(2024, 1, 1)
+        vermoegen = EhegattenVermoegen(
+            name="A",
+            endvermoegen=[Vermoegensgegenstand("Konto", 1000.0, stichtag)],
+        )
+        assert vermoegen.summe_endvermoegen() == 1000.0
+        vermoegen.endvermoegen.append(Vermoegensgegenstand("Depot", 500.0, stichtag))
+        assert vermoegen.summe_endvermoegen() == 1500.0
+        del vermoegen.endvermoegen[0]
+        assert vermoegen.summe_endvermoegen() == 500.0
+        vermoegen.endvermoegen = []
+        assert vermoegen.summe_endvermoegen() == 0.0
+        vermoegen.privilegierte_erwerbe += [
+            PrivilegierterErwerb("Erbe", 2000.0, stichtag, "erbschaft")
+        ]
+        assert vermoegen.summe_privilegierte_erwerbe() == 2000.0
+
+    def test_summe_folgt_allen_listenoperationen(self):
+        """Jede verändernde Listenoperation verwirft die zwischengespeicherte Summe"""
+        stichtag = date(2024, 1, 1)
+        vermoegen = EhegattenVermoegen(name="A")
+        positionen = vermoegen.anfangsvermoegen
+        assert vermoegen.summe_anfangsvermoegen() == 0.0
+        for i in range(1, 6):
+            positionen.append(Vermoegensgegenstand(f"P{i}", float(i), stichtag))
+        positionen.extend(Vermoegensgegenstand(f"Q{i}", 10.0, stichtag) for i in range(2))
+        assert vermoegen.summe_anfangsvermoegen() == 35.0
+        positionen[0] = Vermoegensgegenstand("P0", 100.0, stichtag)
+        positionen.pop()
+        assert vermoegen.summe_anfangsvermoegen() == 124.0
+        positionen.insert(0, Vermoegensgegenstand("R", 1.0, stichtag))
+        positionen *= 2
+        assert vermoegen.summe_anfangsvermoegen() == 250.0
+        positionen.clear()
+        assert vermoegen.summe_anfangsvermoegen() == 0.0
+
+    def test_vermoegen_pickle_round_trip(self):
+        """Vermögen mit Positionen lässt sich pickeln und summiert danach weiter"""
+        stichtag = date(2000, 1, 1)
+        vermoegen = EhegattenVermoegen(
+            name="A",
+            anfangsvermoegen=[Vermoegensgegenstand("Konto", 1.0, stichtag)],
+        )
+        vermoegen.summe_anfangsvermoegen()
+        kopie = pickle.loads(pickle.dumps(vermoegen))
+        assert kopie.anfangsvermoegen == vermoegen.anfangsvermoegen
+        assert kopie.summe_anfangsvermoegen() == 1.0
+        kopie.anfangsvermoegen.append(Vermoegensgegenstand("Depot", 2.0, stichtag))
+        assert kopie.summe_anfangsvermoegen() == 3.0
+
+    def test_berechne_summen_und_details(self):
+        """Aktiva, Netto und Details stammen aus derselben Summierung"""
+        stichtag = date(2024, 1, 1)
+        a = EhegattenVermoegen(
+            name="A",
+            anfangsvermoegen=[Vermoegensgegenstand("Konto", 20000.0, stichtag)],
+            anfangsverbindlichkeiten=5000.0,
+            endvermoegen=[Vermoegensgegenstand("Haus", 250000.0, stichtag)],
+            endverbindlichkeiten=50000.0,
+        )
+        b = EhegattenVermoegen(
+            name="B",
+            endvermoegen=[Vermoegensgegenstand("Konto", 30000.0, stichtag)],
+            privilegierte_erwerbe=[PrivilegierterErwerb("Erbe", 10000.0, stichtag, "erbschaft")],
+        )
+        ergebnis = self.rechner.berechne(a, b, date(2020, 5, 1), date(2024, 3, 1))
+        assert ergebnis.anfangsvermoegen_a == 15000.0
+        assert ergebnis.anfangsvermoegen_a_indexiert == pytest.approx(18030.0)
+        assert ergebnis.endvermoegen_a == 200000.0
+        assert ergebnis.zugewinn_a == pytest.approx(181970.0)
+        assert ergebnis.zugewinn_b == 20000.0
+        assert ergebnis.ausgleichsanspruch == pytest.approx(80985.0)
+        assert ergebnis.ausgleichsberechtigt == "B"
+        assert ergebnis.berechnungsdetails["aktiva_a"] == 20000.0
+        assert ergebnis.berechnungsdetails["endaktiva_b"] == 30000.0
+
+    def test_berechne_zugewinn_nie_negativ(self):
+        """Der Zugewinn ist nach § 1373 BGB mindestens 0"""
+        assert self.rechner.berechne_zugewinn(100000.0, 40000.0, 10000.0) == 50000.0
+        assert self.rechner.berechne_zugewinn(30000.0, 40000.0, 0.0) == 0.0
+
+    @pytest.mark.parametrize("zugewinn_a, zugewinn_b, erwartet", [
+        (50000.0, 10000.0, (20000.0, 1)),
+        (10000.0, 50000.0, (20000.0, -1)),
+        (25000.0, 25000.0, (0.0, 0)),
+    ])
+    def test_berechne_ausgleich(self, zugewinn_a, zugewinn_b, erwartet):
+        """Ausgleich und Richtung des Anspruchs"""
+        assert self.rechner.berechne_ausgleich(zugewinn_a, zugewinn_b) == erwartet
+
+    def test_berechne_batch_entspricht_einzelberechnung(self):
+        """Batch-Ergebnisse stimmen mit der Einzelberechnung überein"""
+        end_a = [200000.0, 30000.0, 80000.0, 50000.0]
+        end_b = [30000.0, 120000.0, 80000.0, 10000.0]
+        anfang_a = [18030.0, 40000.0, 0.0, 60000.0]
+        anfang_b = [0.0, 5000.0, 0.0, 20000.0]
+        priv_b = [10000.0, 0.0, 0.0, 0.0]
+
+        za, zb, ausgleich = ZugewinnausgleichRechner.berechne_batch(
+            end_a, end_b, anfang_a, anfang_b, privilegierte_erwerbe_b=priv_b
+        )
+
+        for i in range(len(end_a)):
+            einzel_a = self.rechner.berechne_zugewinn(end_a[i], anfang_a[i], 0.0)
+            einzel_b = self.rechner.berechne_zugewinn(end_b[i], anfang_b[i], priv_b[i])
+            assert za[i] == einzel_a
+            assert zb[i] == einzel_b
+            assert ausgleich[i] == self.rechner.berechne_ausgleich(einzel_a, einzel_b)[0]
+
+    def test_datenklassen_mit_slots(self):
+        """Ergebnis und Positionen sind unveränderliche Slot-Objekte"""
+        stichtag = date(2024, 1, 1)
+        position = Vermoegensgegenstand("Konto", 1000.0, stichtag)
+        ergebnis = self.rechner.berechne(
+            EhegattenVermoegen(name="A", endvermoegen=[position]),
+            EhegattenVermoegen(name="B"),
+            date(2020, 1, 1), stichtag
+        )
+        assert not hasattr(position, "__dict__")
+        assert not hasattr(ergebnis, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            position.wert = 0.0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ergebnis.ausgleichsanspruch = 0.0
+
+    def test_indexierung_im_selben_jahr(self):
+        """Heirat und Stichtag im selben Jahr: keine Indexierung"""
+        indexiert, vpi_heirat, vpi_end = self.rechner.indexiere_anfangsvermoegen(
+            12345.67, date(2022, 2, 1), date(2022, 11, 30)
+        )
+        assert indexiert == 12345.67
+        assert vpi_heirat == vpi_end == 110.4
+
+    def test_to_json(self):
+        """Das Ergebnis lässt sich als JSON speichern"""
+        ergebnis = self.rechner.berechne(
+            EhegattenVermoegen(name="A", endvermoegen=[
+                Vermoegensgegenstand("Konto", 50000.0, date(2024, 1, 1))
+            ]),
+            EhegattenVermoegen(name="B"),
+            date(2020, 1, 1), date(2024, 3, 1)
+        )
+        daten = json.loads(ergebnis.to_json())
+        assert list(daten) == [f.name for f in dataclasses.fields(ergebnis)]
+        assert daten["heiratsdatum"] == "2020-01-01"
+        assert daten["ausgleichsanspruch"] == 25000.0
+        assert daten["berechnungsdetails"]["endaktiva_a"] == 50000.0
+
+    def test_berechne_cache_liefert_kopien(self):
+        """Wiederholte Eingaben kommen als unabhängige Kopie aus dem Cache"""
+        def ehegatte(name, endwert):
+            return EhegattenVermoegen(name=name, endvermoegen=[
+                Vermoegensgegenstand("Konto", endwert, date(2024, 1, 1))
+            ])
+
+        stichtage = (date(2020, 1, 1), date(2020, 6, 1))
+        erstes = self.rechner.berechne(ehegatte("A", 1000.0), ehegatte("B", 1000.0), *stichtage)
+        erstes.hinweise.append("geändert")
+        zweites = self.rechner.berechne(ehegatte("A", 1000.0), ehegatte("B", 1000.0), *stichtage)
+
+        assert len(self.rechner._ergebnis_cache) == 1
+        assert zweites == dataclasses.replace(erstes, hinweise=erstes.hinweise[:-1])
+        assert zweites.hinweise is not erstes.hinweise
+
+        anders = self.rechner.berechne(ehegatte("A", 2000.0), ehegatte("B", 1000.0), *stichtage)
+        assert anders.ausgleichsanspruch == 500.0
+
+        self.rechner.vpi_tabelle = {2020: 100.0}
+        assert self.rechner._ergebnis_cache == {}